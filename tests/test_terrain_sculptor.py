@@ -0,0 +1,247 @@
+"""
+Tests for world_builder.terrain_sculptor.
+
+Tests:
+  Area IDs: stamp_area_ids() dict and array forms
+  Export:   export_for_adt_composer() heightmap and area_id_map formats,
+            tile default area ID
+
+Runs standalone; zone definitions are built in memory.
+"""
+
+import os
+import sys
+import traceback
+
+# Ensure the project root is on the path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import numpy as np
+
+from world_builder.adt_composer import _compute_chunk_heights
+from world_builder.terrain_sculptor import (
+    TerrainSculptor,
+    area_ids_to_dict,
+    stamp_area_ids,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+_PASSED = 0
+_FAILED = 0
+_ERRORS = []
+
+
+def _test(name, fn):
+    """Run a test function, track pass/fail."""
+    global _PASSED, _FAILED
+    try:
+        fn()
+        _PASSED += 1
+        print("  PASS  {}".format(name))
+    except Exception as e:
+        _FAILED += 1
+        _ERRORS.append((name, e))
+        print("  FAIL  {} -- {}".format(name, e))
+        traceback.print_exc()
+
+
+def _area_zone():
+    """Two-tile zone: a wide area with a smaller one nested inside it."""
+    return {
+        'name': 'AreaTest',
+        'grid_size': (2, 1),
+        'base_coords': (30, 31),
+        'subzones': [
+            {'name': 'outer', 'area_id': 10, 'center': (0.5, 0.5),
+             'radius': 0.6},
+            {'name': 'inner', 'area_id': 20, 'center': (0.25, 0.5),
+             'radius': 0.1},
+        ],
+    }
+
+
+_EXPORT_SCULPTOR = None
+
+
+def _export_sculptor():
+    """
+    One-tile sculptor shared by the export tests; its generation results
+    are cached, so each export only reformats them.
+    """
+    global _EXPORT_SCULPTOR
+    if _EXPORT_SCULPTOR is None:
+        _EXPORT_SCULPTOR = TerrainSculptor({
+            'name': 'ExportTest',
+            'grid_size': (1, 1),
+            'base_coords': (32, 32),
+            'seed': 3,
+            'subzones': [
+                {'name': 'hill', 'area_id': 5, 'center': (0.5, 0.5),
+                 'radius': 0.4, 'terrain_type': 'island',
+                 'elevation': (0, 40), 'textures': ['Tileset\\grass.blp']},
+            ],
+        })
+    return _EXPORT_SCULPTOR
+
+
+# ---------------------------------------------------------------------------
+# Area ID Tests
+# ---------------------------------------------------------------------------
+
+def test_stamp_area_ids_dict():
+    """The default return is the keyed dict."""
+    area_ids = stamp_area_ids(_area_zone())
+
+    assert isinstance(area_ids, dict), type(area_ids)
+    assert len(area_ids) == 2 * 256, len(area_ids)
+    # Centre of the first tile lies in the nested area, the far corner of
+    # the second tile in neither
+    assert area_ids[(30, 31, 8, 8)] == 20
+    assert area_ids[(31, 31, 8, 8)] == 10
+    assert area_ids[(31, 31, 0, 15)] == 0
+    assert all(isinstance(v, int) for v in area_ids.values())
+
+
+def test_stamp_area_ids_array():
+    """as_array returns the dense array, matching the dict form."""
+    zone = _area_zone()
+    area_ids = stamp_area_ids(zone, as_array=True)
+
+    assert isinstance(area_ids, np.ndarray), type(area_ids)
+    assert area_ids.shape == (1, 2, 16, 16), area_ids.shape
+    assert area_ids.dtype == np.int32, area_ids.dtype
+    assert area_ids[0, 0, 8, 8] == 20
+    assert area_ids_to_dict(area_ids, zone['base_coords']) == \
+        stamp_area_ids(zone)
+
+
+def test_generate_area_ids_forms():
+    """TerrainSculptor.generate_area_ids() mirrors stamp_area_ids()."""
+    zone = _area_zone()
+    sculptor = TerrainSculptor(zone)
+
+    assert sculptor.generate_area_ids() == stamp_area_ids(zone)
+    assert np.array_equal(sculptor.generate_area_ids(as_array=True),
+                          stamp_area_ids(zone, as_array=True))
+
+
+# ---------------------------------------------------------------------------
+# Export Tests
+# ---------------------------------------------------------------------------
+
+def test_export_heightmap_formats():
+    """'list' (the default) and 'ndarray' hold the same heights."""
+    sculptor = _export_sculptor()
+    as_list = sculptor.export_for_adt_composer()[(32, 32)]['heightmap']
+    as_array = sculptor.export_for_adt_composer(
+        heightmap_format='ndarray')[(32, 32)]['heightmap']
+
+    assert isinstance(as_list, list), type(as_list)
+    assert isinstance(as_array, np.ndarray), type(as_array)
+    assert as_array.shape == (129, 129), as_array.shape
+    assert as_array.tolist() == as_list
+
+    # adt_composer samples both to the same MCVT heights
+    for chunk_row, chunk_col in ((0, 0), (7, 9), (15, 15)):
+        from_list = _compute_chunk_heights(as_list, chunk_row, chunk_col)
+        from_array = _compute_chunk_heights(as_array, chunk_row, chunk_col)
+        assert [float(h) for h in from_array] == from_list
+
+
+def test_export_area_id_map_formats():
+    """area_id_map follows heightmap_format: dict for 'list', else array."""
+    sculptor = _export_sculptor()
+    as_dict = sculptor.export_for_adt_composer()[(32, 32)]['area_id_map']
+    as_array = sculptor.export_for_adt_composer(
+        heightmap_format='ndarray')[(32, 32)]['area_id_map']
+
+    assert isinstance(as_dict, dict), type(as_dict)
+    assert len(as_dict) == 256, len(as_dict)
+    assert isinstance(as_array, np.ndarray), type(as_array)
+    assert as_array.shape == (16, 16), as_array.shape
+    assert as_dict == {(r, c): int(as_array[r, c])
+                       for r in range(16) for c in range(16)}
+    assert as_dict[(8, 8)] == 5
+    assert as_dict[(0, 0)] == 0
+
+    # Both are per-export copies, not views of the sculptor's cache
+    as_array[:] = -1
+    assert sculptor.generate_area_ids()[(32, 32, 8, 8)] == 5
+
+
+def test_export_negative_area_id():
+    """A negative area ID can still be the tile's default area."""
+    sculptor = TerrainSculptor({
+        'name': 'NegativeAreaTest',
+        'grid_size': (1, 1),
+        'base_coords': (32, 32),
+        'seed': 3,
+        'subzones': [
+            {'name': 'wide', 'area_id': -5, 'center': (0.5, 0.5),
+             'radius': 0.6, 'terrain_type': 'island',
+             'elevation': (0, 40), 'textures': ['Tileset\\grass.blp']},
+        ],
+    })
+    tile = sculptor.export_for_adt_composer()[(32, 32)]
+
+    # Counted as before: most common value, first seen wins ties
+    counts = {}
+    for aid in tile['area_id_map'].values():
+        counts[aid] = counts.get(aid, 0) + 1
+    assert -5 in counts, counts
+    assert tile['area_id'] == max(counts, key=counts.get) == -5, \
+        tile['area_id']
+
+
+def test_export_heightmap_format_invalid():
+    """Unknown heightmap formats are rejected."""
+    try:
+        _export_sculptor().export_for_adt_composer(heightmap_format='dict')
+    except ValueError:
+        return
+    raise AssertionError("heightmap_format='dict' was accepted")
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    print("=" * 70)
+    print("world_builder terrain sculptor tests")
+    print("=" * 70)
+
+    # --- Area ID Tests ---
+    print("\n--- Area IDs ---")
+    _test("stamp_area_ids_dict", test_stamp_area_ids_dict)
+    _test("stamp_area_ids_array", test_stamp_area_ids_array)
+    _test("generate_area_ids_forms", test_generate_area_ids_forms)
+
+    # --- Export Tests ---
+    print("\n--- Export ---")
+    _test("export_heightmap_formats", test_export_heightmap_formats)
+    _test("export_area_id_map_formats", test_export_area_id_map_formats)
+    _test("export_negative_area_id", test_export_negative_area_id)
+    _test("export_heightmap_format_invalid",
+          test_export_heightmap_format_invalid)
+
+    # --- Summary ---
+    print("\n" + "=" * 70)
+    print("Results: {} passed, {} failed".format(_PASSED, _FAILED))
+
+    if _ERRORS:
+        print("\nFailures:")
+        for name, err in _ERRORS:
+            print("  {} -- {}".format(name, err))
+
+    print("=" * 70)
+    return 0 if _FAILED == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,370 @@
+"""
+Tests for the QA validators in world_builder.validators.
+
+Tests:
+  ADT:         MCVT height range (out-of-range and non-finite heights)
+  DBC:         Map, AreaTable and WorldMapArea summaries and per-record
+               failures
+  Cross-layer: SQL INSERT parsing (quoting, multi-row VALUES,
+               schema-qualified names, comments)
+
+Runs standalone; every input is generated in memory or in a temporary
+directory.
+"""
+
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import traceback
+
+# Ensure the project root is on the path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from world_builder.adt_composer import create_adt
+from world_builder.validators.adt_validator import validate_adt_files
+from world_builder.validators.cross_validator import (
+    _extract_sql_areatrigger_maps,
+    _extract_sql_map_ids,
+    _parse_inserts,
+)
+from world_builder.validators.dbc_validator import (
+    _DBCReader,
+    _validate_area_dbc,
+    _validate_map_dbc,
+    _validate_worldmaparea_dbc,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+_PASSED = 0
+_FAILED = 0
+_ERRORS = []
+
+
+def _test(name, fn):
+    """Run a test function, track pass/fail."""
+    global _PASSED, _FAILED
+    try:
+        fn()
+        _PASSED += 1
+        print("  PASS  {}".format(name))
+    except Exception as e:
+        _FAILED += 1
+        _ERRORS.append((name, e))
+        print("  FAIL  {} -- {}".format(name, e))
+        traceback.print_exc()
+
+
+def _validate_adt_with_height(height):
+    """
+    Validate a flat ADT whose first MCVT height is replaced by height.
+
+    Returns the ADT-HM-002 result.
+    """
+    data = bytearray(create_adt(32, 32))
+    mcvt = data.find(b'TVCM')
+    struct.pack_into('<f', data, mcvt + 8, height)
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        map_dir = os.path.join(tmp_dir, "World", "Maps", "Test")
+        os.makedirs(map_dir)
+        with open(os.path.join(map_dir, "Test_32_32.adt"), 'wb') as f:
+            f.write(data)
+        results = validate_adt_files(tmp_dir)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    matches = [r for r in results if r.check_id == 'ADT-HM-002']
+    assert len(matches) == 1, matches
+    return matches[0]
+
+
+def _validate_dbc(field_count, records, validate, strings=b'\x00'):
+    """
+    Write a WDBC file and run a field validator on it.
+
+    Args:
+        field_count: Fields per record.
+        records: One {field_index: value} dict per record; other fields
+            are 0.  Floats are packed as float32, negative ints as int32.
+        validate: Called with the open _DBCReader; its return value is
+            returned.
+        strings: String block.
+    """
+    data = bytearray(struct.pack('<4s4I', b'WDBC', len(records),
+                                 field_count, field_count * 4, len(strings)))
+    for fields in records:
+        record = bytearray(field_count * 4)
+        for index, value in fields.items():
+            if isinstance(value, float):
+                fmt = '<f'
+            elif value < 0:
+                fmt = '<i'
+            else:
+                fmt = '<I'
+            struct.pack_into(fmt, record, index * 4, value)
+        data += record
+    data += strings
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp_dir, "Test.dbc")
+        with open(path, 'wb') as f:
+            f.write(data)
+        reader = _DBCReader(path)
+        try:
+            assert reader.valid, reader.error
+            return validate(reader)
+        finally:
+            reader.close()
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def _summarize(results):
+    """(check_id, passed, message) for each result, in order."""
+    return [(r.check_id, r.passed, r.message) for r in results]
+
+
+# ---------------------------------------------------------------------------
+# ADT Tests: heightmap range
+# ---------------------------------------------------------------------------
+
+def test_adt_height_in_range():
+    """Heights within +/-2048 pass."""
+    result = _validate_adt_with_height(2000.0)
+    assert result.passed, result.message
+
+
+def test_adt_height_out_of_range():
+    """A height beyond +/-2048 fails its MCNK."""
+    result = _validate_adt_with_height(-3000.0)
+    assert not result.passed
+    assert result.message == \
+        "ADT Test_32_32 1 MCNKs have heights outside +/-2048 yards", \
+        result.message
+
+
+def test_adt_height_nan():
+    """NaN heights fail rather than slipping past the range compare."""
+    result = _validate_adt_with_height(float('nan'))
+    assert not result.passed
+    assert "1 MCNKs have heights outside" in result.message, result.message
+
+
+def test_adt_height_inf():
+    """Infinite heights fail."""
+    result = _validate_adt_with_height(float('inf'))
+    assert not result.passed
+    assert "1 MCNKs have heights outside" in result.message, result.message
+
+
+# ---------------------------------------------------------------------------
+# DBC Tests: field validation
+# ---------------------------------------------------------------------------
+
+def test_dbc_map_fields():
+    """Map.dbc failures come per record, then one summary per check."""
+    # Directory (1) is a string offset, InstanceType (2), LoadingScreen
+    # (57), MinimapIconScale (58)
+    strings = b'\x00Alpha\x00Beta\x00Missing\x00'
+    records = [
+        {0: 1, 1: 1, 2: 0, 57: 5, 58: 1.0},
+        {0: 2, 1: 7, 2: 7, 58: 1.0},
+        {0: 3, 1: 12, 2: 1, 58: 0.0},
+    ]
+    map_dirs = [('Alpha', 'World/Maps/Alpha'), ('Beta', 'World/Maps/Beta')]
+    results = _validate_dbc(
+        66, records, lambda reader: _validate_map_dbc(reader, map_dirs),
+        strings)
+
+    assert _summarize(results) == [
+        ('DBC-MAP-002', False, "Map 2 InstanceType 7 is invalid"),
+        ('DBC-MAP-001', False,
+         "Map 3 directory 'Missing' does not match any WDT folder"),
+        ('DBC-MAP-004', False, "Map 3 MinimapIconScale is 0 or negative"),
+        ('DBC-MAP-001', True,
+         "Map directory matches WDT folder for 2 entries"),
+        ('DBC-MAP-002', True, "Map InstanceType valid for 2 entries"),
+        ('DBC-MAP-003', True,
+         "Map LoadingScreen set for 1 entries, ID=0 for 2"),
+        ('DBC-MAP-004', True, "Map MinimapIconScale valid for 2 entries"),
+    ], _summarize(results)
+
+
+def test_dbc_area_fields():
+    """AreaTable.dbc failures come per record, then the summaries."""
+    # ContinentID (1), ParentAreaID (2), ExplorationLevel (10),
+    # FactionGroupMask (28)
+    records = [
+        {0: 10, 1: 1, 2: 0, 10: 5, 28: 0},
+        {0: 11, 1: 2, 2: 10, 10: 20, 28: 2},
+        {0: 12, 1: 9, 2: 99, 10: 30, 28: 1},
+    ]
+    results = _validate_dbc(
+        36, records, lambda reader: _validate_area_dbc(reader, {1, 2}))
+
+    assert _summarize(results) == [
+        ('DBC-AREA-001', False,
+         "Area 12 ContinentID 9 does not reference valid Map.dbc entry"),
+        ('DBC-AREA-002', False,
+         "Area 12 ParentAreaID 99 references non-existent area"),
+        ('DBC-AREA-004', False, "Area 12 FactionGroupMask=1 may be invalid"),
+        ('DBC-AREA-001', True,
+         "Area ContinentID references valid map for 2 entries"),
+        ('DBC-AREA-002', True,
+         "Area ParentAreaID valid for 2 entries (1 top-level zones)"),
+        ('DBC-AREA-003', True, "Area ExplorationLevel 5-30 across 3 entries"),
+        ('DBC-AREA-004', True, "Area FactionGroupMask valid for 2 entries"),
+    ], _summarize(results)
+
+
+def test_dbc_worldmaparea_fields():
+    """WorldMapArea.dbc failures come per record, then the summaries."""
+    # MapID (1), AreaID (2), LocLeft/Right/Top/Bottom (4-7),
+    # DisplayMapID (8)
+    records = [
+        {0: 1, 1: 1, 2: 10, 4: 0.0, 5: 100.0, 6: 0.0, 7: 100.0, 8: -1},
+        {0: 2, 1: 5, 2: 0, 4: 100.0, 5: 0.0, 8: 7},
+        {0: 3, 1: 1, 2: 42, 8: 1},
+    ]
+    results = _validate_dbc(
+        11, records,
+        lambda reader: _validate_worldmaparea_dbc(reader, {1}, {10, 11}))
+
+    assert _summarize(results) == [
+        ('DBC-WMA-001', False, "WorldMapArea 2 MapID 5 not found in Map.dbc"),
+        ('DBC-WMA-003', False,
+         "WorldMapArea 2 coordinates are inverted "
+         "(L=100.0, R=0.0, T=0.0, B=0.0)"),
+        ('DBC-WMA-004', False,
+         "WorldMapArea 2 DisplayMapID=7 not found in Map.dbc"),
+        ('DBC-WMA-002', False,
+         "WorldMapArea 3 AreaID 42 not found in AreaTable.dbc"),
+        ('DBC-WMA-001', True, "WorldMapArea MapID valid for 2 entries"),
+        ('DBC-WMA-002', True, "WorldMapArea AreaID valid for 1 entries"),
+        ('DBC-WMA-003', True,
+         "WorldMapArea coordinates ordered for 2 entries"),
+        ('DBC-WMA-004', True, "WorldMapArea DisplayMapID valid for 2 entries"),
+    ], _summarize(results)
+
+
+# ---------------------------------------------------------------------------
+# Cross-layer Tests: SQL INSERT parsing
+# ---------------------------------------------------------------------------
+
+def test_sql_quoted_commas_and_parens():
+    """Commas and parentheses inside quoted values do not split a row."""
+    sql = ("INSERT INTO `instance_template` (`map`, `parent`, `script`) "
+           "VALUES (533, 0, 'instance_naxx, (old)');\n"
+           "INSERT INTO creature (guid, name, map) "
+           "VALUES (1, \"a \\\"b\\\", (c\", 571);\n")
+    inserts = _parse_inserts(sql)
+
+    cols, vals = inserts['instance_template'][0]
+    assert cols == ['map', 'parent', 'script'], cols
+    assert vals == ['533', '0', 'instance_naxx, (old)'], vals
+    cols, vals = inserts['creature'][0]
+    assert vals[2] == '571', vals
+    assert _extract_sql_map_ids(inserts) == {533, 571}
+
+
+def test_sql_multi_row_values():
+    """Every row of a multi-row VALUES list is read."""
+    sql = ("INSERT INTO areatrigger_teleport (id, name, target_map) VALUES\n"
+           "(1, 'a', 30),\n"
+           "(2, 'b', 489),\n"
+           "(3, 'c', 529);")
+    inserts = _parse_inserts(sql)
+
+    assert len(inserts['areatrigger_teleport']) == 3
+    assert _extract_sql_areatrigger_maps(inserts) == {30, 489, 529}
+
+
+def test_sql_schema_qualified_names():
+    """db.table and `db`.`table` resolve to the table name."""
+    sql = ("INSERT INTO world.creature (guid, map) VALUES (1, 10);\n"
+           "INSERT INTO `world` . `creature` (guid, map) VALUES (2, 11);\n"
+           "INSERT INTO world.creature_addon (guid, map) VALUES (3, 12);")
+    inserts = _parse_inserts(sql)
+
+    assert set(inserts) == {'creature'}, set(inserts)
+    assert _extract_sql_map_ids(inserts) == {10, 11}
+
+
+def test_sql_comments():
+    """Comments are skipped between rows, inside rows and statements."""
+    sql = ("-- INSERT INTO creature (guid, map) VALUES (9, 900);\n"
+           "# INSERT INTO creature (guid, map) VALUES (9, 901);\n"
+           "/* INSERT INTO creature (guid, map) VALUES (9, 902); */\n"
+           "INSERT INTO creature (guid, map) VALUES (1,48), -- first\n"
+           "(2,49), # second\n"
+           "(3, /* inline */ 50);\n"
+           "INSERT INTO creature_template (entry, name) "
+           "VALUES (1, '-- not a comment; INSERT INTO creature "
+           "(guid, map) VALUES (9, 903)');\n")
+    inserts = _parse_inserts(sql)
+
+    assert _extract_sql_map_ids(inserts) == {48, 49, 50}
+
+
+def test_sql_unterminated_statement():
+    """A truncated final statement keeps the rows before it."""
+    sql = ("INSERT INTO creature (guid, map) VALUES (1, 1), (2, 2), (3, '3")
+    inserts = _parse_inserts(sql)
+
+    assert _extract_sql_map_ids(inserts) == {1, 2}
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    print("=" * 70)
+    print("world_builder validator tests")
+    print("=" * 70)
+
+    # --- ADT Tests ---
+    print("\n--- ADT: heightmap range ---")
+    _test("adt_height_in_range", test_adt_height_in_range)
+    _test("adt_height_out_of_range", test_adt_height_out_of_range)
+    _test("adt_height_nan", test_adt_height_nan)
+    _test("adt_height_inf", test_adt_height_inf)
+
+    # --- DBC Tests ---
+    print("\n--- DBC: field validation ---")
+    _test("dbc_map_fields", test_dbc_map_fields)
+    _test("dbc_area_fields", test_dbc_area_fields)
+    _test("dbc_worldmaparea_fields", test_dbc_worldmaparea_fields)
+
+    # --- Cross-layer Tests ---
+    print("\n--- Cross-layer: SQL INSERT parsing ---")
+    _test("sql_quoted_commas_and_parens", test_sql_quoted_commas_and_parens)
+    _test("sql_multi_row_values", test_sql_multi_row_values)
+    _test("sql_schema_qualified_names", test_sql_schema_qualified_names)
+    _test("sql_comments", test_sql_comments)
+    _test("sql_unterminated_statement", test_sql_unterminated_statement)
+
+    # --- Summary ---
+    print("\n" + "=" * 70)
+    print("Results: {} passed, {} failed".format(_PASSED, _FAILED))
+
+    if _ERRORS:
+        print("\nFailures:")
+        for name, err in _ERRORS:
+            print("  {} -- {}".format(name, err))
+
+    print("=" * 70)
+    return 0 if _FAILED == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -41,6 +41,12 @@ class ValidationSeverity(Enum):
 class ValidationResult:
     """Single validation check result."""
 
+    # Validators create one result per checked record, so instances carry
+    # no per-instance __dict__.  The message property stores its value in
+    # _message.
+    __slots__ = ('check_id', 'severity', 'passed', '_message', 'details',
+                 'fix_suggestion')
+
     def __init__(self, check_id, severity, passed, message,
                  details=None, fix_suggestion=None):
         """
@@ -48,7 +54,9 @@ class ValidationResult:
             check_id: Unique identifier for this check (e.g. 'DBC-001').
             severity: ValidationSeverity enum value.
             passed: True if the check passed, False if it failed.
-            message: Short human-readable description of result.
+            message: Short human-readable description of result, or a
+                (format_string, args) tuple that is only formatted when
+                the message is first read.
             details: Optional longer description of what was found.
             fix_suggestion: Optional suggestion for how to fix the issue.
         """
@@ -59,6 +67,29 @@ class ValidationResult:
         self.details = details
         self.fix_suggestion = fix_suggestion
 
+    @classmethod
+    def lazy(cls, check_id, severity, passed, fmt, *args, **kwargs):
+        """
+        Build a result whose message is fmt.format(*args), deferred until
+        the message is read.
+
+        Keyword arguments (details, fix_suggestion) are passed through.
+        """
+        return cls(check_id, severity, passed, (fmt, args), **kwargs)
+
+    @property
+    def message(self):
+        """Human-readable message, formatted on first access."""
+        message = self._message
+        if isinstance(message, tuple):
+            fmt, args = message
+            message = self._message = fmt.format(*args)
+        return message
+
+    @message.setter
+    def message(self, value):
+        self._message = value
+
     def __repr__(self):
         status = "PASS" if self.passed else "FAIL"
         return "ValidationResult({}, {}, {}, {!r})".format(
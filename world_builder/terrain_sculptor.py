@@ -12,6 +12,8 @@ water generation and area-ID stamping are all implemented here.
 Dependencies:
     numpy  - required for array operations
     scipy  - optional, used for alpha-map upsampling (zoom)
+    numba  - optional, JIT-compiles (and parallelises) the ADT texture-rule
+             sampling kernel
 
 Usage:
     from world_builder.terrain_sculptor import sculpt_zone
@@ -20,10 +22,14 @@ Usage:
     # terrain_data is a dict ready for adt_composer integration
 """
 
+import copy
+import itertools
 import logging
 import math
+import os
 import random
 import struct
+from collections import Counter, OrderedDict, defaultdict, namedtuple
 from io import BytesIO
 
 log = logging.getLogger(__name__)
@@ -42,6 +48,13 @@ try:
 except ImportError:
     _HAS_SCIPY = False
 
+try:
+    from numba import njit as _njit, prange as _prange
+    _HAS_NUMBA = True
+except ImportError:
+    _prange = range
+    _HAS_NUMBA = False
+
 
 # ---------------------------------------------------------------------------
 # Constants (mirrored from adt_composer for coordinate math)
@@ -57,10 +70,26 @@ _TOTAL_CHUNKS = _CHUNKS_PER_SIDE * _CHUNKS_PER_SIDE  # 256
 
 # Heightmap resolution per ADT tile: 16 chunks * 8 quads + 1 edge = 129
 _HEIGHTMAP_RES = 129
+_HEIGHTMAP_MAX_IDX = _HEIGHTMAP_RES - 1
 
 # Alpha map resolution per MCNK chunk (big-alpha / highres)
 _ALPHA_RES = 64
 
+# Heightmap row/col offset within a chunk for each of its 64 alpha cells
+# (64 alpha cells cover the chunk's 8 vertex intervals).
+_ALPHA_OFFSET_LUT = np.clip((np.arange(_ALPHA_RES, dtype=np.intp) * 8) // _ALPHA_RES,
+                            0, _HEIGHTMAP_RES - 1)
+_ALPHA_TILE_IDX = np.ix_(_ALPHA_OFFSET_LUT, _ALPHA_OFFSET_LUT)
+
+# Default 64x64 alpha map for splat layers without painted data.  Shared
+# read-only by every tile in export_for_adt_composer().
+_DEFAULT_SPLAT_64 = np.full((_ALPHA_RES, _ALPHA_RES), 128, dtype=np.uint8)
+_DEFAULT_SPLAT_64.setflags(write=False)
+
+# (chunk_row, chunk_col) of every MCNK of a tile, in row-major order
+_CHUNK_KEYS = tuple(itertools.product(range(_CHUNKS_PER_SIDE),
+                                      range(_CHUNKS_PER_SIDE)))
+
 # Water type constants matching MH2O type IDs
 WATER_TYPE_OCEAN = 0
 WATER_TYPE_LAKE = 1
@@ -713,6 +742,8 @@ class TexturePainter:
 
     def __init__(self, zone_def):
         self.zone_def = zone_def
+        self.grid_size = zone_def.get('grid_size', (1, 1))
+        self.base_coords = zone_def.get('base_coords', (32, 32))
         self.noise = SimplexNoise(seed=zone_def.get('seed', 0) + 7777)
 
     def paint_textures(self, heightmap, tile_x, tile_y):
@@ -826,8 +857,8 @@ class TexturePainter:
         rows, cols = hm_shape
         subzone_map = np.full((rows, cols), -1, dtype=np.int32)
 
-        grid_w, grid_h = self.zone_def.get('grid_size', (1, 1))
-        base_x, base_y = self.zone_def.get('base_coords', (32, 32))
+        grid_w, grid_h = self.grid_size
+        base_x, base_y = self.base_coords
         local_tx = tile_x - base_x
         local_ty = tile_y - base_y
         x_start = local_tx / float(grid_w)
@@ -1052,6 +1083,26 @@ def poisson_disk_sampling(width, height, min_distance, max_attempts=30,
 # Doodad Scatter Engine
 # ===================================================================
 
+def _spread_bits(v):
+    """Spread the low 10 bits of *v* so they occupy the even bit positions."""
+    v &= 0x3FF
+    v = (v | (v << 8)) & 0x00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F
+    v = (v | (v << 2)) & 0x33333333
+    v = (v | (v << 1)) & 0x55555555
+    return v
+
+
+def _morton_key(tile_x, tile_y):
+    """
+    Interleave two tile coordinates (0-1023) into a single Z-order int.
+
+    Used for per-point cache lookups, where hashing one small int is
+    cheaper than building and hashing a tuple.
+    """
+    return _spread_bits(tile_x) | (_spread_bits(tile_y) << 1)
+
+
 class DoodadScatterEngine:
     """
     Automated doodad (M2) placement using Poisson disk sampling
@@ -1066,6 +1117,8 @@ class DoodadScatterEngine:
         """
         self.zone_def = zone_def
         self.heightmaps = heightmaps
+        self.grid_size = zone_def.get('grid_size', (1, 1))
+        self.base_coords = zone_def.get('base_coords', (32, 32))
         self._slope_cache = {}
         self._rng = random.Random(zone_def.get('seed', 0) + 12345)
 
@@ -1093,7 +1146,7 @@ class DoodadScatterEngine:
         entries = []
         center = subzone.get('center', (0.5, 0.5))
         radius = subzone.get('radius', 0.2)
-        grid_w, grid_h = self.zone_def.get('grid_size', (1, 1))
+        grid_w, grid_h = self.grid_size
 
         # World-space extents of the subzone (approximate bounding box)
         # In normalised space, the subzone spans [center-radius, center+radius]
@@ -1127,7 +1180,7 @@ class DoodadScatterEngine:
             )
 
             # Offset to zone-normalised coords and filter to subzone circle
-            filters = subzone.get('doodad_filters', {})
+            inside = []
             for px, py in raw_points:
                 norm_x = box_x + px
                 norm_y = box_y + py
@@ -1137,13 +1190,22 @@ class DoodadScatterEngine:
                 dy = norm_y - center[1]
                 if dx * dx + dy * dy > radius * radius:
                     continue
+                inside.append((norm_x, norm_y))
+
+            if not inside:
+                continue
+
+            # Sample heights for all candidate points in one batch
+            inside_arr = np.array(inside, dtype=np.float64)
+            heights = self._sample_heights(inside_arr[:, 0], inside_arr[:, 1])
+
+            filters = subzone.get('doodad_filters', {})
+            for (norm_x, norm_y), z in zip(inside, heights):
+                z = float(z)
 
                 # Convert to world coordinates
                 world_x, world_y = self._norm_to_world(norm_x, norm_y)
 
-                # Sample height
-                z = self._sample_height(norm_x, norm_y)
-
                 # Apply filters
                 if not self._is_valid_placement(z, norm_x, norm_y, filters):
                     continue
@@ -1169,8 +1231,8 @@ class DoodadScatterEngine:
         MAP_SIZE_MAX = 17066.  World X decreases with tile_y, world Y
         decreases with tile_x.
         """
-        grid_w, grid_h = self.zone_def.get('grid_size', (1, 1))
-        base_x, base_y = self.zone_def.get('base_coords', (32, 32))
+        grid_w, grid_h = self.grid_size
+        base_x, base_y = self.base_coords
 
         tile_fx = base_x + norm_x * grid_w
         tile_fy = base_y + norm_y * grid_h
@@ -1184,8 +1246,8 @@ class DoodadScatterEngine:
         Sample the heightmap at normalised zone coordinates using bilinear
         interpolation.
         """
-        grid_w, grid_h = self.zone_def.get('grid_size', (1, 1))
-        base_x, base_y = self.zone_def.get('base_coords', (32, 32))
+        grid_w, grid_h = self.grid_size
+        base_x, base_y = self.base_coords
 
         # Fractional tile coordinates
         tile_fx = norm_x * grid_w
@@ -1222,25 +1284,71 @@ class DoodadScatterEngine:
                 v10 * fr * (1 - fc) +
                 v11 * fr * fc)
 
+    def _sample_heights(self, norm_x, norm_y):
+        """
+        Vectorised _sample_height() for arrays of normalised coordinates.
+
+        Points are grouped by tile so each heightmap is indexed once.
+
+        Returns:
+            1D float64 array of heights (0.0 where no heightmap exists).
+        """
+        grid_w, grid_h = self.grid_size
+        base_x, base_y = self.base_coords
+
+        tile_fx = norm_x * grid_w
+        tile_fy = norm_y * grid_h
+        tile_ix = np.floor(tile_fx).astype(np.int64)
+        tile_iy = np.floor(tile_fy).astype(np.int64)
+
+        hm_max = _HEIGHTMAP_MAX_IDX
+        col_f = (tile_fx - tile_ix) * hm_max
+        row_f = (tile_fy - tile_iy) * hm_max
+        c0 = col_f.astype(np.int64)
+        r0 = row_f.astype(np.int64)
+        c1 = np.minimum(c0 + 1, hm_max)
+        r1 = np.minimum(r0 + 1, hm_max)
+        fc = col_f - c0
+        fr = row_f - r0
+
+        heights = np.zeros(len(tile_fx), dtype=np.float64)
+        tiles, group = np.unique(np.stack([tile_ix, tile_iy], axis=1),
+                                 axis=0, return_inverse=True)
+        group = group.ravel()
+        for g, (ix, iy) in enumerate(tiles):
+            hm = self.heightmaps.get((base_x + int(ix), base_y + int(iy)))
+            if hm is None:
+                continue
+            sel = group == g
+            gfr = fr[sel]
+            gfc = fc[sel]
+            heights[sel] = (hm[r0[sel], c0[sel]] * (1 - gfr) * (1 - gfc) +
+                            hm[r0[sel], c1[sel]] * (1 - gfr) * gfc +
+                            hm[r1[sel], c0[sel]] * gfr * (1 - gfc) +
+                            hm[r1[sel], c1[sel]] * gfr * gfc)
+        return heights
+
     def _sample_slope(self, norm_x, norm_y):
         """Sample slope (degrees) at normalised zone coordinates."""
-        grid_w, grid_h = self.zone_def.get('grid_size', (1, 1))
-        base_x, base_y = self.zone_def.get('base_coords', (32, 32))
+        grid_w, grid_h = self.grid_size
+        base_x, base_y = self.base_coords
 
         tile_fx = norm_x * grid_w
         tile_fy = norm_y * grid_h
         tile_ix = int(math.floor(tile_fx))
         tile_iy = int(math.floor(tile_fy))
 
-        key = (base_x + tile_ix, base_y + tile_iy)
+        tile_x = base_x + tile_ix
+        tile_y = base_y + tile_iy
 
-        if key not in self._slope_cache:
-            hm = self.heightmaps.get(key)
+        cache_key = _morton_key(tile_x, tile_y)
+        slope_map = self._slope_cache.get(cache_key)
+        if slope_map is None:
+            hm = self.heightmaps.get((tile_x, tile_y))
             if hm is None:
                 return 0.0
-            self._slope_cache[key] = calculate_slope(hm)
-
-        slope_map = self._slope_cache[key]
+            slope_map = calculate_slope(hm)
+            self._slope_cache[cache_key] = slope_map
 
         local_x = tile_fx - tile_ix
         local_y = tile_fy - tile_iy
@@ -1290,6 +1398,8 @@ class WMOPlacementEngine:
     def __init__(self, zone_def, heightmaps):
         self.zone_def = zone_def
         self.heightmaps = heightmaps
+        self.grid_size = zone_def.get('grid_size', (1, 1))
+        self.base_coords = zone_def.get('base_coords', (32, 32))
 
     def place_all(self):
         """
@@ -1299,17 +1409,33 @@ class WMOPlacementEngine:
             List of MODF entry dicts with keys:
                 model, position, rotation, scale, doodad_set, flags
         """
+        structures = [
+            structure
+            for subzone in self.zone_def.get('subzones', [])
+            for structure in subzone.get('structures', [])
+        ]
+        if not structures:
+            return []
+
+        # Gather every ground height in one batch before building entries
+        norm_pos = np.array(
+            [structure.get('position', (0.5, 0.5))[:2] for structure in structures],
+            dtype=np.float64,
+        )
+        heights = self._sample_heights(norm_pos[:, 0], norm_pos[:, 1])
+
         entries = []
-        for subzone in self.zone_def.get('subzones', []):
-            for structure in subzone.get('structures', []):
-                entry = self._place_single(structure)
-                if entry is not None:
-                    entries.append(entry)
+        for structure, z in zip(structures, heights):
+            entry = self._place_single(structure, float(z))
+            if entry is not None:
+                entries.append(entry)
         return entries
 
-    def _place_single(self, structure):
+    def _place_single(self, structure, z=None):
         """
         Convert one structure definition to a MODF entry.
+
+        If *z* is None the ground height is sampled from the heightmap.
         """
         norm_pos = structure.get('position', (0.5, 0.5))
         rotation = structure.get('rotation', (0.0, 0.0, 0.0))
@@ -1318,8 +1444,8 @@ class WMOPlacementEngine:
         model = structure.get('model', '')
 
         # Convert normalised position to world coordinates
-        grid_w, grid_h = self.zone_def.get('grid_size', (1, 1))
-        base_x, base_y = self.zone_def.get('base_coords', (32, 32))
+        grid_w, grid_h = self.grid_size
+        base_x, base_y = self.base_coords
 
         tile_fx = base_x + norm_pos[0] * grid_w
         tile_fy = base_y + norm_pos[1] * grid_h
@@ -1328,7 +1454,8 @@ class WMOPlacementEngine:
         world_y = MAP_SIZE_MAX - tile_fx * TILE_SIZE
 
         # Sample height for Z
-        z = self._sample_height(norm_pos[0], norm_pos[1])
+        if z is None:
+            z = self._sample_height(norm_pos[0], norm_pos[1])
 
         return {
             'model': model,
@@ -1341,25 +1468,65 @@ class WMOPlacementEngine:
 
     def _sample_height(self, norm_x, norm_y):
         """Sample heightmap at normalised zone coordinates."""
-        grid_w, grid_h = self.zone_def.get('grid_size', (1, 1))
-        base_x, base_y = self.zone_def.get('base_coords', (32, 32))
+        grid_w, grid_h = self.grid_size
+        base_x, base_y = self.base_coords
 
         tile_fx = norm_x * grid_w
         tile_fy = norm_y * grid_h
-        tile_ix = int(math.floor(tile_fx))
-        tile_iy = int(math.floor(tile_fy))
+        if tile_fx < 0 or tile_fy < 0:
+            # West/north of the zone: no heightmap exists there
+            return 0.0
+
+        # Non-negative, so int() truncation equals floor()
+        tile_ix = int(tile_fx)
+        tile_iy = int(tile_fy)
 
         key = (base_x + tile_ix, base_y + tile_iy)
         hm = self.heightmaps.get(key)
         if hm is None:
             return 0.0
 
-        local_x = tile_fx - tile_ix
-        local_y = tile_fy - tile_iy
-        col = min(int(local_x * (_HEIGHTMAP_RES - 1)), _HEIGHTMAP_RES - 1)
-        row = min(int(local_y * (_HEIGHTMAP_RES - 1)), _HEIGHTMAP_RES - 1)
+        col = int((tile_fx - tile_ix) * _HEIGHTMAP_MAX_IDX)
+        if col > _HEIGHTMAP_MAX_IDX:
+            col = _HEIGHTMAP_MAX_IDX
+        row = int((tile_fy - tile_iy) * _HEIGHTMAP_MAX_IDX)
+        if row > _HEIGHTMAP_MAX_IDX:
+            row = _HEIGHTMAP_MAX_IDX
         return float(hm[row, col])
 
+    def _sample_heights(self, norm_x, norm_y):
+        """
+        Vectorised _sample_height() for arrays of normalised coordinates.
+
+        Points are grouped by tile so each heightmap is indexed once.
+
+        Returns:
+            1D float64 array of heights (0.0 where no heightmap exists).
+        """
+        grid_w, grid_h = self.grid_size
+        base_x, base_y = self.base_coords
+
+        tile_fx = norm_x * grid_w
+        tile_fy = norm_y * grid_h
+        tile_ix = np.floor(tile_fx).astype(np.int64)
+        tile_iy = np.floor(tile_fy).astype(np.int64)
+
+        hm_max = _HEIGHTMAP_MAX_IDX
+        cols = np.minimum(((tile_fx - tile_ix) * hm_max).astype(np.int64), hm_max)
+        rows = np.minimum(((tile_fy - tile_iy) * hm_max).astype(np.int64), hm_max)
+
+        heights = np.zeros(len(tile_fx), dtype=np.float64)
+        tiles, group = np.unique(np.stack([tile_ix, tile_iy], axis=1),
+                                 axis=0, return_inverse=True)
+        group = group.ravel()
+        for g, (ix, iy) in enumerate(tiles):
+            hm = self.heightmaps.get((base_x + int(ix), base_y + int(iy)))
+            if hm is None:
+                continue
+            sel = group == g
+            heights[sel] = hm[rows[sel], cols[sel]]
+        return heights
+
 
 # ===================================================================
 # Water Plane Generator
@@ -1374,8 +1541,18 @@ class WaterGenerator:
     provides the logical description.
     """
 
-    def __init__(self, zone_def):
+    def __init__(self, zone_def, subzones=None):
+        """
+        Args:
+            zone_def: Zone definition dict.
+            subzones: Optional _SubzoneSoA for zone_def; built if omitted.
+        """
         self.zone_def = zone_def
+        self.grid_size = zone_def.get('grid_size', (1, 1))
+        self.base_coords = zone_def.get('base_coords', (32, 32))
+        if subzones is None:
+            subzones = _SubzoneSoA(zone_def.get('subzones', []))
+        self.subzones = subzones
 
     def generate_all(self):
         """
@@ -1387,53 +1564,56 @@ class WaterGenerator:
                 type_id, elevation, x_start, y_start, width, height
             (chunk coordinates within the 16x16 MCNK grid)
         """
-        grid_w, grid_h = self.zone_def.get('grid_size', (1, 1))
-        base_x, base_y = self.zone_def.get('base_coords', (32, 32))
+        grid_w, grid_h = self.grid_size
+        base_x, base_y = self.base_coords
 
-        water = {}
+        water = defaultdict(list)
 
-        # Global water plane (e.g. ocean)
+        # Global water plane (e.g. ocean).  Every tile gets the same
+        # full-coverage region, so a single dict is shared by all tiles.
         global_water = self.zone_def.get('global_water', None)
         if global_water is not None:
             elevation = global_water.get('elevation', 0.0)
             water_type = global_water.get('type', 'ocean')
             type_id = _WATER_TYPE_MAP.get(water_type, WATER_TYPE_OCEAN)
 
-            for ty in range(grid_h):
-                for tx in range(grid_w):
-                    key = (base_x + tx, base_y + ty)
-                    if key not in water:
-                        water[key] = []
-                    water[key].append({
-                        'type_id': type_id,
-                        'elevation': float(elevation),
-                        'x_start': 0,
-                        'y_start': 0,
-                        'width': _CHUNKS_PER_SIDE,
-                        'height': _CHUNKS_PER_SIDE,
-                    })
+            global_entry = {
+                'type_id': type_id,
+                'elevation': float(elevation),
+                'x_start': 0,
+                'y_start': 0,
+                'width': _CHUNKS_PER_SIDE,
+                'height': _CHUNKS_PER_SIDE,
+            }
+            water.update(
+                ((base_x + tx, base_y + ty), [global_entry])
+                for ty in range(grid_h)
+                for tx in range(grid_w)
+            )
 
         # Per-subzone water definitions
-        for subzone in self.zone_def.get('subzones', []):
+        for idx, subzone in enumerate(self.zone_def.get('subzones', [])):
             for water_def in subzone.get('water', []):
-                self._add_subzone_water(water, subzone, water_def)
+                self._add_subzone_water(water, idx, water_def)
 
-        return water
+        return dict(water)
 
-    def _add_subzone_water(self, water_dict, subzone, water_def):
+    def _add_subzone_water(self, water_dict, subzone_idx, water_def):
         """
-        Add water regions for a subzone's water definition.
+        Add water regions for the water definition of subzone *subzone_idx*.
+
+        *water_dict* must be a defaultdict(list).
         """
-        grid_w, grid_h = self.zone_def.get('grid_size', (1, 1))
-        base_x, base_y = self.zone_def.get('base_coords', (32, 32))
+        grid_w, grid_h = self.grid_size
+        base_x, base_y = self.base_coords
         elevation = water_def.get('elevation', 0.0)
         water_type = water_def.get('type', 'ocean')
         type_id = _WATER_TYPE_MAP.get(water_type, WATER_TYPE_OCEAN)
         boundary = water_def.get('boundary', 'inherit')
 
         # Determine the normalised bounding box
-        center = subzone.get('center', (0.5, 0.5))
-        radius = subzone.get('radius', 0.2)
+        center_x, center_y = self.subzones.centers[subzone_idx].tolist()
+        radius = float(self.subzones.radii[subzone_idx])
 
         if isinstance(boundary, list):
             # Explicit polygon boundary
@@ -1445,51 +1625,49 @@ class WaterGenerator:
             norm_y_max = max(ys)
         else:
             # 'inherit' or 'caldera' -- use subzone circle bounding box
-            norm_x_min = center[0] - radius
-            norm_x_max = center[0] + radius
-            norm_y_min = center[1] - radius
-            norm_y_max = center[1] + radius
-
-        # Determine which tiles are affected
-        tile_x_min = int(math.floor(norm_x_min * grid_w))
-        tile_x_max = int(math.floor(norm_x_max * grid_w))
-        tile_y_min = int(math.floor(norm_y_min * grid_h))
-        tile_y_max = int(math.floor(norm_y_max * grid_h))
-
-        for ty_local in range(max(0, tile_y_min), min(grid_h, tile_y_max + 1)):
-            for tx_local in range(max(0, tile_x_min), min(grid_w, tile_x_max + 1)):
+            norm_x_min = center_x - radius
+            norm_x_max = center_x + radius
+            norm_y_min = center_y - radius
+            norm_y_max = center_y + radius
+
+        # Determine which tiles are affected as clipped [start, end) ranges
+        grid_limits = (grid_w, grid_w, grid_h, grid_h)
+        tile_bounds = np.floor(
+            np.array([norm_x_min, norm_x_max, norm_y_min, norm_y_max])
+            * grid_limits
+        ).astype(np.int64) + (0, 1, 0, 1)
+        tx_start, tx_end, ty_start, ty_end = np.clip(
+            tile_bounds, 0, grid_limits
+        ).tolist()
+
+        # Bounding box in zone-wide chunk units.  A tile spans exactly
+        # _CHUNKS_PER_SIDE of these, so per-tile chunk ranges reduce to a
+        # subtraction instead of re-deriving the tile extents every time.
+        chunk_scale_x = grid_w * _CHUNKS_PER_SIDE
+        chunk_scale_y = grid_h * _CHUNKS_PER_SIDE
+        scaled_x_min = norm_x_min * chunk_scale_x
+        scaled_x_max = norm_x_max * chunk_scale_x
+        scaled_y_min = norm_y_min * chunk_scale_y
+        scaled_y_max = norm_y_max * chunk_scale_y
+
+        for ty_local in range(ty_start, ty_end):
+            tile_chunk_y = ty_local * _CHUNKS_PER_SIDE
+            chunk_y_start = max(0, int(scaled_y_min - tile_chunk_y))
+            chunk_y_end = min(_CHUNKS_PER_SIDE,
+                              int(math.ceil(scaled_y_max - tile_chunk_y)))
+
+            for tx_local in range(tx_start, tx_end):
                 key = (base_x + tx_local, base_y + ty_local)
 
-                # Determine chunk range within this tile
-                tile_norm_x_start = tx_local / float(grid_w)
-                tile_norm_x_end = (tx_local + 1) / float(grid_w)
-                tile_norm_y_start = ty_local / float(grid_h)
-                tile_norm_y_end = (ty_local + 1) / float(grid_h)
-
                 # Chunk range (0-15) within the tile
-                chunk_x_start = max(0, int(
-                    (norm_x_min - tile_norm_x_start) /
-                    (tile_norm_x_end - tile_norm_x_start) * _CHUNKS_PER_SIDE
-                ))
-                chunk_x_end = min(_CHUNKS_PER_SIDE, int(math.ceil(
-                    (norm_x_max - tile_norm_x_start) /
-                    (tile_norm_x_end - tile_norm_x_start) * _CHUNKS_PER_SIDE
-                )))
-                chunk_y_start = max(0, int(
-                    (norm_y_min - tile_norm_y_start) /
-                    (tile_norm_y_end - tile_norm_y_start) * _CHUNKS_PER_SIDE
-                ))
-                chunk_y_end = min(_CHUNKS_PER_SIDE, int(math.ceil(
-                    (norm_y_max - tile_norm_y_start) /
-                    (tile_norm_y_end - tile_norm_y_start) * _CHUNKS_PER_SIDE
-                )))
+                tile_chunk_x = tx_local * _CHUNKS_PER_SIDE
+                chunk_x_start = max(0, int(scaled_x_min - tile_chunk_x))
+                chunk_x_end = min(_CHUNKS_PER_SIDE,
+                                  int(math.ceil(scaled_x_max - tile_chunk_x)))
 
                 if chunk_x_end <= chunk_x_start or chunk_y_end <= chunk_y_start:
                     continue
 
-                if key not in water_dict:
-                    water_dict[key] = []
-
                 water_dict[key].append({
                     'type_id': type_id,
                     'elevation': float(elevation),
@@ -1500,68 +1678,104 @@ class WaterGenerator:
                 })
 
 
+# ===================================================================
+# Subzone arrays
+# ===================================================================
+
+class _SubzoneSoA:
+    """
+    Structure-of-arrays view of zone_def['subzones'].
+
+    Built once per zone so the area-ID stamper and water generator can
+    work on numpy arrays instead of re-reading each subzone dict.  The
+    dict list stays the source of truth for serialisation.
+    """
+
+    __slots__ = ('centers', 'radii', 'area_ids')
+
+    def __init__(self, subzones):
+        n = len(subzones)
+        self.centers = np.empty((n, 2), dtype=np.float64)
+        self.radii = np.empty(n, dtype=np.float64)
+        self.area_ids = np.empty(n, dtype=np.int32)
+
+        for i, subzone in enumerate(subzones):
+            self.centers[i] = subzone.get('center', (0.5, 0.5))[:2]
+            self.radii[i] = subzone.get('radius', 0.2)
+            self.area_ids[i] = subzone.get('area_id', 0)
+
+    def __len__(self):
+        return len(self.radii)
+
+
 # ===================================================================
 # Area ID Stamper
 # ===================================================================
 
-def stamp_area_ids(zone_def):
+def stamp_area_ids(zone_def, subzones=None, as_array=False):
     """
     Assign area IDs to every MCNK chunk based on subzone boundaries.
 
     Uses a point-in-circle test for each chunk's centre position.
     When multiple subzones overlap, the smallest (most specific)
-    subzone wins.
+    subzone wins; among equal radii the first listed wins.
 
     Args:
         zone_def: Zone definition dict.
+        subzones: Optional _SubzoneSoA for zone_def; built if omitted.
+        as_array: Return the dense array the IDs are computed in instead
+            of the keyed dict.
 
     Returns:
-        Dict {(tile_x, tile_y, chunk_row, chunk_col): area_id}.
+        Dict {(tile_x, tile_y, chunk_row, chunk_col): area_id}, or with
+        as_array an int32 numpy array of shape (grid_h, grid_w, 16, 16)
+        indexed as [tile_y - base_y, tile_x - base_x, chunk_row, chunk_col].
     """
     grid_w, grid_h = zone_def.get('grid_size', (1, 1))
-    base_x, base_y = zone_def.get('base_coords', (32, 32))
-
-    area_ids = {}
-
+    if subzones is None:
+        subzones = _SubzoneSoA(zone_def.get('subzones', []))
+
+    # Chunk centres in normalised zone coordinates, one axis at a time
+    chunk_offsets = (np.arange(_CHUNKS_PER_SIDE) + 0.5) / _CHUNKS_PER_SIDE
+    norm_x = ((np.arange(grid_w)[:, None] + chunk_offsets) / float(grid_w)).ravel()
+    norm_y = ((np.arange(grid_h)[:, None] + chunk_offsets) / float(grid_h)).ravel()
+
+    area_ids = np.zeros((norm_y.size, norm_x.size), dtype=np.int32)
+    best_radius = np.full(area_ids.shape, np.inf)
+
+    for (cx, cy), radius, area_id in zip(subzones.centers, subzones.radii,
+                                          subzones.area_ids):
+        dx = norm_x - cx
+        dy = norm_y - cy
+        dist_sq = (dy * dy)[:, None] + (dx * dx)[None, :]
+        wins = (dist_sq <= radius * radius) & (radius < best_radius)
+        area_ids[wins] = area_id
+        best_radius[wins] = radius
+
+    # (gh*16, gw*16) -> (gh, 16, gw, 16) -> (gh, gw, 16, 16)
+    area_ids = area_ids.reshape(
+        grid_h, _CHUNKS_PER_SIDE, grid_w, _CHUNKS_PER_SIDE
+    ).transpose(0, 2, 1, 3).copy()
+    if as_array:
+        return area_ids
+    return area_ids_to_dict(area_ids, zone_def.get('base_coords', (32, 32)))
+
+
+def area_ids_to_dict(area_ids, base_coords=(32, 32)):
+    """
+    Convert the dense array returned by stamp_area_ids(as_array=True) to
+    the dict form {(tile_x, tile_y, chunk_row, chunk_col): area_id}.
+    """
+    base_x, base_y = base_coords
+    grid_h, grid_w = area_ids.shape[:2]
+    result = {}
     for ty in range(grid_h):
         for tx in range(grid_w):
-            tile_x = base_x + tx
-            tile_y = base_y + ty
-
             for chunk_row in range(_CHUNKS_PER_SIDE):
                 for chunk_col in range(_CHUNKS_PER_SIDE):
-                    # Chunk centre in normalised zone coordinates
-                    norm_x = (tx + (chunk_col + 0.5) / _CHUNKS_PER_SIDE) / float(grid_w)
-                    norm_y = (ty + (chunk_row + 0.5) / _CHUNKS_PER_SIDE) / float(grid_h)
-
-                    area_id = _find_area_id(zone_def, norm_x, norm_y)
-                    area_ids[(tile_x, tile_y, chunk_row, chunk_col)] = area_id
-
-    return area_ids
-
-
-def _find_area_id(zone_def, norm_x, norm_y):
-    """
-    Find the most specific subzone containing the normalised point.
-
-    Picks the subzone with the smallest radius (most specific)
-    among all containing subzones. Returns 0 if no subzone matches.
-    """
-    best_area_id = 0
-    best_radius = float('inf')
-
-    for subzone in zone_def.get('subzones', []):
-        center = subzone.get('center', (0.5, 0.5))
-        radius = subzone.get('radius', 0.2)
-
-        dx = norm_x - center[0]
-        dy = norm_y - center[1]
-        if dx * dx + dy * dy <= radius * radius:
-            if radius < best_radius:
-                best_radius = radius
-                best_area_id = subzone.get('area_id', 0)
-
-    return best_area_id
+                    result[(base_x + tx, base_y + ty, chunk_row, chunk_col)] = \
+                        int(area_ids[ty, tx, chunk_row, chunk_col])
+    return result
 
 
 # ===================================================================
@@ -1574,6 +1788,10 @@ class TerrainSculptor:
 
     Orchestrates heightmap generation, texture painting, doodad/WMO
     placement, water planes and area-ID stamping from a zone definition.
+
+    Each generate_* result is cached on the instance, so calling several
+    entry points (or the same one twice) does not redo the work.  Results
+    are shared, not copied; call reset_cache() after changing zone_def.
     """
 
     def __init__(self, zone_definition):
@@ -1585,6 +1803,17 @@ class TerrainSculptor:
         self.zone_def = zone_definition
         self.grid_size = zone_definition.get('grid_size', (1, 1))
         self.base_coords = zone_definition.get('base_coords', (32, 32))
+        self.reset_cache()
+
+    def reset_cache(self):
+        """Discard all cached generation results."""
+        self.subzones = _SubzoneSoA(self.zone_def.get('subzones', []))
+        self._heightmaps = None
+        self._textures = None
+        self._doodads = None
+        self._wmos = None
+        self._water = None
+        self._area_ids = None
 
     # ------------------------------------------------------------------
     # Generation methods
@@ -1597,6 +1826,9 @@ class TerrainSculptor:
         Returns:
             Dict {(tile_x, tile_y): 2D numpy array (129x129)}.
         """
+        if self._heightmaps is not None:
+            return self._heightmaps
+
         heightmaps = {}
         grid_w, grid_h = self.grid_size
         base_x, base_y = self.base_coords
@@ -1609,14 +1841,17 @@ class TerrainSculptor:
                     self.zone_def, tile_x, tile_y
                 )
 
+        self._heightmaps = heightmaps
         return heightmaps
 
-    def generate_textures(self, heightmaps):
+    def generate_textures(self, heightmaps=None):
         """
         Generate texture layers and alpha maps for all tiles.
 
         Args:
-            heightmaps: Dict returned by generate_heightmaps().
+            heightmaps: Dict returned by generate_heightmaps().  Defaults
+                        to this sculptor's own (cached) heightmaps; only
+                        results for those are cached.
 
         Returns:
             Dict with keys:
@@ -1629,6 +1864,12 @@ class TerrainSculptor:
                     }}
                 }}
         """
+        if heightmaps is None:
+            heightmaps = self.generate_heightmaps()
+        cacheable = heightmaps is self._heightmaps
+        if cacheable and self._textures is not None:
+            return self._textures
+
         painter = TexturePainter(self.zone_def)
 
         tile_data = {}
@@ -1645,36 +1886,59 @@ class TerrainSculptor:
                     all_texture_set[path] = len(all_textures)
                     all_textures.append(path)
 
-        return {
+        textures = {
             'texture_paths': all_textures,
             'tile_data': tile_data,
         }
+        if cacheable:
+            self._textures = textures
+        return textures
 
-    def generate_doodads(self, heightmaps):
+    def generate_doodads(self, heightmaps=None):
         """
         Generate doodad placements (MDDF entries) for the entire zone.
 
         Args:
-            heightmaps: Dict returned by generate_heightmaps().
+            heightmaps: Dict returned by generate_heightmaps().  Defaults
+                        to this sculptor's own (cached) heightmaps.
 
         Returns:
             List of MDDF entry dicts.
         """
+        if heightmaps is None:
+            heightmaps = self.generate_heightmaps()
+        cacheable = heightmaps is self._heightmaps
+        if cacheable and self._doodads is not None:
+            return self._doodads
+
         engine = DoodadScatterEngine(self.zone_def, heightmaps)
-        return engine.scatter_all()
+        doodads = engine.scatter_all()
+        if cacheable:
+            self._doodads = doodads
+        return doodads
 
-    def generate_wmos(self, heightmaps):
+    def generate_wmos(self, heightmaps=None):
         """
         Generate WMO placements (MODF entries) for the entire zone.
 
         Args:
-            heightmaps: Dict returned by generate_heightmaps().
+            heightmaps: Dict returned by generate_heightmaps().  Defaults
+                        to this sculptor's own (cached) heightmaps.
 
         Returns:
             List of MODF entry dicts.
         """
+        if heightmaps is None:
+            heightmaps = self.generate_heightmaps()
+        cacheable = heightmaps is self._heightmaps
+        if cacheable and self._wmos is not None:
+            return self._wmos
+
         engine = WMOPlacementEngine(self.zone_def, heightmaps)
-        return engine.place_all()
+        wmos = engine.place_all()
+        if cacheable:
+            self._wmos = wmos
+        return wmos
 
     def generate_water(self):
         """
@@ -1683,31 +1947,71 @@ class TerrainSculptor:
         Returns:
             Dict {(tile_x, tile_y): list of water region dicts}.
         """
-        gen = WaterGenerator(self.zone_def)
-        return gen.generate_all()
+        if self._water is None:
+            self._water = WaterGenerator(self.zone_def,
+                                         self.subzones).generate_all()
+        return self._water
 
-    def generate_area_ids(self):
+    def generate_area_ids(self, as_array=False):
         """
         Generate area-ID assignments for every MCNK chunk.
 
+        Args:
+            as_array: Return the cached dense array instead of the dict;
+                see stamp_area_ids().
+
         Returns:
-            Dict {(tile_x, tile_y, chunk_row, chunk_col): area_id}.
+            Dict {(tile_x, tile_y, chunk_row, chunk_col): area_id}, or
+            with as_array an int32 array (grid_h, grid_w, 16, 16).
         """
-        return stamp_area_ids(self.zone_def)
+        if self._area_ids is None:
+            self._area_ids = stamp_area_ids(self.zone_def, self.subzones,
+                                            as_array=True)
+        if as_array:
+            return self._area_ids
+        return area_ids_to_dict(self._area_ids, self.base_coords)
+
+    def run_all(self):
+        """
+        Run every generation step and return the raw results.
+
+        All sub-results stay cached on the sculptor, so a following
+        export_for_adt_composer() call reuses them.
+
+        Returns:
+            Dict in the format documented by sculpt_zone().
+        """
+        heightmaps = self.generate_heightmaps()
+        return {
+            'heightmaps': heightmaps,
+            'textures': self.generate_textures(heightmaps),
+            'doodads': self.generate_doodads(heightmaps),
+            'wmos': self.generate_wmos(heightmaps),
+            'water': self.generate_water(),
+            'area_ids': self.generate_area_ids(),
+        }
 
     # ------------------------------------------------------------------
     # Integration helpers
     # ------------------------------------------------------------------
 
-    def export_for_adt_composer(self):
+    def export_for_adt_composer(self, heightmap_format='list'):
         """
         Run the full pipeline and return data in the format expected by
         adt_composer.create_adt().
 
+        Args:
+            heightmap_format: 'list' (default) to return each tile's
+                heightmap as a plain list-of-lists and its area_id_map as
+                a dict, or 'ndarray' to skip the conversions and return
+                numpy arrays for both.  adt_composer's bilinear sampler
+                accepts either heightmap, but indexes lists faster.
+
         For each tile, returns:
-            heightmap   - 2D list (compatible with adt_composer's bilinear sampler)
+            heightmap   - 129x129 array or list-of-lists (see heightmap_format)
             texture_paths - list of texture path strings (max 4 per tile)
-            splat_map   - dict {layer_index: [[row][col]]} alpha maps
+            splat_map   - dict {layer_index: 64x64 uint8 array} alpha maps
+                          (read-only; copy before modifying)
             area_id     - int (most common area_id for the tile, used as default)
             doodads     - list of MDDF dicts for this tile
             wmos        - list of MODF dicts for this tile
@@ -1715,22 +2019,36 @@ class TerrainSculptor:
 
         Returns:
             Dict {(tile_x, tile_y): {
-                'heightmap': list-of-lists,
+                'heightmap': numpy array or list-of-lists,
                 'texture_paths': list[str],
                 'splat_map': dict,
                 'area_id': int,
-                'area_id_map': dict {(chunk_row, chunk_col): int},
+                'area_id_map': dict {(chunk_row, chunk_col): int}, or with
+                               'ndarray' an int32 array (16, 16) indexed
+                               [chunk_row, chunk_col],
                 'doodads': list[dict],
                 'wmos': list[dict],
                 'water': list[dict],
             }}
+
+        Raises:
+            ValueError: If heightmap_format is not 'ndarray' or 'list'.
         """
+        if heightmap_format not in ('ndarray', 'list'):
+            raise ValueError(
+                "heightmap_format must be 'ndarray' or 'list', got %r"
+                % (heightmap_format,))
+
         heightmaps = self.generate_heightmaps()
         textures = self.generate_textures(heightmaps)
         doodads = self.generate_doodads(heightmaps)
         wmos = self.generate_wmos(heightmaps)
         water = self.generate_water()
-        area_ids = self.generate_area_ids()
+        area_ids = self.generate_area_ids(as_array=True)
+
+        # Bucket doodads/WMOs by tile once rather than rescanning per tile
+        doodad_buckets = _bucket_by_tile(doodads)
+        wmo_buckets = _bucket_by_tile(wmos)
 
         result = {}
         grid_w, grid_h = self.grid_size
@@ -1742,9 +2060,9 @@ class TerrainSculptor:
                 tile_y = base_y + ty
                 key = (tile_x, tile_y)
 
-                # Heightmap as plain list-of-lists
                 hm = heightmaps[key]
-                hm_list = hm.tolist()
+                if heightmap_format == 'list':
+                    hm = hm.tolist()
 
                 # Texture data for this tile
                 tile_tex = textures['tile_data'].get(key, {})
@@ -1753,16 +2071,16 @@ class TerrainSculptor:
 
                 # Build per-tile texture_paths (max 4) and splat_map
                 # Collect the most common textures across all chunks
-                tex_freq = {}
-                for cl in chunk_layers.values():
-                    for tid in cl.get('texture_ids', []):
-                        if tid is not None and tid < len(tile_tex_paths):
-                            path = tile_tex_paths[tid]
-                            tex_freq[path] = tex_freq.get(path, 0) + 1
-
-                # Sort by frequency, take top 4
-                sorted_tex = sorted(tex_freq.items(), key=lambda x: -x[1])
-                final_tex_paths = [t[0] for t in sorted_tex[:4]]
+                n_tile_tex = len(tile_tex_paths)
+                tex_freq = Counter(
+                    tile_tex_paths[tid]
+                    for cl in chunk_layers.values()
+                    for tid in cl.get('texture_ids', ())
+                    if tid is not None and tid < n_tile_tex
+                )
+
+                # Take the 4 most frequent
+                final_tex_paths = [path for path, _ in tex_freq.most_common(4)]
                 if not final_tex_paths:
                     final_tex_paths = [_DEFAULT_TEXTURE_BLACK]
 
@@ -1777,40 +2095,39 @@ class TerrainSculptor:
                 for layer_idx in range(1, len(final_tex_paths)):
                     # For each chunk, try to find an alpha map for this layer
                     # Build a combined 64x64 default
-                    splat_map[layer_idx] = [[128] * 64 for _ in range(64)]
-
-                # Area IDs for this tile
-                tile_area_ids = {}
-                for chunk_row in range(_CHUNKS_PER_SIDE):
-                    for chunk_col in range(_CHUNKS_PER_SIDE):
-                        aid = area_ids.get(
-                            (tile_x, tile_y, chunk_row, chunk_col), 0
-                        )
-                        tile_area_ids[(chunk_row, chunk_col)] = aid
-
-                # Most common area_id as the tile default
-                aid_counts = {}
-                for aid in tile_area_ids.values():
-                    aid_counts[aid] = aid_counts.get(aid, 0) + 1
-                default_area_id = max(aid_counts, key=aid_counts.get) if aid_counts else 0
-
-                # Filter doodads/WMOs to this tile's world bounds
-                tile_doodads = self._filter_entries_to_tile(
-                    doodads, tile_x, tile_y
-                )
-                tile_wmos = self._filter_entries_to_tile(
-                    wmos, tile_x, tile_y
-                )
+                    splat_map[layer_idx] = _DEFAULT_SPLAT_64
+
+                # Area IDs for this tile: a copy of its 16x16 slice, so
+                # callers can't write through to the cached zone array
+                tile_area_ids = area_ids[ty, tx].copy()
+                if heightmap_format == 'list':
+                    area_id_map = dict(zip(_CHUNK_KEYS,
+                                           tile_area_ids.ravel().tolist()))
+                else:
+                    area_id_map = tile_area_ids
+
+                # Most common area_id as the tile default; ties go to the
+                # ID seen first in row-major order.  np.unique (rather than
+                # bincount) also counts negative IDs.
+                aids, first_idx, aid_counts = np.unique(
+                    tile_area_ids.ravel(), return_index=True,
+                    return_counts=True)
+                top = np.flatnonzero(aid_counts == aid_counts.max())
+                default_area_id = int(aids[top[first_idx[top].argmin()]])
+
+                # Doodads/WMOs whose world position falls in this tile
+                tile_doodads = doodad_buckets.get(key, [])
+                tile_wmos = wmo_buckets.get(key, [])
 
                 # Water for this tile
                 tile_water = water.get(key, [])
 
                 result[key] = {
-                    'heightmap': hm_list,
+                    'heightmap': hm,
                     'texture_paths': final_tex_paths,
                     'splat_map': splat_map if splat_map else None,
                     'area_id': default_area_id,
-                    'area_id_map': tile_area_ids,
+                    'area_id_map': area_id_map,
                     'doodads': tile_doodads,
                     'wmos': tile_wmos,
                     'water': tile_water,
@@ -1818,25 +2135,21 @@ class TerrainSculptor:
 
         return result
 
-    def _filter_entries_to_tile(self, entries, tile_x, tile_y):
-        """
-        Filter placement entries to those whose world position falls
-        within the given tile.
-        """
-        # Tile world bounds (WoW coordinates)
-        tile_world_x_max = MAP_SIZE_MAX - tile_y * TILE_SIZE
-        tile_world_x_min = tile_world_x_max - TILE_SIZE
-        tile_world_y_max = MAP_SIZE_MAX - tile_x * TILE_SIZE
-        tile_world_y_min = tile_world_y_max - TILE_SIZE
-
-        result = []
-        for entry in entries:
-            pos = entry.get('position', (0, 0, 0))
-            wx, wy = pos[0], pos[1]
-            if (tile_world_x_min <= wx <= tile_world_x_max and
-                    tile_world_y_min <= wy <= tile_world_y_max):
-                result.append(entry)
-        return result
+
+def _bucket_by_tile(entries):
+    """
+    Group placement entries by the ADT tile containing their world position.
+
+    Returns:
+        Dict {(tile_x, tile_y): list of entries}.
+    """
+    buckets = {}
+    for entry in entries:
+        pos = entry.get('position', (0, 0, 0))
+        tile_x = int((MAP_SIZE_MAX - pos[1]) // TILE_SIZE)
+        tile_y = int((MAP_SIZE_MAX - pos[0]) // TILE_SIZE)
+        buckets.setdefault((tile_x, tile_y), []).append(entry)
+    return buckets
 
 
 # ===================================================================
@@ -1878,32 +2191,18 @@ def sculpt_zone(zone_def):
             water       - {(tile_x, tile_y): [water region dicts]}
             area_ids    - {(tile_x, tile_y, chunk_row, chunk_col): area_id}
     """
-    sculptor = TerrainSculptor(zone_def)
-
-    heightmaps = sculptor.generate_heightmaps()
-    textures = sculptor.generate_textures(heightmaps)
-    doodads = sculptor.generate_doodads(heightmaps)
-    wmos = sculptor.generate_wmos(heightmaps)
-    water = sculptor.generate_water()
-    area_ids = sculptor.generate_area_ids()
+    return TerrainSculptor(zone_def).run_all()
 
-    return {
-        'heightmaps': heightmaps,
-        'textures': textures,
-        'doodads': doodads,
-        'wmos': wmos,
-        'water': water,
-        'area_ids': area_ids,
-    }
 
-
-def sculpt_for_adt_composer(zone_def):
+def sculpt_for_adt_composer(zone_def, heightmap_format='list'):
     """
     Convenience wrapper that runs sculpt_zone and reformats the output
     for direct consumption by adt_composer.create_adt().
 
     Args:
         zone_def: Zone definition dict (same as sculpt_zone).
+        heightmap_format: 'list' (default) or 'ndarray'; see
+            TerrainSculptor.export_for_adt_composer().
 
     Returns:
         Dict {(tile_x, tile_y): tile_data_dict} where each tile_data_dict
@@ -1911,19 +2210,73 @@ def sculpt_for_adt_composer(zone_def):
         doodads, wmos, and water.
     """
     sculptor = TerrainSculptor(zone_def)
-    return sculptor.export_for_adt_composer()
+    return sculptor.export_for_adt_composer(heightmap_format=heightmap_format)
 
 
 # ===================================================================
 # ADT Import Functions
 # ===================================================================
 
+# Results of the ADT import functions, keyed by the file's identity so an
+# edited file is re-imported (see _file_cache_key()).  Least recently used
+# entries are evicted beyond _IMPORT_CACHE_SIZE.
+_IMPORT_CACHE_SIZE = 32
+_HEIGHTMAP_CACHE = OrderedDict()
+_RULE_CACHE = OrderedDict()
+
+
+def _file_cache_key(adt_filepath):
+    """
+    Return (absolute path, st_mtime_ns, st_size) for *adt_filepath*, or
+    None if the file cannot be stat'ed (the caller then skips the cache).
+    """
+    try:
+        st = os.stat(adt_filepath)
+    except (OSError, TypeError, ValueError):
+        return None
+    return (os.path.abspath(os.fspath(adt_filepath)), st.st_mtime_ns, st.st_size)
+
+
+def _cache_get(cache, key):
+    """Look up *key* in an LRU import cache, marking it recently used."""
+    if key is None or key not in cache:
+        return None
+    cache.move_to_end(key)
+    return cache[key]
+
+
+def _cache_put(cache, key, value):
+    """Store *value* in an LRU import cache, evicting the oldest entry."""
+    if key is None:
+        return
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > _IMPORT_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _heightmap_to_array(heightmap_list):
+    """
+    Convert a rectangular list-of-lists heightmap to a float64 ndarray.
+
+    Streams the rows through np.fromiter with a known count, avoiding
+    np.array's generic nested-sequence discovery.
+    """
+    n_rows = len(heightmap_list)
+    n_cols = len(heightmap_list[0]) if n_rows else 0
+    return np.fromiter(itertools.chain.from_iterable(heightmap_list),
+                       dtype=np.float64,
+                       count=n_rows * n_cols).reshape(n_rows, n_cols)
+
+
 def import_heightmap_from_adt(adt_filepath):
     """
     Import a heightmap from an existing ADT file as a numpy array.
 
     Reads the ADT file using adt_composer.read_adt() and converts the
-    129x129 heightmap list-of-lists to a numpy ndarray.
+    129x129 heightmap list-of-lists to a numpy ndarray.  Results are cached
+    per file (path, mtime and size), so re-importing an unchanged file
+    returns a fresh copy without re-parsing.
 
     Args:
         adt_filepath: Path to the ADT file (string or path-like object).
@@ -1938,19 +2291,204 @@ def import_heightmap_from_adt(adt_filepath):
     """
     from . import adt_composer
 
+    cache_key = _file_cache_key(adt_filepath)
+    cached = _cache_get(_HEIGHTMAP_CACHE, cache_key)
+    if cached is not None:
+        return cached.copy()
+
     log.debug("Importing heightmap from ADT: %s", adt_filepath)
     adt_data = adt_composer.read_adt(adt_filepath)
 
-    heightmap_list = adt_data['heightmap']
-    heightmap = np.array(heightmap_list, dtype=np.float64)
+    heightmap = _heightmap_to_array(adt_data['heightmap'])
 
     log.debug("Imported heightmap shape: %s, range: [%.2f, %.2f]",
               heightmap.shape, float(np.min(heightmap)), float(np.max(heightmap)))
 
+    _cache_put(_HEIGHTMAP_CACHE, cache_key, heightmap.copy())
     return heightmap
 
 
-def import_texture_rules_from_adt(adt_filepath):
+def _bin_indices(values, lo, hi, bins):
+    """
+    Map every value of *values* to its bin index among *bins* equal-width
+    bins spanning [lo, hi].  Values at or beyond the edges land in the
+    first/last bin.
+    """
+    span = hi - lo
+    if span <= 0:
+        return np.zeros(values.shape, dtype=np.intp)
+    idx = ((values - lo) * (bins / span)).astype(np.intp)
+    return np.clip(idx, 0, bins - 1)
+
+
+def _histogram_percentile_ranges(hists, lo, hi, low=5.0, high=95.0):
+    """
+    Approximate the *low* and *high* percentiles of each row of *hists*
+    (counts over equal-width bins spanning [lo, hi]) from its cumulative
+    histogram.
+
+    Each cut point is the centre of the bin holding the sample at the
+    interpolated rank, so it is within half a bin width of the exact value.
+
+    Returns:
+        tuple: (low_values, high_values) float64 arrays, one entry per row.
+    """
+    cum = np.cumsum(hists, axis=1)
+    last = cum[:, -1] - 1
+    width = (hi - lo) / hists.shape[1]
+    bounds = []
+    for q in (low, high):
+        rank = np.floor(q / 100.0 * last)
+        idx = np.array([np.searchsorted(row, r, side='right')
+                        for row, r in zip(cum, rank)], dtype=np.float64)
+        bounds.append(lo + (idx + 0.5) * width)
+    return bounds[0], bounds[1]
+
+
+_TerrainStats = namedtuple(
+    '_TerrainStats', ['heightmap', 'slope_map', 'hm_min', 'hm_max', 'slope_max'])
+
+
+def _compute_terrain_stats(heightmap, slope_map=None):
+    """
+    Derive the slope map and the scalar extremes of one tile's heightmap.
+
+    Args:
+        heightmap: 2D numpy array of elevations.
+        slope_map: Optional precomputed calculate_slope(heightmap).
+
+    Returns:
+        _TerrainStats: heightmap, slope_map and hm_min/hm_max/slope_max
+        as Python floats.
+    """
+    if slope_map is None:
+        slope_map = calculate_slope(heightmap)
+    return _TerrainStats(
+        heightmap=heightmap,
+        slope_map=slope_map,
+        hm_min=float(heightmap.min()),
+        hm_max=float(heightmap.max()),
+        slope_max=float(slope_map.max()),
+    )
+
+
+def _percentile_ranges(sample_arrays, low=5.0, high=95.0):
+    """
+    Return the *low* and *high* percentiles of several 1D sample arrays.
+
+    Arrays whose samples are all equal (e.g. flat chunks) short-circuit to
+    that value.  The rest are padded with +inf into one 2D block and
+    partially ordered with a single np.partition call (introselect, no
+    full sort) at just the ranks each row's cut points need; both cut
+    points of every row are then linearly interpolated, matching
+    numpy.percentile's default method.
+
+    Args:
+        sample_arrays: Sequence of non-empty 1D arrays.
+        low: Lower percentile (0-100).
+        high: Upper percentile (0-100).
+
+    Returns:
+        tuple: (low_values, high_values) float64 arrays, one entry per input.
+    """
+    lows = np.empty(len(sample_arrays), dtype=np.float64)
+    highs = np.empty(len(sample_arrays), dtype=np.float64)
+    varying = []
+    for row, arr in enumerate(sample_arrays):
+        if arr.min() == arr.max():
+            lows[row] = highs[row] = arr[0]
+        else:
+            varying.append(row)
+    if not varying:
+        return lows, highs
+
+    counts = np.array([sample_arrays[row].size for row in varying], dtype=np.intp)
+    padded = np.full((len(varying), int(counts.max())), np.inf)
+    for k, row in enumerate(varying):
+        padded[k, :counts[k]] = sample_arrays[row]
+
+    last = counts - 1
+    ranks = []
+    for q in (low, high):
+        pos = q / 100.0 * last
+        i = pos.astype(np.intp)
+        ranks.append((pos, i, np.minimum(i + 1, last)))
+    kth = np.unique(np.concatenate([idx for _, i, j in ranks for idx in (i, j)]))
+    padded.partition(kth, axis=1)
+
+    rows = np.arange(len(varying))
+    for out, (pos, i, j) in zip((lows, highs), ranks):
+        lo_val = padded[rows, i]
+        out[varying] = lo_val + (padded[rows, j] - lo_val) * (pos - i)
+    return lows, highs
+
+
+def _accumulate_alpha_samples(heightmap, slope_map, alpha_stack, vr_starts,
+                              vc_starts, threshold, out_elev, out_slope, counts):
+    """
+    Copy the elevation/slope under every alpha cell >= *threshold* of a
+    stack of chunks into *out_elev*/*out_slope*.
+
+    Chunk i writes into its own 64*64 slot starting at i*64*64 and records
+    its sample count in counts[i], so chunks are independent and the outer
+    loop runs as a numba prange across cores.  Plain-loop kernel compiled
+    with numba when available; see _infer_rules_from_arrays() for the
+    numpy equivalent.
+    """
+    cells = alpha_stack.shape[1] * alpha_stack.shape[2]
+    for i in _prange(alpha_stack.shape[0]):
+        base = i * cells
+        n = 0
+        for alpha_row in range(alpha_stack.shape[1]):
+            hm_row = vr_starts[i] + (alpha_row * 8) // 64
+            for alpha_col in range(alpha_stack.shape[2]):
+                if alpha_stack[i, alpha_row, alpha_col] >= threshold:
+                    hm_col = vc_starts[i] + (alpha_col * 8) // 64
+                    out_elev[base + n] = heightmap[hm_row, hm_col]
+                    out_slope[base + n] = slope_map[hm_row, hm_col]
+                    n += 1
+        counts[i] = n
+
+
+if _HAS_NUMBA:
+    _accumulate_alpha_samples = _njit(cache=True, fastmath=True, parallel=True)(
+        _accumulate_alpha_samples)
+
+
+def _collect_layer_samples(heightmap, slope_map, layer_alphas, threshold):
+    """
+    Run _accumulate_alpha_samples() over all chunks of one texture layer.
+
+    Args:
+        heightmap: 2D float64 array of the tile's heights.
+        slope_map: Matching 2D slope array.
+        layer_alphas: {(chunk_row, chunk_col): 64x64 alpha map}.
+        threshold: Minimum alpha for a cell to count as active.
+
+    Returns:
+        tuple: (elevations, slopes) 1D float64 arrays in chunk order.
+    """
+    keys = np.array(list(layer_alphas), dtype=np.intp).reshape(-1, 2) * 8
+    alpha_stack = np.stack(list(layer_alphas.values()))
+    n_chunks = len(keys)
+    cells = _ALPHA_RES * _ALPHA_RES
+    out_elev = np.empty(n_chunks * cells, dtype=np.float64)
+    out_slope = np.empty(n_chunks * cells, dtype=np.float64)
+    counts = np.zeros(n_chunks, dtype=np.intp)
+
+    _accumulate_alpha_samples(heightmap, slope_map, alpha_stack,
+                              np.ascontiguousarray(keys[:, 0]),
+                              np.ascontiguousarray(keys[:, 1]),
+                              threshold, out_elev, out_slope, counts)
+
+    # Compact each chunk's written prefix, keeping chunk order
+    keep = np.arange(cells) < counts[:, None]
+    return (out_elev.reshape(n_chunks, cells)[keep],
+            out_slope.reshape(n_chunks, cells)[keep])
+
+
+def import_texture_rules_from_adt(adt_filepath, histogram_bins=None,
+                                  heightmap=None, slope_map=None):
     """
     Analyze an existing ADT file and infer texture painting rules.
 
@@ -1958,9 +2496,22 @@ def import_texture_rules_from_adt(adt_filepath):
     weights with heightmap elevation and computed slope values.  This
     produces elevation and slope range rules that approximate the
     original texture painting, suitable for use with TexturePainter.
+    Like import_heightmap_from_adt(), results are cached per file unless
+    heightmap is supplied.
 
     Args:
         adt_filepath: Path to the ADT file (string or path-like object).
+        histogram_bins: Optional bin count.  When given, per-layer samples
+            are accumulated into fixed-size elevation/slope histograms
+            instead of being collected, and the 5th/95th percentile cut
+            points are read from the cumulative histograms (bin centres).
+            This bounds memory at the cost of up to half a bin of error.
+            Default None computes exact percentiles.
+        heightmap: Optional 2D array of this ADT's heights the caller
+            already holds (e.g. from import_heightmap_from_adt()); skips
+            converting the parsed heightmap again.
+        slope_map: Optional precomputed calculate_slope(heightmap); only
+            used together with heightmap.
 
     Returns:
         dict: {
@@ -1973,17 +2524,62 @@ def import_texture_rules_from_adt(adt_filepath):
 
     Raises:
         ImportError: If the parent ADTFile library is not available.
-        ValueError: If the ADT file cannot be parsed.
+        ValueError: If the ADT file cannot be parsed, or histogram_bins is
+            not a positive integer.
     """
     from . import adt_composer
 
+    if histogram_bins is not None and (
+            not isinstance(histogram_bins, int) or histogram_bins < 1):
+        raise ValueError(
+            "histogram_bins must be a positive integer, got {!r}".format(
+                histogram_bins))
+
+    # Only file-derived results are cached; caller-supplied arrays bypass it
+    cache_key = None
+    if heightmap is None:
+        cache_key = _file_cache_key(adt_filepath)
+        if cache_key is not None:
+            cache_key += (histogram_bins,)
+        cached = _cache_get(_RULE_CACHE, cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
     log.debug("Importing texture rules from ADT: %s", adt_filepath)
     adt_data = adt_composer.read_adt(adt_filepath)
 
-    heightmap = np.array(adt_data['heightmap'], dtype=np.float64)
-    slope_map = calculate_slope(heightmap)
-    texture_paths = adt_data['texture_paths']
-    splat_data = adt_data['splat_map']
+    if heightmap is None:
+        heightmap = _heightmap_to_array(adt_data['heightmap'])
+        slope_map = None
+    else:
+        heightmap = np.asarray(heightmap, dtype=np.float64)
+
+    rules = _infer_rules_from_arrays(heightmap, slope_map,
+                                     adt_data['texture_paths'],
+                                     adt_data['splat_map'],
+                                     histogram_bins=histogram_bins)
+    _cache_put(_RULE_CACHE, cache_key, copy.deepcopy(rules))
+    return rules
+
+
+def _infer_rules_from_arrays(heightmap, slope_map, texture_paths, splat_data,
+                             histogram_bins=None):
+    """
+    Infer per-layer elevation/slope rules from already-loaded tile data.
+
+    Args:
+        heightmap: 2D float64 array of the tile's heights.
+        slope_map: calculate_slope(heightmap), or None to compute it.
+        texture_paths: List of texture paths, one per layer.
+        splat_data: {layer_idx: {(chunk_row, chunk_col): 64x64 alpha}}.
+        histogram_bins: See import_texture_rules_from_adt().
+
+    Returns:
+        dict: Same structure as import_texture_rules_from_adt().
+    """
+    stats = _compute_terrain_stats(heightmap, slope_map)
+    heightmap = stats.heightmap
+    slope_map = stats.slope_map
 
     # Alpha weight threshold: only consider cells where the alpha is
     # above this value as "active" for the texture layer.
@@ -1997,84 +2593,156 @@ def import_texture_rules_from_adt(adt_filepath):
     if texture_paths:
         elevation_rules.append({
             'texture': texture_paths[0],
-            'min_elevation': float(np.min(heightmap)),
-            'max_elevation': float(np.max(heightmap)),
+            'min_elevation': stats.hm_min,
+            'max_elevation': stats.hm_max,
         })
         slope_rules.append({
             'texture': texture_paths[0],
             'min_slope': 0.0,
-            'max_slope': float(np.max(slope_map)),
+            'max_slope': stats.slope_max,
         })
 
     # For layers 1+, analyze correlation with per-chunk alpha maps.
-    for layer_idx in range(1, len(texture_paths)):
-        per_chunk_alphas = splat_data.get(layer_idx, {})
-
-        if not per_chunk_alphas:
-            # No alpha data for this layer; use defaults
-            elevation_rules.append({
-                'texture': texture_paths[layer_idx],
-                'min_elevation': float(np.min(heightmap)),
-                'max_elevation': float(np.max(heightmap)),
-            })
-            slope_rules.append({
-                'texture': texture_paths[layer_idx],
-                'min_slope': 0.0,
-                'max_slope': float(np.max(slope_map)),
-            })
+    alpha_layers = [layer_idx for layer_idx in range(1, len(texture_paths))
+                    if splat_data.get(layer_idx)]
+
+    if histogram_bins:
+        # Per-layer elevation/slope histograms; the chunks gather bin
+        # indices instead of raw values.
+        elev_hist = np.zeros((len(alpha_layers), histogram_bins), dtype=np.int64)
+        slope_hist = np.zeros((len(alpha_layers), histogram_bins), dtype=np.int64)
+        elev_src = _bin_indices(heightmap, stats.hm_min, stats.hm_max,
+                                histogram_bins)
+        slope_src = _bin_indices(slope_map, 0.0, stats.slope_max,
+                                 histogram_bins)
+    elif _HAS_NUMBA:
+        # Compiled kernel: all chunks of a layer are sampled in one
+        # parallel call, so the per-chunk walk below is skipped.
+        elev_bufs = []
+        slope_bufs = []
+        for layer_idx in alpha_layers:
+            elev, slope = _collect_layer_samples(
+                heightmap, slope_map, splat_data[layer_idx], alpha_threshold)
+            elev_bufs.append(elev)
+            slope_bufs.append(slope)
+        cursors = [buf.size for buf in elev_bufs]
+    else:
+        # Per-layer elevation/slope sample buffers, sized for the worst case
+        # (every cell of every chunk the layer covers)
+        elev_bufs = []
+        slope_bufs = []
+        for layer_idx in alpha_layers:
+            max_samples = len(splat_data[layer_idx]) * _ALPHA_RES * _ALPHA_RES
+            elev_bufs.append(np.empty(max_samples, dtype=np.float64))
+            slope_bufs.append(np.empty(max_samples, dtype=np.float64))
+        cursors = [0] * len(alpha_layers)
+        elev_src = heightmap
+        slope_src = slope_map
+
+    # Walk each chunk once and sample all of its layers together, so the
+    # chunk's heightmap window is gathered a single time.
+    if _HAS_NUMBA and not histogram_bins:
+        chunk_keys = ()
+    else:
+        chunk_keys = dict.fromkeys(
+            key for layer_idx in alpha_layers for key in splat_data[layer_idx]
+        )
+    no_alpha = np.zeros((_ALPHA_RES, _ALPHA_RES), dtype=np.int32)
+
+    for chunk_row, chunk_col in chunk_keys:
+        # np.stack takes ndarray alpha maps as-is and converts nested lists
+        # once, straight into the stacked block.
+        alpha_stack = np.stack([
+            splat_data[layer_idx].get((chunk_row, chunk_col), no_alpha)
+            for layer_idx in alpha_layers
+        ])
+
+        # One threshold comparison per chunk: the (layers, 64, 64) mask
+        # gives each layer's sample count, lets layers (and whole chunks)
+        # with no active cell skip the heightmap, and selects the samples.
+        masks = alpha_stack >= alpha_threshold
+        counts = np.count_nonzero(masks.reshape(len(alpha_layers), -1), axis=1)
+        active = np.flatnonzero(counts)
+        if not active.size:
             continue
 
-        # Collect elevation and slope samples weighted by alpha
-        weighted_elevations = []
-        weighted_slopes = []
-
-        for (chunk_row, chunk_col), alpha_2d in per_chunk_alphas.items():
-            # The outer vertices for this chunk span rows
-            # [chunk_row*8 .. chunk_row*8+8] and cols [chunk_col*8 .. chunk_col*8+8]
-            # in the 129x129 heightmap.  The alpha map is 64x64 per chunk.
-            vr_start = chunk_row * 8
-            vc_start = chunk_col * 8
-
-            for alpha_row in range(64):
-                for alpha_col in range(64):
-                    alpha_val = alpha_2d[alpha_row][alpha_col]
-                    if alpha_val < alpha_threshold:
-                        continue
-
-                    # Map alpha cell to heightmap coordinates
-                    # 64 alpha cells cover the 8 vertex intervals of a chunk
-                    hm_row = vr_start + int(alpha_row * 8.0 / 64.0)
-                    hm_col = vc_start + int(alpha_col * 8.0 / 64.0)
-                    hm_row = min(hm_row, _HEIGHTMAP_RES - 1)
-                    hm_col = min(hm_col, _HEIGHTMAP_RES - 1)
-
-                    weighted_elevations.append(float(heightmap[hm_row, hm_col]))
-                    weighted_slopes.append(float(slope_map[hm_row, hm_col]))
-
-        if weighted_elevations:
-            elev_arr = np.array(weighted_elevations)
-            slope_arr = np.array(weighted_slopes)
+        # The outer vertices for this chunk span rows
+        # [chunk_row*8 .. chunk_row*8+8] and cols [chunk_col*8 .. chunk_col*8+8]
+        # in the 129x129 heightmap.  The alpha map is 64x64 per chunk.
+        # The largest index reached is 15*8 + 7 = 127, so no clamp.
+        # Gather from the chunk's own 8x8 vertex tile, which all of this
+        # chunk's layers then share while it is still hot in cache.
+        vr, vc = chunk_row * 8, chunk_col * 8
+        elev_block = elev_src[vr:vr + 8, vc:vc + 8][_ALPHA_TILE_IDX]
+        slope_block = slope_src[vr:vr + 8, vc:vc + 8][_ALPHA_TILE_IDX]
+
+        for li in active:
+            mask = masks[li]
+            if histogram_bins:
+                elev_hist[li] += np.bincount(elev_block[mask],
+                                             minlength=histogram_bins)
+                slope_hist[li] += np.bincount(slope_block[mask],
+                                              minlength=histogram_bins)
+                continue
+            cursor = cursors[li]
+            k = counts[li]
+            elev_bufs[li][cursor:cursor + k] = elev_block[mask]
+            slope_bufs[li][cursor:cursor + k] = slope_block[mask]
+            cursors[li] = cursor + k
+
+    # Percentile cut points for every sampled layer, elevation and slope
+    # together
+    if histogram_bins:
+        sampled = np.flatnonzero(elev_hist.sum(axis=1)).tolist()
+    else:
+        sampled = [li for li in range(len(alpha_layers)) if cursors[li]]
+
+    cutoffs = {}
+    if sampled:
+        if histogram_bins:
+            elev_lo, elev_hi = _histogram_percentile_ranges(
+                elev_hist[sampled], stats.hm_min, stats.hm_max)
+            slope_lo, slope_hi = _histogram_percentile_ranges(
+                slope_hist[sampled], 0.0, stats.slope_max)
+            lows = np.concatenate([elev_lo, slope_lo])
+            highs = np.concatenate([elev_hi, slope_hi])
+        else:
+            # One batched partition over all layers' samples
+            lows, highs = _percentile_ranges(
+                [elev_bufs[li][:cursors[li]] for li in sampled]
+                + [slope_bufs[li][:cursors[li]] for li in sampled])
+        # One bulk conversion to Python floats for the output dicts
+        lows = lows.tolist()
+        highs = highs.tolist()
+        n_sampled = len(sampled)
+        for k, li in enumerate(sampled):
+            cutoffs[alpha_layers[li]] = (
+                lows[k], highs[k], lows[n_sampled + k], highs[n_sampled + k])
+
+    for layer_idx in range(1, len(texture_paths)):
+        if layer_idx in cutoffs:
+            elev_lo, elev_hi, slope_lo, slope_hi = cutoffs[layer_idx]
             elevation_rules.append({
                 'texture': texture_paths[layer_idx],
-                'min_elevation': float(np.percentile(elev_arr, 5)),
-                'max_elevation': float(np.percentile(elev_arr, 95)),
+                'min_elevation': elev_lo,
+                'max_elevation': elev_hi,
             })
             slope_rules.append({
                 'texture': texture_paths[layer_idx],
-                'min_slope': float(np.percentile(slope_arr, 5)),
-                'max_slope': float(np.percentile(slope_arr, 95)),
+                'min_slope': slope_lo,
+                'max_slope': slope_hi,
             })
         else:
-            # No active samples; use full range as fallback
+            # No alpha data or no active samples; use full range as fallback
             elevation_rules.append({
                 'texture': texture_paths[layer_idx],
-                'min_elevation': float(np.min(heightmap)),
-                'max_elevation': float(np.max(heightmap)),
+                'min_elevation': stats.hm_min,
+                'max_elevation': stats.hm_max,
             })
             slope_rules.append({
                 'texture': texture_paths[layer_idx],
                 'min_slope': 0.0,
-                'max_slope': float(np.max(slope_map)),
+                'max_slope': stats.slope_max,
             })
 
     log.debug("Inferred %d elevation rules and %d slope rules",
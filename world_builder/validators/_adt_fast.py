@@ -0,0 +1,177 @@
+"""
+Compiled MCNK scan kernel for the ADT validator.
+
+Parses the sub-chunks of every MCNK of a tile and gathers the per-MCNK
+counts of adt_validator._scan_mcnks() in one JIT-compiled pass over a
+uint8 view of the file, without building per-MCNK Python objects.
+
+Dependencies:
+    numpy  - required
+    numba  - optional; without it _HAS_NUMBA is False and the validator
+             uses its pure-Python scan instead
+"""
+
+import numpy as np
+
+try:
+    from numba import njit as _njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+# Sub-chunk magics as little-endian u32 (the on-disk reversed byte order)
+_M_MCVT = int.from_bytes(b'TVCM', 'little')
+_M_MCNR = int.from_bytes(b'RNCM', 'little')
+_M_MCLY = int.from_bytes(b'YLCM', 'little')
+_M_MCAL = int.from_bytes(b'LACM', 'little')
+_M_MCRF = int.from_bytes(b'FRCM', 'little')
+_M_MCSH = int.from_bytes(b'HSCM', 'little')
+_M_MCSE = int.from_bytes(b'ESCM', 'little')
+_M_MCCV = int.from_bytes(b'VCCM', 'little')
+_M_MCLV = int.from_bytes(b'VLCM', 'little')
+
+_MCNK_HEADER_SIZE = 128
+_CHUNK_HEADER_SIZE = 8
+_NORMALS_PADDING = 13
+_HEIGHTS_PER_CHUNK = 145
+_NORMALS_SIZE = 145 * 3
+_MCAL_LAYER_SIZE = 4096
+_F32_ABS_MASK = 0x7FFFFFFF
+_HEIGHT_MAX_BITS = 0x45000000     # float32 bit pattern of 2048.0
+
+# Slots of the counts array, in adt_validator._MCNKScan field order
+N_COUNTS = 9
+
+
+def _u32(buf, pos):
+    """Little-endian u32 at *pos* of a uint8 array."""
+    return (np.uint32(buf[pos])
+            | (np.uint32(buf[pos + 1]) << np.uint32(8))
+            | (np.uint32(buf[pos + 2]) << np.uint32(16))
+            | (np.uint32(buf[pos + 3]) << np.uint32(24)))
+
+
+def _is_sub_magic(m):
+    """True for every sub-chunk magic the validator recognises."""
+    return (m == _M_MCVT or m == _M_MCNR or m == _M_MCLY or m == _M_MCAL
+            or m == _M_MCRF or m == _M_MCSH or m == _M_MCSE
+            or m == _M_MCCV or m == _M_MCLV)
+
+
+def _scan_mcnks(buf, mcnk_starts, mcnk_ends, n_textures, counts):
+    """
+    Accumulate the per-MCNK counts of a tile into *counts*.
+
+    Mirrors adt_validator._parse_mcnk_sub_chunks(tolerant=True) followed
+    by the pure-Python _scan_mcnks() loop, byte for byte.
+
+    Args:
+        buf: uint8 view of the whole file.
+        mcnk_starts, mcnk_ends: int64 arrays delimiting each MCNK payload.
+        n_textures: Number of MTEX paths.
+        counts: int64 array of N_COUNTS zeros, filled in place.
+    """
+    n = buf.shape[0]
+    for i in range(mcnk_starts.shape[0]):
+        mcnk_start = mcnk_starts[i]
+        mcnk_end = mcnk_ends[i]
+        has_mcvt = False
+        has_mcnr = False
+        has_mcly = False
+        has_mcal = False
+        mcly_size = 0
+        mcal_size = 0
+
+        if mcnk_end - mcnk_start >= _MCNK_HEADER_SIZE:
+            pos = mcnk_start + _MCNK_HEADER_SIZE
+            while pos + _CHUNK_HEADER_SIZE <= mcnk_end:
+                magic = _u32(buf, pos)
+                if not _is_sub_magic(magic):
+                    # Resynchronise on the next b'CM' suffix
+                    j = pos + 3
+                    while j + 1 < mcnk_end:
+                        if buf[j] == 0x43 and buf[j + 1] == 0x4D:
+                            break
+                        j += 1
+                    if j + 1 >= mcnk_end:
+                        break
+                    pos = j - 2
+                    continue
+
+                data_start = pos + _CHUNK_HEADER_SIZE
+                data_end = data_start + np.int64(_u32(buf, pos + 4))
+                ss = data_start
+                se = min(data_end, mcnk_end)
+                size = se - ss
+
+                if magic == _M_MCVT:
+                    has_mcvt = True
+                    n_heights = size // 4
+                    if n_heights != _HEIGHTS_PER_CHUNK:
+                        counts[4] += 1
+                    for k in range(min(n_heights, _HEIGHTS_PER_CHUNK)):
+                        bits = _u32(buf, ss + 4 * k)
+                        if (bits & _F32_ABS_MASK) > _HEIGHT_MAX_BITS:
+                            counts[5] += 1
+                            break
+                elif magic == _M_MCNR:
+                    has_mcnr = True
+                    if size < _NORMALS_SIZE:
+                        counts[6] += 1
+                elif magic == _M_MCLY:
+                    has_mcly = True
+                    mcly_size = size
+                    for k in range(size // 16):
+                        if _u32(buf, ss + 16 * k) >= n_textures:
+                            counts[7] += 1
+                elif magic == _M_MCAL:
+                    has_mcal = True
+                    mcal_size = size
+
+                pos = data_end
+                # After MCNR, skip the 13 padding bytes unless a valid
+                # sub-chunk already starts at the declared end
+                if magic == _M_MCNR:
+                    if pos + 4 > n or not _is_sub_magic(_u32(buf, pos)):
+                        pos += _NORMALS_PADDING
+
+        if not has_mcvt:
+            counts[0] += 1
+        if not has_mcnr:
+            counts[1] += 1
+        if not has_mcly:
+            counts[2] += 1
+        if has_mcly and has_mcal:
+            expected = max(0, mcly_size // 16 - 1) * _MCAL_LAYER_SIZE
+            if mcal_size != expected:
+                counts[3] += 1
+                if mcly_size and mcal_size:
+                    counts[8] += 1
+
+
+if _HAS_NUMBA:
+    _u32 = _njit(cache=True, inline='always')(_u32)
+    _is_sub_magic = _njit(cache=True, inline='always')(_is_sub_magic)
+    _scan_mcnks = _njit(cache=True)(_scan_mcnks)
+
+
+def scan_mcnks(data, mcnk_chunks, n_textures):
+    """
+    Run the compiled scan over a mapped ADT.
+
+    Args:
+        data: File buffer (mmap or bytes).
+        mcnk_chunks: (offset, start, end) entries of the tile's MCNKs.
+        n_textures: Number of MTEX paths.
+
+    Returns:
+        List of N_COUNTS ints in adt_validator._MCNKScan field order.
+    """
+    counts = np.zeros(N_COUNTS, dtype=np.int64)
+    if mcnk_chunks:
+        bounds = np.array([(start, end) for _offset, start, end
+                           in mcnk_chunks], dtype=np.int64)
+        buf = np.frombuffer(data, dtype=np.uint8)
+        _scan_mcnks(buf, bounds[:, 0], bounds[:, 1], n_textures, counts)
+    return counts.tolist()
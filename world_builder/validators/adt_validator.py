@@ -9,10 +9,18 @@ Validates:
 - Doodad/WMO references (MMDX, MMID, MWMO, MWID, MDDF, MODF)
 """
 
+import mmap
 import os
+import stat
 import struct
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
 
 from ..qa_validator import ValidationResult, ValidationSeverity
+from . import _adt_fast
 
 
 # ---------------------------------------------------------------------------
@@ -28,10 +36,26 @@ _MCNK_HEADER_SIZE = 128
 _CHUNK_HEADER_SIZE = 8      # 4 magic + 4 size
 _MCAL_LAYER_SIZE = 4096     # 64x64 highres uncompressed alpha
 
+# Below this many tiles ADTs are validated serially even when worker
+# processes are requested; the cost of starting them outweighs the
+# per-tile work.
+_PARALLEL_MIN_TILES = 8
+
+# Readahead hint for mapped ADTs (mmap.madvise needs Python 3.8+ and is
+# not available on every platform)
+_MADV_WILLNEED = (getattr(mmap, 'MADV_WILLNEED', None)
+                  if hasattr(mmap.mmap, 'madvise') else None)
+
 # Height range limits (in yards)
 _HEIGHT_MIN = -2048.0
 _HEIGHT_MAX = 2048.0
 
+# The range is symmetric, so a height is valid iff abs(h) <= _HEIGHT_MAX.
+# On the raw IEEE-754 bits that is (bits & _F32_ABS_MASK) <= the bit
+# pattern of _HEIGHT_MAX; +/-inf and NaN sort above it and fail as well.
+_F32_ABS_MASK = np.uint32(0x7FFFFFFF)
+_HEIGHT_MAX_BITS = np.float32(_HEIGHT_MAX).view(np.uint32)
+
 # Reversed chunk magics
 _MAGIC_MVER = b'REVM'
 _MAGIC_MHDR = b'RDHM'
@@ -49,6 +73,25 @@ _MAGIC_MCNR = b'RNCM'
 _MAGIC_MCLY = b'YLCM'
 _MAGIC_MCAL = b'LACM'
 
+# Known valid sub-chunk magics within MCNK
+_VALID_SUB_MAGICS = frozenset((
+    _MAGIC_MCVT, _MAGIC_MCNR, _MAGIC_MCLY, _MAGIC_MCAL,
+    b'FRCM',  # MCRF
+    b'HSCM',  # MCSH
+    b'ESCM',  # MCSE
+    b'VCCM',  # MCCV
+    b'VLCM',  # MCLV
+))
+
+# First bytes of every chunk magic an ADT may contain (the reversed magics
+# above plus MH2O, MFBO and MTXF).  A top-level header starting with any
+# other byte cannot be a chunk, so its size field is not trusted.
+_MAGIC_FIRST_BYTES = frozenset(b'RNXDOFKTYLHEV')
+
+# Precompiled layouts, shared by every parse
+_U32 = struct.Struct('<I')
+_CHUNK_HDR = struct.Struct('<4sI')     # magic, payload size
+
 
 # ---------------------------------------------------------------------------
 # ADT chunk parser
@@ -58,87 +101,299 @@ def _read_chunks(data):
     """
     Parse all top-level chunks from ADT binary data.
 
-    Returns list of (magic, offset, size, data_bytes) tuples.
+    Chunks are described by offsets into *data* rather than copied out;
+    consumers read payloads in place (e.g. _U32.unpack_from(data,
+    data_start)).
+
+    Parsing stops at the first header whose magic cannot start a known
+    chunk, rather than hopping through corrupted data on garbage sizes.
+
+    Returns list of (magic, offset, data_start, data_end) tuples, with
+    data_end clamped to the end of *data*.
     """
     chunks = []
     pos = 0
-    while pos + _CHUNK_HEADER_SIZE <= len(data):
-        magic = data[pos:pos + 4]
-        if len(magic) < 4:
+    n = len(data)
+    read_header = _CHUNK_HDR.unpack_from
+    while pos + _CHUNK_HEADER_SIZE <= n:
+        if data[pos] not in _MAGIC_FIRST_BYTES:
             break
-        size = struct.unpack_from('<I', data, pos + 4)[0]
+        magic, size = read_header(data, pos)
         data_start = pos + _CHUNK_HEADER_SIZE
         data_end = data_start + size
-        chunk_data = data[data_start:min(data_end, len(data))]
-        chunks.append((magic, pos, size, chunk_data))
+        chunks.append((magic, pos, data_start, min(data_end, n)))
         pos = data_end
     return chunks
 
 
+def _index_chunks(chunks):
+    """
+    Group parsed chunks (top-level or MCNK sub-chunks) by magic.
+
+    Returns:
+        dict: {magic: [(offset, data_start, data_end), ...]} in file order,
+        so checks look up the magics they need directly instead of
+        scanning the whole chunk list.
+    """
+    by_magic = {}
+    for magic, offset, start, end in chunks:
+        by_magic.setdefault(magic, []).append((offset, start, end))
+    return by_magic
+
+
 def _find_chunk(chunks, magic):
-    """Find first chunk matching magic. Returns (offset, size, data) or None."""
-    for m, offset, size, data in chunks:
-        if m == magic:
-            return (offset, size, data)
-    return None
+    """
+    Find first chunk matching magic in an _index_chunks() dict.
+
+    Returns (offset, start, end) or None.
+    """
+    found = chunks.get(magic)
+    return found[0] if found else None
 
 
 def _find_all_chunks(chunks, magic):
-    """Find all chunks matching magic."""
-    return [(offset, size, data) for m, offset, size, data in chunks
-            if m == magic]
+    """Find all chunks matching magic in an _index_chunks() dict."""
+    return chunks.get(magic, [])
+
 
+def _payload_size(found):
+    """Payload length of an (offset, start, end) chunk entry."""
+    return found[2] - found[1]
 
-def _parse_mcnk_sub_chunks(mcnk_data):
+
+def _parse_mcnk_sub_chunks(data, mcnk_start, mcnk_end, tolerant=False):
     """
     Parse sub-chunks within an MCNK chunk (after the 128-byte header).
 
+    *mcnk_start*/*mcnk_end* delimit the MCNK payload within *data*; the
+    returned offsets are absolute positions in *data* as well.
+
     Handles the special case of MCNR which has 13 padding bytes after its
     declared data size. These padding bytes are not part of MCNR's size
-    field but are present in the data stream.
+    field but are present in the data stream; they are stepped over
+    directly unless a valid sub-chunk already starts at the declared end.
+
+    Declared sizes are trusted, and parsing stops at the first unknown
+    magic.  With *tolerant* set, unknown bytes are instead skipped until
+    the next valid sub-chunk magic, to recover what follows a corrupted
+    region.
+
+    Returns list of (magic, offset, data_start, data_end) tuples.
     """
-    if len(mcnk_data) < _MCNK_HEADER_SIZE:
+    if mcnk_end - mcnk_start < _MCNK_HEADER_SIZE:
         return []
-    interior = mcnk_data[_MCNK_HEADER_SIZE:]
-
-    # Known valid sub-chunk magics within MCNK
-    _VALID_SUB_MAGICS = {
-        _MAGIC_MCVT, _MAGIC_MCNR, _MAGIC_MCLY, _MAGIC_MCAL,
-        b'FRCM',  # MCRF
-        b'HSCM',  # MCSH
-        b'ESCM',  # MCSE
-        b'VCCM',  # MCCV
-        b'VLCM',  # MCLV
-    }
 
     chunks = []
-    pos = 0
-    while pos + _CHUNK_HEADER_SIZE <= len(interior):
-        magic = interior[pos:pos + 4]
-        if len(magic) < 4:
-            break
+    read_header = _CHUNK_HDR.unpack_from
+    pos = mcnk_start + _MCNK_HEADER_SIZE
+    while pos + _CHUNK_HEADER_SIZE <= mcnk_end:
+        magic, size = read_header(data, pos)
 
-        # Skip over bytes that are not valid chunk magics
-        # (handles MCNR padding and other alignment issues)
         if magic not in _VALID_SUB_MAGICS:
-            pos += 1
+            if not tolerant:
+                break
+            # Resynchronise on the next valid magic.  Every valid
+            # sub-chunk magic ends in b'CM', so jump straight to the next
+            # occurrence of that suffix instead of stepping byte by byte.
+            suffix = data.find(b'CM', pos + 3, mcnk_end)
+            if suffix < 0:
+                break
+            pos = suffix - 2
             continue
 
-        size = struct.unpack_from('<I', interior, pos + 4)[0]
         data_start = pos + _CHUNK_HEADER_SIZE
         data_end = data_start + size
-        chunk_data = interior[data_start:min(data_end, len(interior))]
-        chunks.append((magic, pos, size, chunk_data))
+        chunks.append((magic, pos, data_start, min(data_end, mcnk_end)))
 
-        # After MCNR, skip an additional 13 padding bytes
-        if magic == _MAGIC_MCNR:
-            pos = data_end + _NORMALS_PADDING
-        else:
-            pos = data_end
+        pos = data_end
+        # After MCNR, skip the 13 padding bytes (writers that count them
+        # in the MCNR size are followed directly by the next sub-chunk)
+        if (magic == _MAGIC_MCNR
+                and data[pos:pos + 4] not in _VALID_SUB_MAGICS):
+            pos += _NORMALS_PADDING
 
     return chunks
 
 
+def _read_mtex(data, mtex, max_paths=4):
+    """
+    Count the texture paths in an MTEX chunk (null-terminated strings
+    concatenated) and decode the first few of them.
+
+    Args:
+        data: File buffer.
+        mtex: (offset, start, end) of the MTEX chunk, or None.
+        max_paths: How many paths to decode for reporting.
+
+    Returns:
+        (n_textures, first_paths) tuple.
+    """
+    if mtex is None:
+        return 0, []
+    _offset, mtex_start, mtex_end = mtex
+    mtex_data = data[mtex_start:mtex_end]
+
+    # A path ends at every NUL that directly follows a non-NUL byte;
+    # bytes after the last NUL are unterminated and ignored.
+    nul = np.frombuffer(mtex_data, dtype=np.uint8) == 0
+    n_textures = int(np.count_nonzero(nul[1:] & ~nul[:-1]))
+
+    first_paths = []
+    pos = 0
+    while len(first_paths) < max_paths:
+        end = mtex_data.find(b'\x00', pos)
+        if end == -1:
+            break
+        if end > pos:
+            first_paths.append(
+                mtex_data[pos:end].decode('ascii', errors='replace'))
+        pos = end + 1
+    return n_textures, first_paths
+
+
+# Per-file MCNK counts gathered by _scan_mcnks()
+_MCNKScan = namedtuple('_MCNKScan', [
+    'missing_mcvt',     # ADT-004
+    'missing_mcnr',     # ADT-004
+    'mcly_missing',     # ADT-005
+    'mcal_mismatch',    # ADT-006
+    'bad_mcvt',         # ADT-HM-001
+    'out_of_range',     # ADT-HM-002
+    'bad_mcnr',         # ADT-HM-003
+    'bad_indices',      # ADT-TEX-002
+    'bad_alpha',        # ADT-TEX-003
+])
+
+
+def _scan_mcnks(data, mcnk_chunks, n_textures):
+    """
+    Compute every per-MCNK count used by the structure, heightmap and
+    texture checks in a single pass over the MCNKs.
+
+    With numba available the sub-chunk parse and all counts run in the
+    compiled _adt_fast kernel; otherwise each MCNK's sub-chunks are parsed
+    and indexed here.  Both paths give identical counts.
+
+    Args:
+        data: File buffer.
+        mcnk_chunks: (offset, start, end) entries of the tile's MCNKs.
+        n_textures: Number of MTEX paths, for the MCLY index check.
+
+    Returns:
+        _MCNKScan of counts; the validators only turn these into results.
+    """
+    if _adt_fast._HAS_NUMBA:
+        return _MCNKScan(*_adt_fast.scan_mcnks(data, mcnk_chunks, n_textures))
+
+    missing_mcvt = missing_mcnr = mcly_missing = mcal_mismatch = 0
+    bad_mcvt = out_of_range = bad_mcnr = bad_indices = bad_alpha = 0
+    mcvt_size = _HEIGHTS_PER_CHUNK * 4
+    normals_size = _NORMALS_PER_CHUNK * 3
+
+    for _offset, start, end in mcnk_chunks:
+        # Parsing is tolerant so sub-chunks behind a corrupted region are
+        # still reported on; the resync only runs on an unknown magic.
+        subs = _index_chunks(
+            _parse_mcnk_sub_chunks(data, start, end, tolerant=True))
+        mcvt_info = subs.get(_MAGIC_MCVT)
+        mcnr_info = subs.get(_MAGIC_MCNR)
+        mcly_info = subs.get(_MAGIC_MCLY)
+        mcal_info = subs.get(_MAGIC_MCAL)
+
+        if mcvt_info is None:
+            missing_mcvt += 1
+        else:
+            for _so, ss, se in mcvt_info:
+                # 145 float values; a well-formed MCVT is exactly
+                # mcvt_size bytes, so only odd sizes pay for the count
+                if se - ss == mcvt_size:
+                    n_heights = _HEIGHTS_PER_CHUNK
+                else:
+                    n_heights = (se - ss) // 4
+                    if n_heights != _HEIGHTS_PER_CHUNK:
+                        bad_mcvt += 1
+
+                # Height range (counted per chunk, not per vertex),
+                # checked as integer compares on the raw float bits
+                raw = np.frombuffer(data, dtype='<u4', offset=ss,
+                                    count=min(n_heights, _HEIGHTS_PER_CHUNK))
+                if ((raw & _F32_ABS_MASK) > _HEIGHT_MAX_BITS).any():
+                    out_of_range += 1
+
+        if mcnr_info is None:
+            missing_mcnr += 1
+        else:
+            for _so, ss, se in mcnr_info:
+                # 145 normals (3 bytes each)
+                if se - ss < normals_size:
+                    bad_mcnr += 1
+
+        if mcly_info is None:
+            mcly_missing += 1
+        else:
+            for _so, ss, se in mcly_info:
+                # The texture ID is the first uint32 of each 16-byte entry;
+                # a stride-4 view over the entries gathers all of them.
+                n_layers = (se - ss) // 16
+                tex_ids = np.frombuffer(data, dtype='<u4',
+                                        count=n_layers * 4, offset=ss)[::4]
+                bad_indices += int(np.count_nonzero(tex_ids >= n_textures))
+
+        if mcly_info is not None and mcal_info is not None:
+            # The last MCLY/MCAL wins; one alpha layer per layer past
+            # the first, 16 bytes per MCLY entry
+            mcly_size = _payload_size(mcly_info[-1])
+            mcal_size = _payload_size(mcal_info[-1])
+            expected = max(0, mcly_size // 16 - 1) * _MCAL_LAYER_SIZE
+            if mcal_size != expected:
+                mcal_mismatch += 1
+                # ADT-TEX-003 ignores empty MCLY/MCAL payloads
+                if mcly_size and mcal_size:
+                    bad_alpha += 1
+
+    return _MCNKScan(missing_mcvt, missing_mcnr, mcly_missing, mcal_mismatch,
+                     bad_mcvt, out_of_range, bad_mcnr, bad_indices, bad_alpha)
+
+
+def _open_adt(filepath):
+    """
+    Map an ADT file read-only instead of reading it into a bytes copy.
+
+    The mmap supports slicing, find() and the buffer protocol, so it is
+    used directly as the file buffer.  Every check touches the whole
+    file, so where the platform supports it the kernel is asked to read
+    the full mapping ahead in one go rather than faulting it in page by
+    page (notably cheaper on network-mounted client directories).
+
+    Returns:
+        mmap, or b'' for empty files (which cannot be mapped).  Release
+        it with _close_adt().
+    """
+    with open(filepath, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b''
+    if _MADV_WILLNEED is not None:
+        try:
+            data.madvise(_MADV_WILLNEED)
+        except OSError:
+            pass
+    return data
+
+
+def _close_adt(data):
+    """Unmap a buffer returned by _open_adt()."""
+    if isinstance(data, mmap.mmap):
+        try:
+            data.close()
+        except BufferError:
+            # A numpy view of the mapping is still alive, e.g. held by the
+            # traceback of an exception raised during the checks; the
+            # mapping is released once the view is collected
+            pass
+
+
 # ---------------------------------------------------------------------------
 # File discovery
 # ---------------------------------------------------------------------------
@@ -157,23 +412,28 @@ def _find_adt_files(client_dir):
         maps_root = os.path.join(base, "World", "Maps")
         if not os.path.isdir(maps_root):
             continue
-        for map_name in os.listdir(maps_root):
-            map_dir = os.path.join(maps_root, map_name)
-            if not os.path.isdir(map_dir):
-                continue
-            for fname in os.listdir(map_dir):
-                if not fname.lower().endswith('.adt'):
+        # scandir entries carry the file type from the directory listing,
+        # so filtering map directories costs no extra stat() per entry.
+        with os.scandir(maps_root) as map_entries:
+            for map_entry in map_entries:
+                if not map_entry.is_dir():
                     continue
-                # Parse tile coords from filename: MapName_X_Y.adt
-                parts = os.path.splitext(fname)[0].split('_')
-                if len(parts) >= 3:
-                    try:
-                        tx = int(parts[-2])
-                        ty = int(parts[-1])
-                        fpath = os.path.join(map_dir, fname)
-                        adt_files.append((map_name, tx, ty, fpath))
-                    except ValueError:
-                        pass
+                map_name = map_entry.name
+                with os.scandir(map_entry.path) as file_entries:
+                    for file_entry in file_entries:
+                        fname = file_entry.name
+                        if not fname.lower().endswith('.adt'):
+                            continue
+                        # Parse tile coords from filename: MapName_X_Y.adt
+                        parts = os.path.splitext(fname)[0].split('_')
+                        if len(parts) >= 3:
+                            try:
+                                tx = int(parts[-2])
+                                ty = int(parts[-1])
+                                adt_files.append(
+                                    (map_name, tx, ty, file_entry.path))
+                            except ValueError:
+                                pass
 
     return adt_files
 
@@ -182,317 +442,211 @@ def _find_adt_files(client_dir):
 # Chunk structure validation (ADT-001 through ADT-006)
 # ---------------------------------------------------------------------------
 
-def _validate_adt_structure(filepath, map_name, tx, ty):
-    """Validate ADT chunk structure for a single file."""
-    results = []
-    label = "{}_{}_{}".format(map_name, tx, ty)
+def _validate_adt_structure(data, label):
+    """
+    Validate ADT chunk structure for a single file.
 
-    try:
-        with open(filepath, 'rb') as f:
-            data = f.read()
-    except IOError as exc:
-        results.append(ValidationResult(
-            check_id='ADT-001',
-            severity=ValidationSeverity.ERROR,
-            passed=False,
-            message="Cannot read ADT {}: {}".format(label, exc),
-        ))
-        return results, None
+    Args:
+        data: File buffer from _open_adt().
+        label: Tile label used in messages.
 
-    chunks = _read_chunks(data)
+    Returns:
+        (results, parsed) where parsed is (chunks, mcnk_chunks, scan,
+        textures) for the per-tile checks that follow.
+    """
+    results = []
+    chunks = _index_chunks(_read_chunks(data))
 
     # ADT-001: MVER version check
     mver = _find_chunk(chunks, _MAGIC_MVER)
     if mver is not None:
-        _offset, _size, mver_data = mver
-        if len(mver_data) >= 4:
-            version = struct.unpack_from('<I', mver_data, 0)[0]
+        _offset, mver_start, mver_end = mver
+        if mver_end - mver_start >= 4:
+            version = _U32.unpack_from(data, mver_start)[0]
             if version == _ADT_VERSION:
-                results.append(ValidationResult(
-                    check_id='ADT-001',
-                    severity=ValidationSeverity.ERROR,
-                    passed=True,
-                    message="ADT {} MVER version {} verified".format(
-                        label, version),
+                results.append(ValidationResult.lazy(
+                    'ADT-001', ValidationSeverity.ERROR, True,
+                    "ADT {} MVER version {} verified", label, version,
                 ))
             else:
-                results.append(ValidationResult(
-                    check_id='ADT-001',
-                    severity=ValidationSeverity.ERROR,
-                    passed=False,
-                    message="ADT {} MVER version {}, expected {}".format(
-                        label, version, _ADT_VERSION),
+                results.append(ValidationResult.lazy(
+                    'ADT-001', ValidationSeverity.ERROR, False,
+                    "ADT {} MVER version {}, expected {}",
+                    label, version, _ADT_VERSION,
                     fix_suggestion="Regenerate ADT with correct version",
                 ))
         else:
-            results.append(ValidationResult(
-                check_id='ADT-001',
-                severity=ValidationSeverity.ERROR,
-                passed=False,
-                message="ADT {} MVER chunk too small".format(label),
+            results.append(ValidationResult.lazy(
+                'ADT-001', ValidationSeverity.ERROR, False,
+                "ADT {} MVER chunk too small", label,
             ))
     else:
-        results.append(ValidationResult(
-            check_id='ADT-001',
-            severity=ValidationSeverity.ERROR,
-            passed=False,
-            message="ADT {} missing MVER chunk".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-001', ValidationSeverity.ERROR, False,
+            "ADT {} missing MVER chunk", label,
             fix_suggestion="Regenerate ADT with correct version",
         ))
 
     # ADT-002: MHDR present
     mhdr = _find_chunk(chunks, _MAGIC_MHDR)
     if mhdr is not None:
-        results.append(ValidationResult(
-            check_id='ADT-002',
-            severity=ValidationSeverity.ERROR,
-            passed=True,
-            message="ADT {} MHDR chunk present".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-002', ValidationSeverity.ERROR, True,
+            "ADT {} MHDR chunk present", label,
         ))
     else:
-        results.append(ValidationResult(
-            check_id='ADT-002',
-            severity=ValidationSeverity.ERROR,
-            passed=False,
-            message="ADT {} missing MHDR chunk".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-002', ValidationSeverity.ERROR, False,
+            "ADT {} missing MHDR chunk", label,
             fix_suggestion="Check adt_composer.py header logic",
         ))
 
     # ADT-003: MCIN has 256 entries
     mcin = _find_chunk(chunks, _MAGIC_MCIN)
     if mcin is not None:
-        _offset, _size, mcin_data = mcin
-        entry_count = len(mcin_data) // 16
+        entry_count = _payload_size(mcin) // 16
         if entry_count == _TOTAL_CHUNKS:
-            results.append(ValidationResult(
-                check_id='ADT-003',
-                severity=ValidationSeverity.ERROR,
-                passed=True,
-                message="ADT {} MCIN has {} entries".format(
-                    label, entry_count),
+            results.append(ValidationResult.lazy(
+                'ADT-003', ValidationSeverity.ERROR, True,
+                "ADT {} MCIN has {} entries", label, entry_count,
             ))
         else:
-            results.append(ValidationResult(
-                check_id='ADT-003',
-                severity=ValidationSeverity.ERROR,
-                passed=False,
-                message="ADT {} MCIN has {} entries, expected {}".format(
-                    label, entry_count, _TOTAL_CHUNKS),
+            results.append(ValidationResult.lazy(
+                'ADT-003', ValidationSeverity.ERROR, False,
+                "ADT {} MCIN has {} entries, expected {}",
+                label, entry_count, _TOTAL_CHUNKS,
                 fix_suggestion="Regenerate with correct MCIN table",
             ))
     else:
-        results.append(ValidationResult(
-            check_id='ADT-003',
-            severity=ValidationSeverity.ERROR,
-            passed=False,
-            message="ADT {} missing MCIN chunk".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-003', ValidationSeverity.ERROR, False,
+            "ADT {} missing MCIN chunk", label,
         ))
 
     # ADT-004: Each MCNK has MCVT and MCNR sub-chunks
     mcnk_chunks = _find_all_chunks(chunks, _MAGIC_MCNK)
     mcnk_count = len(mcnk_chunks)
-    missing_mcvt = 0
-    missing_mcnr = 0
-
-    for _offset, _size, mcnk_data in mcnk_chunks:
-        sub_chunks = _parse_mcnk_sub_chunks(mcnk_data)
-        has_mcvt = any(m == _MAGIC_MCVT for m, _, _, _ in sub_chunks)
-        has_mcnr = any(m == _MAGIC_MCNR for m, _, _, _ in sub_chunks)
-        if not has_mcvt:
-            missing_mcvt += 1
-        if not has_mcnr:
-            missing_mcnr += 1
+
+    # Every per-MCNK count for this and the heightmap/texture checks is
+    # gathered in one pass here.
+    mtex = _find_chunk(chunks, _MAGIC_MTEX)
+    textures = _read_mtex(data, mtex)
+    scan = _scan_mcnks(data, mcnk_chunks, textures[0])
+    missing_mcvt = scan.missing_mcvt
+    missing_mcnr = scan.missing_mcnr
 
     if missing_mcvt == 0 and missing_mcnr == 0 and mcnk_count == _TOTAL_CHUNKS:
-        results.append(ValidationResult(
-            check_id='ADT-004',
-            severity=ValidationSeverity.ERROR,
-            passed=True,
-            message="ADT {} all {} MCNKs have MCVT and MCNR".format(
-                label, mcnk_count),
+        results.append(ValidationResult.lazy(
+            'ADT-004', ValidationSeverity.ERROR, True,
+            "ADT {} all {} MCNKs have MCVT and MCNR", label, mcnk_count,
         ))
     else:
-        msg_parts = []
+        # Message template and arguments of each issue found
+        issue_fmts = []
+        issue_args = [label]
         if mcnk_count != _TOTAL_CHUNKS:
-            msg_parts.append("{} MCNKs (expected {})".format(
-                mcnk_count, _TOTAL_CHUNKS))
+            issue_fmts.append("{} MCNKs (expected {})")
+            issue_args += [mcnk_count, _TOTAL_CHUNKS]
         if missing_mcvt > 0:
-            msg_parts.append("{} MCNKs missing MCVT".format(missing_mcvt))
+            issue_fmts.append("{} MCNKs missing MCVT")
+            issue_args.append(missing_mcvt)
         if missing_mcnr > 0:
-            msg_parts.append("{} MCNKs missing MCNR".format(missing_mcnr))
-        results.append(ValidationResult(
-            check_id='ADT-004',
-            severity=ValidationSeverity.ERROR,
-            passed=False,
-            message="ADT {} issues: {}".format(label, '; '.join(msg_parts)),
+            issue_fmts.append("{} MCNKs missing MCNR")
+            issue_args.append(missing_mcnr)
+        results.append(ValidationResult.lazy(
+            'ADT-004', ValidationSeverity.ERROR, False,
+            "ADT {} issues: " + '; '.join(issue_fmts), *issue_args,
             fix_suggestion="Add missing sub-chunks",
         ))
 
     # ADT-005: MCLY present if textures defined
-    mtex = _find_chunk(chunks, _MAGIC_MTEX)
-    has_textures = mtex is not None and len(mtex[2]) > 0
-
-    mcly_missing = 0
-    if has_textures:
-        for _offset, _size, mcnk_data in mcnk_chunks:
-            sub_chunks = _parse_mcnk_sub_chunks(mcnk_data)
-            has_mcly = any(m == _MAGIC_MCLY for m, _, _, _ in sub_chunks)
-            if not has_mcly:
-                mcly_missing += 1
+    has_textures = mtex is not None and _payload_size(mtex) > 0
+    mcly_missing = scan.mcly_missing
 
     if has_textures and mcly_missing == 0:
-        results.append(ValidationResult(
-            check_id='ADT-005',
-            severity=ValidationSeverity.WARNING,
-            passed=True,
-            message="ADT {} MCLY present in all MCNKs".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-005', ValidationSeverity.WARNING, True,
+            "ADT {} MCLY present in all MCNKs", label,
         ))
     elif has_textures and mcly_missing > 0:
-        results.append(ValidationResult(
-            check_id='ADT-005',
-            severity=ValidationSeverity.WARNING,
-            passed=False,
-            message="ADT {} {} MCNKs missing MCLY".format(
-                label, mcly_missing),
+        results.append(ValidationResult.lazy(
+            'ADT-005', ValidationSeverity.WARNING, False,
+            "ADT {} {} MCNKs missing MCLY", label, mcly_missing,
             fix_suggestion="Add MCLY for texture layers",
         ))
     else:
-        results.append(ValidationResult(
-            check_id='ADT-005',
-            severity=ValidationSeverity.WARNING,
-            passed=True,
-            message="ADT {} no textures defined, MCLY not required".format(
-                label),
+        results.append(ValidationResult.lazy(
+            'ADT-005', ValidationSeverity.WARNING, True,
+            "ADT {} no textures defined, MCLY not required", label,
         ))
 
     # ADT-006: MCAL size matches texture layer count
-    mcal_mismatch = 0
-    for _offset, _size, mcnk_data in mcnk_chunks:
-        sub_chunks = _parse_mcnk_sub_chunks(mcnk_data)
-        mcly_info = None
-        mcal_info = None
-        for m, so, ss, sd in sub_chunks:
-            if m == _MAGIC_MCLY:
-                mcly_info = (so, ss, sd)
-            elif m == _MAGIC_MCAL:
-                mcal_info = (so, ss, sd)
-
-        if mcly_info and mcal_info:
-            n_layers = len(mcly_info[2]) // 16  # 16 bytes per MCLY entry
-            n_alpha_layers = max(0, n_layers - 1)
-            expected_mcal_size = n_alpha_layers * _MCAL_LAYER_SIZE
-            actual_mcal_size = len(mcal_info[2])
-            if actual_mcal_size != expected_mcal_size:
-                mcal_mismatch += 1
-
+    mcal_mismatch = scan.mcal_mismatch
     if mcal_mismatch == 0:
-        results.append(ValidationResult(
-            check_id='ADT-006',
-            severity=ValidationSeverity.WARNING,
-            passed=True,
-            message="ADT {} MCAL sizes match layer counts".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-006', ValidationSeverity.WARNING, True,
+            "ADT {} MCAL sizes match layer counts", label,
         ))
     else:
-        results.append(ValidationResult(
-            check_id='ADT-006',
-            severity=ValidationSeverity.WARNING,
-            passed=False,
-            message="ADT {} {} MCNKs have MCAL size mismatch".format(
-                label, mcal_mismatch),
+        results.append(ValidationResult.lazy(
+            'ADT-006', ValidationSeverity.WARNING, False,
+            "ADT {} {} MCNKs have MCAL size mismatch", label, mcal_mismatch,
             fix_suggestion="Fix alpha map data",
         ))
 
-    return results, (chunks, mcnk_chunks, data)
+    return results, (chunks, mcnk_chunks, scan, textures)
 
 
 # ---------------------------------------------------------------------------
 # Heightmap validation (ADT-HM-001 through ADT-HM-003)
 # ---------------------------------------------------------------------------
 
-def _validate_heightmap(label, mcnk_chunks):
-    """Validate heightmap data in MCNK sub-chunks."""
+def _validate_heightmap(label, scan):
+    """Validate heightmap data in MCNK sub-chunks from _scan_mcnks() counts."""
     results = []
 
-    bad_mcvt_count = 0
-    out_of_range_count = 0
-    bad_mcnr_count = 0
-
-    for chunk_idx, (_offset, _size, mcnk_data) in enumerate(mcnk_chunks):
-        sub_chunks = _parse_mcnk_sub_chunks(mcnk_data)
-
-        for m, so, ss, sd in sub_chunks:
-            if m == _MAGIC_MCVT:
-                # ADT-HM-001: 145 float values
-                n_heights = len(sd) // 4
-                if n_heights != _HEIGHTS_PER_CHUNK:
-                    bad_mcvt_count += 1
-
-                # ADT-HM-002: Height range
-                for hi in range(min(n_heights, _HEIGHTS_PER_CHUNK)):
-                    h = struct.unpack_from('<f', sd, hi * 4)[0]
-                    if h < _HEIGHT_MIN or h > _HEIGHT_MAX:
-                        out_of_range_count += 1
-                        break  # Count per chunk, not per vertex
-
-            elif m == _MAGIC_MCNR:
-                # ADT-HM-003: 145 normals (3 bytes each)
-                expected_size = _NORMALS_PER_CHUNK * 3
-                if len(sd) < expected_size:
-                    bad_mcnr_count += 1
+    bad_mcvt_count = scan.bad_mcvt
+    out_of_range_count = scan.out_of_range
+    bad_mcnr_count = scan.bad_mcnr
 
     # ADT-HM-001
     if bad_mcvt_count == 0:
-        results.append(ValidationResult(
-            check_id='ADT-HM-001',
-            severity=ValidationSeverity.ERROR,
-            passed=True,
-            message="ADT {} all MCVTs have {} heights".format(
-                label, _HEIGHTS_PER_CHUNK),
+        results.append(ValidationResult.lazy(
+            'ADT-HM-001', ValidationSeverity.ERROR, True,
+            "ADT {} all MCVTs have {} heights", label, _HEIGHTS_PER_CHUNK,
         ))
     else:
-        results.append(ValidationResult(
-            check_id='ADT-HM-001',
-            severity=ValidationSeverity.ERROR,
-            passed=False,
-            message="ADT {} {} MCNKs have wrong MCVT height count".format(
-                label, bad_mcvt_count),
+        results.append(ValidationResult.lazy(
+            'ADT-HM-001', ValidationSeverity.ERROR, False,
+            "ADT {} {} MCNKs have wrong MCVT height count",
+            label, bad_mcvt_count,
             fix_suggestion="Check heightmap generation logic",
         ))
 
     # ADT-HM-002
     if out_of_range_count == 0:
-        results.append(ValidationResult(
-            check_id='ADT-HM-002',
-            severity=ValidationSeverity.WARNING,
-            passed=True,
-            message="ADT {} all heights within range".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-HM-002', ValidationSeverity.WARNING, True,
+            "ADT {} all heights within range", label,
         ))
     else:
-        results.append(ValidationResult(
-            check_id='ADT-HM-002',
-            severity=ValidationSeverity.WARNING,
-            passed=False,
-            message="ADT {} {} MCNKs have heights outside +/-{} yards".format(
-                label, out_of_range_count, int(_HEIGHT_MAX)),
+        results.append(ValidationResult.lazy(
+            'ADT-HM-002', ValidationSeverity.WARNING, False,
+            "ADT {} {} MCNKs have heights outside +/-{} yards",
+            label, out_of_range_count, int(_HEIGHT_MAX),
             fix_suggestion="Clamp heights to valid range",
         ))
 
     # ADT-HM-003
     if bad_mcnr_count == 0:
-        results.append(ValidationResult(
-            check_id='ADT-HM-003',
-            severity=ValidationSeverity.INFO,
-            passed=True,
-            message="ADT {} all MCNRs have {} normals".format(
-                label, _NORMALS_PER_CHUNK),
+        results.append(ValidationResult.lazy(
+            'ADT-HM-003', ValidationSeverity.INFO, True,
+            "ADT {} all MCNRs have {} normals", label, _NORMALS_PER_CHUNK,
         ))
     else:
-        results.append(ValidationResult(
-            check_id='ADT-HM-003',
-            severity=ValidationSeverity.INFO,
-            passed=False,
-            message="ADT {} {} MCNKs have wrong MCNR size".format(
-                label, bad_mcnr_count),
+        results.append(ValidationResult.lazy(
+            'ADT-HM-003', ValidationSeverity.INFO, False,
+            "ADT {} {} MCNKs have wrong MCNR size", label, bad_mcnr_count,
             fix_suggestion="Regenerate normals",
         ))
 
@@ -503,110 +657,57 @@ def _validate_heightmap(label, mcnk_chunks):
 # Texture reference validation (ADT-TEX-001 through ADT-TEX-003)
 # ---------------------------------------------------------------------------
 
-def _validate_textures(label, chunks, mcnk_chunks):
-    """Validate texture references in ADT."""
-    results = []
-
-    # Parse MTEX to get texture paths
-    mtex = _find_chunk(chunks, _MAGIC_MTEX)
-    texture_paths = []
-    if mtex is not None:
-        _offset, _size, mtex_data = mtex
-        # MTEX is null-terminated strings concatenated
-        pos = 0
-        while pos < len(mtex_data):
-            end = mtex_data.find(b'\x00', pos)
-            if end == -1:
-                break
-            path = mtex_data[pos:end].decode('ascii', errors='replace')
-            if path:
-                texture_paths.append(path)
-            pos = end + 1
+def _validate_textures(label, textures, scan):
+    """
+    Validate texture references in ADT.
 
-    n_textures = len(texture_paths)
+    *textures* is the (n_textures, first_paths) pair from _read_mtex() and
+    *scan* the _scan_mcnks() counts.
+    """
+    results = []
+    n_textures, texture_paths = textures
 
     # ADT-TEX-001: Texture paths exist (just validate they're non-empty)
     if n_textures > 0:
-        results.append(ValidationResult(
-            check_id='ADT-TEX-001',
-            severity=ValidationSeverity.ERROR,
-            passed=True,
-            message="ADT {} has {} texture paths in MTEX".format(
-                label, n_textures),
+        results.append(ValidationResult.lazy(
+            'ADT-TEX-001', ValidationSeverity.ERROR, True,
+            "ADT {} has {} texture paths in MTEX", label, n_textures,
             details="Textures: {}".format(
-                ', '.join(texture_paths[:4])),
+                ', '.join(texture_paths)),
         ))
     else:
-        results.append(ValidationResult(
-            check_id='ADT-TEX-001',
-            severity=ValidationSeverity.ERROR,
-            passed=False,
-            message="ADT {} has no textures in MTEX".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-TEX-001', ValidationSeverity.ERROR, False,
+            "ADT {} has no textures in MTEX", label,
             fix_suggestion="Document required custom BLPs",
         ))
 
     # ADT-TEX-002: MCLY texture indices reference valid MTEX entries
-    bad_indices = 0
-    for _offset, _size, mcnk_data in mcnk_chunks:
-        sub_chunks = _parse_mcnk_sub_chunks(mcnk_data)
-        for m, _so, _ss, sd in sub_chunks:
-            if m == _MAGIC_MCLY:
-                n_layers = len(sd) // 16
-                for li in range(n_layers):
-                    tex_id = struct.unpack_from('<I', sd, li * 16)[0]
-                    if tex_id >= n_textures:
-                        bad_indices += 1
-
+    bad_indices = scan.bad_indices
     if bad_indices == 0:
-        results.append(ValidationResult(
-            check_id='ADT-TEX-002',
-            severity=ValidationSeverity.WARNING,
-            passed=True,
-            message="ADT {} all MCLY texture indices valid".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-TEX-002', ValidationSeverity.WARNING, True,
+            "ADT {} all MCLY texture indices valid", label,
         ))
     else:
-        results.append(ValidationResult(
-            check_id='ADT-TEX-002',
-            severity=ValidationSeverity.WARNING,
-            passed=False,
-            message="ADT {} {} MCLY entries have invalid texture index".format(
-                label, bad_indices),
+        results.append(ValidationResult.lazy(
+            'ADT-TEX-002', ValidationSeverity.WARNING, False,
+            "ADT {} {} MCLY entries have invalid texture index",
+            label, bad_indices,
             fix_suggestion="Fix layer texture indices",
         ))
 
     # ADT-TEX-003: MCAL alpha map size
-    bad_alpha = 0
-    for _offset, _size, mcnk_data in mcnk_chunks:
-        sub_chunks = _parse_mcnk_sub_chunks(mcnk_data)
-        mcly_info = None
-        mcal_info = None
-        for m, _so, _ss, sd in sub_chunks:
-            if m == _MAGIC_MCLY:
-                mcly_info = sd
-            elif m == _MAGIC_MCAL:
-                mcal_info = sd
-
-        if mcly_info and mcal_info:
-            n_layers = len(mcly_info) // 16
-            n_alpha = max(0, n_layers - 1)
-            expected = n_alpha * _MCAL_LAYER_SIZE
-            if len(mcal_info) != expected:
-                bad_alpha += 1
-
+    bad_alpha = scan.bad_alpha
     if bad_alpha == 0:
-        results.append(ValidationResult(
-            check_id='ADT-TEX-003',
-            severity=ValidationSeverity.WARNING,
-            passed=True,
-            message="ADT {} MCAL alpha map sizes correct".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-TEX-003', ValidationSeverity.WARNING, True,
+            "ADT {} MCAL alpha map sizes correct", label,
         ))
     else:
-        results.append(ValidationResult(
-            check_id='ADT-TEX-003',
-            severity=ValidationSeverity.WARNING,
-            passed=False,
-            message="ADT {} {} MCNKs have wrong MCAL size".format(
-                label, bad_alpha),
+        results.append(ValidationResult.lazy(
+            'ADT-TEX-003', ValidationSeverity.WARNING, False,
+            "ADT {} {} MCNKs have wrong MCAL size", label, bad_alpha,
             fix_suggestion="Fix alpha map packing",
         ))
 
@@ -617,84 +718,110 @@ def _validate_textures(label, chunks, mcnk_chunks):
 # Area ID validation (ADT-AREA-001 through ADT-AREA-002)
 # ---------------------------------------------------------------------------
 
-def _validate_area_ids(label, mcnk_chunks, dbc_dir):
-    """Validate area IDs assigned to MCNK sub-chunks."""
+def _validate_area_ids(label, data, mcnk_chunks, dbc_dir, known_areas=None):
+    """
+    Validate area IDs assigned to MCNK sub-chunks.
+
+    *known_areas* is the set of AreaTable IDs from _load_known_areas(), or
+    None when AreaTable.dbc is missing or unreadable (ADT-AREA-002 is then
+    not reported).
+    """
     results = []
 
-    # Extract area IDs from MCNK headers
-    area_ids_found = set()
-    for _offset, _size, mcnk_data in mcnk_chunks:
-        if len(mcnk_data) >= _MCNK_HEADER_SIZE:
-            # area_id is at offset 52 in MCNK header (13th uint32)
-            area_id = struct.unpack_from('<I', mcnk_data, 52)[0]
-            area_ids_found.add(area_id)
+    # Extract area IDs from MCNK headers: area_id is at offset 52 in the
+    # MCNK header (13th uint32).  All of them are gathered from the file
+    # buffer in one fancy-indexing pass.
+    area_positions = np.array(
+        [mcnk_start + 52 for _offset, mcnk_start, mcnk_end in mcnk_chunks
+         if mcnk_end - mcnk_start >= _MCNK_HEADER_SIZE],
+        dtype=np.intp)
+    if area_positions.size:
+        raw = np.frombuffer(data, dtype=np.uint8)
+        area_bytes = raw[area_positions[:, None] + np.arange(4)]
+        area_ids_found = set(area_bytes.view('<u4').ravel().tolist())
+    else:
+        area_ids_found = set()
 
     # ADT-AREA-001: Consistent area IDs
     if len(area_ids_found) == 1:
-        results.append(ValidationResult(
-            check_id='ADT-AREA-001',
-            severity=ValidationSeverity.WARNING,
-            passed=True,
-            message="ADT {} all MCNKs use area ID {}".format(
-                label, list(area_ids_found)[0]),
+        results.append(ValidationResult.lazy(
+            'ADT-AREA-001', ValidationSeverity.WARNING, True,
+            "ADT {} all MCNKs use area ID {}", label, list(area_ids_found)[0],
         ))
     elif len(area_ids_found) > 1:
-        results.append(ValidationResult(
-            check_id='ADT-AREA-001',
-            severity=ValidationSeverity.WARNING,
-            passed=True,  # Multiple area IDs can be valid for zone boundaries
-            message="ADT {} uses {} distinct area IDs: {}".format(
-                label, len(area_ids_found), sorted(area_ids_found)),
+        # Multiple area IDs can be valid for zone boundaries
+        results.append(ValidationResult.lazy(
+            'ADT-AREA-001', ValidationSeverity.WARNING, True,
+            "ADT {} uses {} distinct area IDs: {}",
+            label, len(area_ids_found), sorted(area_ids_found),
         ))
     else:
-        results.append(ValidationResult(
-            check_id='ADT-AREA-001',
-            severity=ValidationSeverity.WARNING,
-            passed=True,
-            message="ADT {} no area IDs to validate".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-AREA-001', ValidationSeverity.WARNING, True,
+            "ADT {} no area IDs to validate", label,
         ))
 
     # ADT-AREA-002: Area IDs reference valid AreaTable entries
     if dbc_dir:
-        area_dbc_path = os.path.join(dbc_dir, "AreaTable.dbc")
-        if os.path.isfile(area_dbc_path):
-            try:
-                from .dbc_validator import _DBCReader
-                reader = _DBCReader(area_dbc_path)
-                if reader.valid:
-                    known_areas = reader.get_all_ids()
-                    unknown = area_ids_found - known_areas
-                    if not unknown:
-                        results.append(ValidationResult(
-                            check_id='ADT-AREA-002',
-                            severity=ValidationSeverity.INFO,
-                            passed=True,
-                            message="ADT {} area IDs exist in "
-                                    "AreaTable.dbc".format(label),
-                        ))
-                    else:
-                        results.append(ValidationResult(
-                            check_id='ADT-AREA-002',
-                            severity=ValidationSeverity.INFO,
-                            passed=False,
-                            message="ADT {} area IDs not in AreaTable: "
-                                    "{}".format(label, sorted(unknown)),
-                            fix_suggestion="Register area in DBC",
-                        ))
-            except Exception:
-                pass
+        if known_areas is not None:
+            unknown = area_ids_found - known_areas
+            if not unknown:
+                results.append(ValidationResult.lazy(
+                    'ADT-AREA-002', ValidationSeverity.INFO, True,
+                    "ADT {} area IDs exist in AreaTable.dbc", label,
+                ))
+            else:
+                results.append(ValidationResult.lazy(
+                    'ADT-AREA-002', ValidationSeverity.INFO, False,
+                    "ADT {} area IDs not in AreaTable: {}",
+                    label, sorted(unknown),
+                    fix_suggestion="Register area in DBC",
+                ))
     else:
-        results.append(ValidationResult(
-            check_id='ADT-AREA-002',
-            severity=ValidationSeverity.INFO,
-            passed=True,
-            message="ADT {} area ID DBC check skipped "
-                    "(no dbc_dir)".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-AREA-002', ValidationSeverity.INFO, True,
+            "ADT {} area ID DBC check skipped (no dbc_dir)", label,
         ))
 
     return results
 
 
+def _load_known_areas(dbc_dir):
+    """
+    Return the frozenset of AreaTable.dbc IDs under *dbc_dir*, or None if
+    the file is missing or cannot be parsed.
+
+    The parsed IDs are cached per file version, so repeated validation
+    runs against the same dbc_dir parse AreaTable.dbc only once.
+    """
+    if not dbc_dir:
+        return None
+    area_dbc_path = os.path.abspath(os.path.join(dbc_dir, "AreaTable.dbc"))
+    try:
+        st = os.stat(area_dbc_path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return _read_area_ids(area_dbc_path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _read_area_ids(area_dbc_path, _mtime_ns, _size):
+    """
+    Parse the IDs of an AreaTable.dbc.  The modification time and size only
+    key the cache, so a rewritten file is parsed again.
+    """
+    try:
+        from .dbc_validator import _DBCReader
+        reader = _DBCReader(area_dbc_path)
+        if reader.valid:
+            return frozenset(reader.get_all_ids())
+    except Exception:
+        pass
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Doodad/WMO reference validation (ADT-DOOD-001 through ADT-DOOD-003)
 # ---------------------------------------------------------------------------
@@ -707,28 +834,22 @@ def _validate_doodad_refs(label, chunks):
     mmdx = _find_chunk(chunks, _MAGIC_MMDX)
     mmid = _find_chunk(chunks, _MAGIC_MMID)
     if mmdx is not None and mmid is not None:
-        mmdx_size = len(mmdx[2])
-        mmid_count = len(mmid[2]) // 4
-        results.append(ValidationResult(
-            check_id='ADT-DOOD-001',
-            severity=ValidationSeverity.WARNING,
-            passed=True,
-            message="ADT {} MMDX({} bytes)/MMID({} entries) present".format(
-                label, mmdx_size, mmid_count),
+        mmdx_size = _payload_size(mmdx)
+        mmid_count = _payload_size(mmid) // 4
+        results.append(ValidationResult.lazy(
+            'ADT-DOOD-001', ValidationSeverity.WARNING, True,
+            "ADT {} MMDX({} bytes)/MMID({} entries) present",
+            label, mmdx_size, mmid_count,
         ))
     elif mmdx is None and mmid is None:
-        results.append(ValidationResult(
-            check_id='ADT-DOOD-001',
-            severity=ValidationSeverity.WARNING,
-            passed=True,
-            message="ADT {} no doodad references (empty)".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-DOOD-001', ValidationSeverity.WARNING, True,
+            "ADT {} no doodad references (empty)", label,
         ))
     else:
-        results.append(ValidationResult(
-            check_id='ADT-DOOD-001',
-            severity=ValidationSeverity.WARNING,
-            passed=False,
-            message="ADT {} MMDX/MMID mismatch".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-DOOD-001', ValidationSeverity.WARNING, False,
+            "ADT {} MMDX/MMID mismatch", label,
             fix_suggestion="Clear or populate doodad lists",
         ))
 
@@ -736,46 +857,38 @@ def _validate_doodad_refs(label, chunks):
     mwmo = _find_chunk(chunks, _MAGIC_MWMO)
     mwid = _find_chunk(chunks, _MAGIC_MWID)
     if mwmo is not None and mwid is not None:
-        mwmo_size = len(mwmo[2])
-        mwid_count = len(mwid[2]) // 4
-        results.append(ValidationResult(
-            check_id='ADT-DOOD-002',
-            severity=ValidationSeverity.WARNING,
-            passed=True,
-            message="ADT {} MWMO({} bytes)/MWID({} entries) present".format(
-                label, mwmo_size, mwid_count),
+        mwmo_size = _payload_size(mwmo)
+        mwid_count = _payload_size(mwid) // 4
+        results.append(ValidationResult.lazy(
+            'ADT-DOOD-002', ValidationSeverity.WARNING, True,
+            "ADT {} MWMO({} bytes)/MWID({} entries) present",
+            label, mwmo_size, mwid_count,
         ))
     elif mwmo is None and mwid is None:
-        results.append(ValidationResult(
-            check_id='ADT-DOOD-002',
-            severity=ValidationSeverity.WARNING,
-            passed=True,
-            message="ADT {} no WMO references (empty)".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-DOOD-002', ValidationSeverity.WARNING, True,
+            "ADT {} no WMO references (empty)", label,
         ))
     else:
-        results.append(ValidationResult(
-            check_id='ADT-DOOD-002',
-            severity=ValidationSeverity.WARNING,
-            passed=False,
-            message="ADT {} MWMO/MWID mismatch".format(label),
+        results.append(ValidationResult.lazy(
+            'ADT-DOOD-002', ValidationSeverity.WARNING, False,
+            "ADT {} MWMO/MWID mismatch", label,
             fix_suggestion="Clear or populate WMO lists",
         ))
 
     # ADT-DOOD-003: MDDF/MODF placement counts
     mddf = _find_chunk(chunks, _MAGIC_MDDF)
     modf = _find_chunk(chunks, _MAGIC_MODF)
-    mmid_count = len(mmid[2]) // 4 if mmid is not None else 0
-    mwid_count = len(mwid[2]) // 4 if mwid is not None else 0
-
-    mddf_count = len(mddf[2]) // 36 if mddf is not None else 0  # 36 bytes per entry
-    modf_count = len(modf[2]) // 64 if modf is not None else 0  # 64 bytes per entry
-
-    results.append(ValidationResult(
-        check_id='ADT-DOOD-003',
-        severity=ValidationSeverity.INFO,
-        passed=True,
-        message="ADT {} placements: {} doodads, {} WMOs".format(
-            label, mddf_count, modf_count),
+    mmid_count = _payload_size(mmid) // 4 if mmid is not None else 0
+    mwid_count = _payload_size(mwid) // 4 if mwid is not None else 0
+
+    mddf_count = _payload_size(mddf) // 36 if mddf is not None else 0  # 36 bytes per entry
+    modf_count = _payload_size(modf) // 64 if modf is not None else 0  # 64 bytes per entry
+
+    results.append(ValidationResult.lazy(
+        'ADT-DOOD-003', ValidationSeverity.INFO, True,
+        "ADT {} placements: {} doodads, {} WMOs",
+        label, mddf_count, modf_count,
     ))
 
     return results
@@ -785,10 +898,64 @@ def _validate_doodad_refs(label, chunks):
 # Public entry point
 # ---------------------------------------------------------------------------
 
-def validate_adt_files(client_dir, dbc_dir=None):
+def _validate_one_adt(map_name, tx, ty, filepath, dbc_dir, known_areas):
+    """
+    Run every ADT check on one tile.  Module-level so it can be used as a
+    ProcessPoolExecutor worker.
+
+    Returns:
+        List of ValidationResult objects.
+    """
+    label = "{}_{}_{}".format(map_name, tx, ty)
+
+    try:
+        data = _open_adt(filepath)
+    except (IOError, OSError) as exc:
+        return [ValidationResult.lazy(
+            'ADT-001', ValidationSeverity.ERROR, False,
+            "Cannot read ADT {}: {}", label, exc,
+        )]
+
+    # The mapping is released even if a check raises
+    try:
+        # Chunk structure
+        results, parsed = _validate_adt_structure(data, label)
+        chunks, mcnk_chunks, scan, textures = parsed
+
+        # Heightmap
+        results.extend(_validate_heightmap(label, scan))
+
+        # Textures
+        results.extend(_validate_textures(label, textures, scan))
+
+        # Area IDs
+        results.extend(_validate_area_ids(label, data, mcnk_chunks, dbc_dir,
+                                          known_areas))
+
+        # Doodad/WMO references
+        results.extend(_validate_doodad_refs(label, chunks))
+
+        return results
+    finally:
+        _close_adt(data)
+
+
+def validate_adt_files(client_dir, dbc_dir=None, max_workers=None):
     """
     Validate all ADT files found under client_dir.
 
+    AreaTable.dbc is read once here and shared with every tile.
+
+    Args:
+        client_dir: Root of the client output tree.
+        dbc_dir: Optional directory holding AreaTable.dbc.
+        max_workers: Number of worker processes.  Tiles are validated
+            serially by default (None or 1).  With more workers and at
+            least _PARALLEL_MIN_TILES tiles, they are validated in a
+            ProcessPoolExecutor; under the 'spawn' start method (the
+            default on Windows and macOS) the calling script then needs
+            an ``if __name__ == '__main__'`` guard.
+
     Returns:
         List of ValidationResult objects.
     """
@@ -805,29 +972,18 @@ def validate_adt_files(client_dir, dbc_dir=None):
         ))
         return results
 
-    for map_name, tx, ty, filepath in adt_files:
-        label = "{}_{}_{}".format(map_name, tx, ty)
+    known_areas = _load_known_areas(dbc_dir)
+    args = [(map_name, tx, ty, filepath, dbc_dir, known_areas)
+            for map_name, tx, ty, filepath in adt_files]
 
-        # Chunk structure
-        struct_results, parsed = _validate_adt_structure(
-            filepath, map_name, tx, ty)
-        results.extend(struct_results)
-
-        if parsed is None:
-            continue
-
-        chunks, mcnk_chunks, _data = parsed
-
-        # Heightmap
-        results.extend(_validate_heightmap(label, mcnk_chunks))
-
-        # Textures
-        results.extend(_validate_textures(label, chunks, mcnk_chunks))
-
-        # Area IDs
-        results.extend(_validate_area_ids(label, mcnk_chunks, dbc_dir))
+    if (max_workers is None or max_workers <= 1
+            or len(args) < _PARALLEL_MIN_TILES):
+        tile_results = [_validate_one_adt(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            tile_results = list(executor.map(_validate_one_adt, *zip(*args)))
 
-        # Doodad/WMO references
-        results.extend(_validate_doodad_refs(label, chunks))
+    for tile_result in tile_results:
+        results.extend(tile_result)
 
     return results
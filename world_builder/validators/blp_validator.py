@@ -11,6 +11,9 @@ Validates:
 
 import os
 import struct
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 from ..qa_validator import ValidationResult, ValidationSeverity
 
@@ -21,14 +24,24 @@ from ..qa_validator import ValidationResult, ValidationSeverity
 
 _BLP2_MAGIC = b'BLP2'
 _BLP_HEADER_SIZE = 148  # BLP2 header size (without palette)
+# Header fields after the magic: compression, alpha depth, alpha encoding,
+# has-mipmaps, width, height, then 16 mipmap offsets and 16 mipmap sizes
+_BLP_FIELDS = struct.Struct('<6I16I16I')
+# Bytes covered by the parsed fields, magic included
+_BLP_PARSED_SIZE = 4 + _BLP_FIELDS.size
 
-# Valid BLP dimensions (powers of 2)
-_VALID_DIMENSIONS = {1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096}
+# Largest valid BLP dimension; valid dimensions are powers of 2 up to it
+_MAX_DIMENSION = 4096
 
 # Compression types
 _COMPRESS_JPEG = 0
 _COMPRESS_PALETTE = 1
 _COMPRESS_DXT = 2
+_COMPRESS_NAMES = {
+    _COMPRESS_JPEG: "JPEG",
+    _COMPRESS_PALETTE: "Palette",
+    _COMPRESS_DXT: "DXT",
+}
 
 # Alpha encoding
 _ALPHA_DXT1 = 0
@@ -36,6 +49,18 @@ _ALPHA_DXT3 = 1
 _ALPHA_DXT5 = 7
 
 _MAX_MIPMAPS = 16
+# Offset of the mipmap offset table; the size table follows it directly
+_MIP_TABLE_OFFSET = 28
+
+# Below this many files BLPs are validated serially; with more, reads are
+# overlapped across _MAX_WORKERS threads.
+_PARALLEL_MIN_FILES = 8
+_MAX_WORKERS = (os.cpu_count() or 1) * 4
+
+
+def _is_valid_dimension(n):
+    """True if *n* is a power of 2 no larger than _MAX_DIMENSION."""
+    return 0 < n <= _MAX_DIMENSION and (n & (n - 1)) == 0
 
 
 # ---------------------------------------------------------------------------
@@ -43,15 +68,44 @@ _MAX_MIPMAPS = 16
 # ---------------------------------------------------------------------------
 
 def _find_blp_files(client_dir):
-    """Find all BLP files under client_dir."""
+    """
+    Find all BLP files under client_dir.
+
+    Returns:
+        List of (path, size) tuples.  On Windows size comes from the
+        directory entry, which caches it; elsewhere reading it would cost
+        a stat() per file, so size is None (as it is when the entry could
+        not be stat'ed) and the size is taken when the file is opened.
+    """
     blp_files = []
     if not client_dir or not os.path.isdir(client_dir):
         return blp_files
 
-    for root, _dirs, files in os.walk(client_dir):
-        for fname in files:
-            if fname.lower().endswith('.blp'):
-                blp_files.append(os.path.join(root, fname))
+    # Depth-first walk with os.scandir: entries carry their file type from
+    # the directory listing, so no per-entry stat() is needed.  Like
+    # os.walk, symlinked directories are not descended into, unreadable
+    # directories are skipped, and files come out in top-down order.
+    sizes_cached = os.name == 'nt'
+    stack = [client_dir]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.lower().endswith('.blp'):
+                        size = None
+                        if sizes_cached:
+                            try:
+                                size = entry.stat().st_size
+                            except OSError:
+                                pass
+                        blp_files.append((entry.path, size))
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
 
     return blp_files
 
@@ -60,6 +114,181 @@ def _find_blp_files(client_dir):
 # Validation
 # ---------------------------------------------------------------------------
 
+def _too_small_result(fname, size):
+    """BLP-001 failure for a file too small to hold the magic."""
+    return ValidationResult(
+        check_id='BLP-001',
+        severity=ValidationSeverity.ERROR,
+        passed=False,
+        message=f"BLP {fname} too small ({size} bytes)",
+        fix_suggestion="Regenerate with PNG2BLP",
+    )
+
+
+def _validate_one_blp(blp_path, listed_size=None):
+    """
+    Run every BLP check on one file.
+
+    Args:
+        blp_path: Path of the BLP file.
+        listed_size: File size from the directory scan, if known.  Files
+            too small to hold the magic are reported without being opened.
+
+    Returns:
+        List of ValidationResult objects.
+    """
+    results = []
+    fname = os.path.basename(blp_path)
+
+    if listed_size is not None and listed_size < 4:
+        results.append(_too_small_result(fname, listed_size))
+        return results
+
+    # Only the header is parsed; the mipmap checks need just the file
+    # size, so read the header bytes and take the size from fstat.  The
+    # pixel payload is never read.
+    try:
+        with open(blp_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            data = f.read(_BLP_PARSED_SIZE)
+    except (IOError, OSError) as exc:
+        results.append(ValidationResult(
+            check_id='BLP-001',
+            severity=ValidationSeverity.ERROR,
+            passed=False,
+            message=f"Cannot read BLP {fname}: {exc}",
+        ))
+        return results
+
+    # BLP-001: Magic header.  The header checks use the short read, so
+    # a file truncated inside the header is reported as such.
+    if len(data) < 4:
+        results.append(_too_small_result(fname, len(data)))
+        return results
+
+    magic = data[0:4]
+    if magic == _BLP2_MAGIC:
+        results.append(ValidationResult(
+            check_id='BLP-001',
+            severity=ValidationSeverity.ERROR,
+            passed=True,
+            message=f"BLP {fname} magic header BLP2 verified",
+        ))
+    else:
+        results.append(ValidationResult(
+            check_id='BLP-001',
+            severity=ValidationSeverity.ERROR,
+            passed=False,
+            message=f"BLP {fname} bad magic: {magic!r}",
+            fix_suggestion="Regenerate with PNG2BLP",
+        ))
+        return results
+
+    if len(data) < _BLP_HEADER_SIZE:
+        results.append(ValidationResult(
+            check_id='BLP-004',
+            severity=ValidationSeverity.ERROR,
+            passed=False,
+            message=f"BLP {fname} header truncated ({len(data)} bytes)",
+            fix_suggestion="Check PNG2BLP conversion logs",
+        ))
+        return results
+
+    # Parse header fields in one call; the mipmap tables (16 offsets at
+    # offset 28, 16 sizes at offset 92) are viewed as one int64 array so
+    # offset + size cannot wrap
+    fields = _BLP_FIELDS.unpack_from(data, 4)
+    (compression, alpha_depth, alpha_encoding, has_mipmaps,
+     width, height) = fields[:6]
+    mip_table = np.frombuffer(
+        data, dtype='<u4', count=2 * _MAX_MIPMAPS,
+        offset=_MIP_TABLE_OFFSET).astype(np.int64)
+    mip_offsets = mip_table[:_MAX_MIPMAPS]
+    mip_sizes = mip_table[_MAX_MIPMAPS:]
+
+    # BLP-002: Dimensions are powers of 2
+    w_ok = _is_valid_dimension(width)
+    h_ok = _is_valid_dimension(height)
+    if w_ok and h_ok:
+        results.append(ValidationResult(
+            check_id='BLP-002',
+            severity=ValidationSeverity.ERROR,
+            passed=True,
+            message=f"BLP {fname} dimensions {width}x{height} valid",
+        ))
+    else:
+        results.append(ValidationResult(
+            check_id='BLP-002',
+            severity=ValidationSeverity.ERROR,
+            passed=False,
+            message=f"BLP {fname} dimensions {width}x{height} not power of 2",
+            fix_suggestion="Resize source PNG before conversion",
+        ))
+
+    # BLP-003: Mipmap offsets/sizes valid.  Active mipmaps run up to the
+    # first entry whose offset and size are both zero.
+    empty = (mip_offsets == 0) & (mip_sizes == 0)
+    active_mips = int(empty.argmax()) if empty.any() else _MAX_MIPMAPS
+    mip_ends = mip_offsets[:active_mips] + mip_sizes[:active_mips]
+    max_end = int(mip_ends.max(initial=0))
+    mip_ok = max_end <= size
+
+    if mip_ok:
+        results.append(ValidationResult(
+            check_id='BLP-003',
+            severity=ValidationSeverity.WARNING,
+            passed=True,
+            message=f"BLP {fname} has {active_mips} valid mipmaps",
+        ))
+    else:
+        results.append(ValidationResult(
+            check_id='BLP-003',
+            severity=ValidationSeverity.WARNING,
+            passed=False,
+            message=f"BLP {fname} has invalid mipmap offsets/sizes",
+            fix_suggestion="Regenerate with proper mipmaps",
+        ))
+
+    # BLP-004: File not truncated
+    # Check that the last active mipmap's data fits within file
+    if max_end <= size:
+        results.append(ValidationResult(
+            check_id='BLP-004',
+            severity=ValidationSeverity.ERROR,
+            passed=True,
+            message=f"BLP {fname} size {size} bytes, data ends at {max_end}",
+        ))
+    else:
+        results.append(ValidationResult(
+            check_id='BLP-004',
+            severity=ValidationSeverity.ERROR,
+            passed=False,
+            message=(f"BLP {fname} truncated: needs {max_end} bytes, "
+                     f"has {size}"),
+            fix_suggestion="Check PNG2BLP conversion logs",
+        ))
+
+    # BLP-005: Compression type
+    compress_name = _COMPRESS_NAMES.get(compression)
+    if compress_name is not None:
+        results.append(ValidationResult(
+            check_id='BLP-005',
+            severity=ValidationSeverity.INFO,
+            passed=True,
+            message=f"BLP {fname} compression: {compress_name}",
+        ))
+    else:
+        results.append(ValidationResult(
+            check_id='BLP-005',
+            severity=ValidationSeverity.INFO,
+            passed=False,
+            message=f"BLP {fname} unknown compression type: {compression}",
+            fix_suggestion="Use DXT1/DXT3/DXT5 or uncompressed",
+        ))
+
+    return results
+
+
 def validate_blp_files(client_dir):
     """
     Validate all BLP files found under client_dir.
@@ -80,180 +309,17 @@ def validate_blp_files(client_dir):
         ))
         return results
 
-    for blp_path in blp_files:
-        fname = os.path.basename(blp_path)
-
-        try:
-            with open(blp_path, 'rb') as f:
-                data = f.read()
-        except IOError as exc:
-            results.append(ValidationResult(
-                check_id='BLP-001',
-                severity=ValidationSeverity.ERROR,
-                passed=False,
-                message="Cannot read BLP {}: {}".format(fname, exc),
-            ))
-            continue
-
-        # BLP-001: Magic header
-        if len(data) < 4:
-            results.append(ValidationResult(
-                check_id='BLP-001',
-                severity=ValidationSeverity.ERROR,
-                passed=False,
-                message="BLP {} too small ({} bytes)".format(
-                    fname, len(data)),
-                fix_suggestion="Regenerate with PNG2BLP",
-            ))
-            continue
-
-        magic = data[0:4]
-        if magic == _BLP2_MAGIC:
-            results.append(ValidationResult(
-                check_id='BLP-001',
-                severity=ValidationSeverity.ERROR,
-                passed=True,
-                message="BLP {} magic header BLP2 verified".format(fname),
-            ))
-        else:
-            results.append(ValidationResult(
-                check_id='BLP-001',
-                severity=ValidationSeverity.ERROR,
-                passed=False,
-                message="BLP {} bad magic: {!r}".format(fname, magic),
-                fix_suggestion="Regenerate with PNG2BLP",
-            ))
-            continue
-
-        if len(data) < _BLP_HEADER_SIZE:
-            results.append(ValidationResult(
-                check_id='BLP-004',
-                severity=ValidationSeverity.ERROR,
-                passed=False,
-                message="BLP {} header truncated ({} bytes)".format(
-                    fname, len(data)),
-                fix_suggestion="Check PNG2BLP conversion logs",
-            ))
-            continue
-
-        # Parse header fields
-        compression = struct.unpack_from('<I', data, 4)[0]
-        alpha_depth = struct.unpack_from('<I', data, 8)[0]
-        alpha_encoding = struct.unpack_from('<I', data, 12)[0]
-        has_mipmaps = struct.unpack_from('<I', data, 16)[0]
-        width = struct.unpack_from('<I', data, 20)[0]
-        height = struct.unpack_from('<I', data, 24)[0]
-
-        # Mipmap offsets (16 entries at offset 28)
-        mip_offsets = []
-        for mi in range(_MAX_MIPMAPS):
-            off = struct.unpack_from('<I', data, 28 + mi * 4)[0]
-            mip_offsets.append(off)
-
-        # Mipmap sizes (16 entries at offset 92)
-        mip_sizes = []
-        for mi in range(_MAX_MIPMAPS):
-            sz = struct.unpack_from('<I', data, 92 + mi * 4)[0]
-            mip_sizes.append(sz)
-
-        # BLP-002: Dimensions are powers of 2
-        w_ok = width in _VALID_DIMENSIONS
-        h_ok = height in _VALID_DIMENSIONS
-        if w_ok and h_ok:
-            results.append(ValidationResult(
-                check_id='BLP-002',
-                severity=ValidationSeverity.ERROR,
-                passed=True,
-                message="BLP {} dimensions {}x{} valid".format(
-                    fname, width, height),
-            ))
-        else:
-            results.append(ValidationResult(
-                check_id='BLP-002',
-                severity=ValidationSeverity.ERROR,
-                passed=False,
-                message="BLP {} dimensions {}x{} not power of 2".format(
-                    fname, width, height),
-                fix_suggestion="Resize source PNG before conversion",
-            ))
-
-        # BLP-003: Mipmap offsets/sizes valid
-        mip_ok = True
-        active_mips = 0
-        for mi in range(_MAX_MIPMAPS):
-            if mip_offsets[mi] == 0 and mip_sizes[mi] == 0:
-                break
-            active_mips += 1
-            if mip_offsets[mi] + mip_sizes[mi] > len(data):
-                mip_ok = False
-
-        if mip_ok:
-            results.append(ValidationResult(
-                check_id='BLP-003',
-                severity=ValidationSeverity.WARNING,
-                passed=True,
-                message="BLP {} has {} valid mipmaps".format(
-                    fname, active_mips),
-            ))
-        else:
-            results.append(ValidationResult(
-                check_id='BLP-003',
-                severity=ValidationSeverity.WARNING,
-                passed=False,
-                message="BLP {} has invalid mipmap offsets/sizes".format(
-                    fname),
-                fix_suggestion="Regenerate with proper mipmaps",
-            ))
-
-        # BLP-004: File not truncated
-        # Check that the last active mipmap's data fits within file
-        max_end = 0
-        for mi in range(active_mips):
-            end = mip_offsets[mi] + mip_sizes[mi]
-            if end > max_end:
-                max_end = end
-
-        if max_end <= len(data):
-            results.append(ValidationResult(
-                check_id='BLP-004',
-                severity=ValidationSeverity.ERROR,
-                passed=True,
-                message="BLP {} size {} bytes, data ends at {}".format(
-                    fname, len(data), max_end),
-            ))
-        else:
-            results.append(ValidationResult(
-                check_id='BLP-004',
-                severity=ValidationSeverity.ERROR,
-                passed=False,
-                message="BLP {} truncated: needs {} bytes, has {}".format(
-                    fname, max_end, len(data)),
-                fix_suggestion="Check PNG2BLP conversion logs",
-            ))
-
-        # BLP-005: Compression type
-        compress_name = {
-            _COMPRESS_JPEG: "JPEG",
-            _COMPRESS_PALETTE: "Palette",
-            _COMPRESS_DXT: "DXT",
-        }.get(compression, "Unknown({})".format(compression))
-
-        if compression in (_COMPRESS_JPEG, _COMPRESS_PALETTE, _COMPRESS_DXT):
-            results.append(ValidationResult(
-                check_id='BLP-005',
-                severity=ValidationSeverity.INFO,
-                passed=True,
-                message="BLP {} compression: {}".format(
-                    fname, compress_name),
-            ))
-        else:
-            results.append(ValidationResult(
-                check_id='BLP-005',
-                severity=ValidationSeverity.INFO,
-                passed=False,
-                message="BLP {} unknown compression type: {}".format(
-                    fname, compression),
-                fix_suggestion="Use DXT1/DXT3/DXT5 or uncompressed",
-            ))
+    # Files are independent and the work is mostly I/O, so threads let
+    # the reads overlap; results keep file order.
+    if len(blp_files) < _PARALLEL_MIN_FILES:
+        per_file = [_validate_one_blp(path, size)
+                    for path, size in blp_files]
+    else:
+        paths, sizes = zip(*blp_files)
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            per_file = list(executor.map(_validate_one_blp, paths, sizes))
+
+    for file_results in per_file:
+        results.extend(file_results)
 
     return results
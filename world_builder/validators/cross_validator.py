@@ -10,11 +10,69 @@ Validates consistency between:
 - LFGDungeons and SQL dungeon registration
 """
 
+import heapq
+import io
+import mmap
 import os
 import re
+import stat
 import struct
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from ..qa_validator import ValidationResult, ValidationSeverity
+from .dbc_validator import _DBCReader
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+# ADT chunk header (magic, payload size) and reversed MCNK magic
+_CHUNK_HDR = struct.Struct('<4sI')
+_MAGIC_MCNK = b'KNCM'
+
+# Below this many ADTs the area-ID scan runs serially; with more, files
+# are scanned across _MAX_WORKERS threads.
+_PARALLEL_MIN_FILES = 8
+_MAX_WORKERS = (os.cpu_count() or 1) * 4
+
+# Tables whose INSERTs feed the cross-layer checks
+_INSERT_TABLES = ('instance_template', 'creature', 'areatrigger_teleport')
+
+# Top-level SQL scan: quoted strings and comments (skipped), or the start
+# of an INSERT into one of _INSERT_TABLES, optionally schema-qualified,
+# up to the '(' opening its column list (group 1 is the table name).
+_RE_SQL_TOP = re.compile(r"""
+    '(?:[^'\\]|\\.|'')*'
+  | "(?:[^"\\]|\\.|"")*"
+  | --(?=\s)[^\n]*
+  | \#[^\n]*
+  | /\*.*?\*/
+  | \bINSERT\s+INTO\s+(?:(?:`[^`]*`|\w+)\s*\.\s*)?
+    `?({})`?\s*\(
+""".format('|'.join(_INSERT_TABLES)), re.VERBOSE | re.IGNORECASE | re.DOTALL)
+
+# Inside an INSERT: what starts a quoted string or a comment, or ends the
+# statement
+_RE_SQL_SPECIAL = re.compile(r"""['";#]|--(?=\s)|/\*""")
+
+# Quoted strings (backslash or doubled-quote escapes), matched from their
+# opening quote; group 1 is the text between the quotes
+_RE_SQL_QUOTED = {
+    "'": re.compile(r"'((?:[^'\\]|\\.|'')*)'", re.DOTALL),
+    '"': re.compile(r'"((?:[^"\\]|\\.|"")*)"', re.DOTALL),
+}
+
+# Stands in for each quoted string of a masked statement
+_SQL_LITERAL_MARK = '\x00'
+
+# Column list of a masked INSERT (its '(' already consumed), then VALUES
+_RE_SQL_COLUMNS = re.compile(r"([^()]*)\)\s*VALUES\s*", re.IGNORECASE)
+
+# One VALUES row of a masked INSERT (group 1), allowing one level of
+# nested parentheses, and the ',' that continues the list (group 2)
+_RE_SQL_ROW = re.compile(r"\s*\(([^()]*(?:\([^()]*\)[^()]*)*)\)\s*(,?)")
 
 
 # ---------------------------------------------------------------------------
@@ -22,95 +80,304 @@ from ..qa_validator import ValidationResult, ValidationSeverity
 # ---------------------------------------------------------------------------
 
 def _read_all_sql(sql_dir):
-    """Read and concatenate all SQL files from a directory."""
+    """
+    Read and concatenate all SQL files from a directory.
+
+    Files are streamed into one buffer, newline-separated, rather than
+    held as a list of bodies and joined afterwards.
+    """
     if not sql_dir or not os.path.isdir(sql_dir):
         return ''
 
-    combined = []
-    for fname in os.listdir(sql_dir):
-        if not fname.lower().endswith('.sql'):
+    combined = io.StringIO()
+    first = True
+    with os.scandir(sql_dir) as entries:
+        for entry in entries:
+            if not entry.name.lower().endswith('.sql'):
+                continue
+            try:
+                with open(entry.path, 'r', encoding='utf-8',
+                          errors='replace') as f:
+                    content = f.read()
+            except IOError:
+                continue
+            if not first:
+                combined.write('\n')
+            combined.write(content)
+            first = False
+
+    return combined.getvalue()
+
+
+def _unquote(token):
+    """Strip the quotes or backticks around a single SQL token."""
+    if len(token) >= 2 and token[0] in "'\"`" and token[-1] == token[0]:
+        return token[1:-1]
+    return token
+
+
+def _mask_statement(sql_content, pos):
+    """
+    Read one statement from *pos* up to its terminating ';'.
+
+    Quoted strings are replaced by _SQL_LITERAL_MARK and comments by a
+    space, so the masked text can be split on commas and parentheses
+    with plain string operations.  Statements without quotes or comments
+    are taken as they are.
+
+    Returns:
+        (masked, literals, end): the masked text, a list of
+        (raw, text) pairs for the quoted strings in order, and the
+        position just past the statement.
+    """
+    parts = []
+    literals = []
+    search = _RE_SQL_SPECIAL.search
+    while True:
+        match = search(sql_content, pos)
+        if match is None:
+            parts.append(sql_content[pos:])
+            end = len(sql_content)
+            break
+        start = match.start()
+        parts.append(sql_content[pos:start])
+        token = match.group()
+        if token == ';':
+            end = match.end()
+            break
+        if token in _RE_SQL_QUOTED:
+            quoted = _RE_SQL_QUOTED[token].match(sql_content, start)
+            if quoted is None:
+                # Unterminated string: the statement is truncated
+                end = len(sql_content)
+                break
+            literals.append((quoted.group(), quoted.group(1)))
+            parts.append(_SQL_LITERAL_MARK)
+            pos = quoted.end()
             continue
-        fpath = os.path.join(sql_dir, fname)
-        try:
-            with open(fpath, 'r', encoding='utf-8', errors='replace') as f:
-                combined.append(f.read())
-        except IOError:
-            pass
+        # Comment: '/* ... */', or '-- ' / '#' up to the end of the line
+        if token == '/*':
+            close = sql_content.find('*/', match.end())
+            pos = len(sql_content) if close < 0 else close + 2
+        else:
+            newline = sql_content.find('\n', match.end())
+            pos = len(sql_content) if newline < 0 else newline
+        parts.append(' ')
+
+    return ''.join(parts), literals, end
+
+
+def _split_sql_items(text):
+    """Split a masked list body on its top-level commas."""
+    if not text.strip():
+        return []
+    if '(' not in text:
+        return text.split(',')
+
+    items = []
+    depth = 0
+    start = 0
+    for i, ch in enumerate(text):
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            items.append(text[start:i])
+            start = i + 1
+    items.append(text[start:])
+    return items
+
+
+def _sql_item(item, literals):
+    """
+    Value of one masked list item.  *literals* iterates the statement's
+    (raw, text) quoted strings; a lone string yields its text, and
+    strings inside a larger expression are put back verbatim.
+    """
+    item = item.strip()
+    if _SQL_LITERAL_MARK not in item:
+        return _unquote(item)
+    if item == _SQL_LITERAL_MARK:
+        return next(literals)[1]
+    pieces = item.split(_SQL_LITERAL_MARK)
+    out = [pieces[0]]
+    for piece in pieces[1:]:
+        out.append(next(literals)[0])
+        out.append(piece)
+    return ''.join(out)
+
+
+def _parse_insert_rows(masked, literals, column_cache):
+    """
+    Rows of one masked INSERT whose column list '(' has been consumed.
+
+    Args:
+        masked, literals: _mask_statement() result.
+        column_cache: Dict of column lists already parsed, keyed by their
+            text, so statements with the same columns share one list.
 
-    return '\n'.join(combined)
+    Returns:
+        List of (column_list, values_list), one per VALUES row.
+    """
+    head = _RE_SQL_COLUMNS.match(masked)
+    if head is None:
+        return []
+
+    literals = iter(literals)
+    column_text = head.group(1)
+    columns = column_cache.get(column_text)
+    if columns is None:
+        columns = [_sql_item(item, literals)
+                   for item in _split_sql_items(column_text)]
+        if _SQL_LITERAL_MARK not in column_text:
+            column_cache[column_text] = columns
+
+    rows = []
+    pos = head.end()
+    while True:
+        row = _RE_SQL_ROW.match(masked, pos)
+        if row is None:
+            break
+        text = row.group(1)
+        if _SQL_LITERAL_MARK in text or '(' in text:
+            values = [_sql_item(item, literals)
+                      for item in _split_sql_items(text)]
+        elif text.strip():
+            # Plain values: no strings or expressions to unpack
+            values = [item.strip() for item in text.split(',')]
+        else:
+            values = []
+        rows.append((columns, values))
+        if not row.group(2):
+            break
+        pos = row.end()
+    return rows
 
 
-def _extract_sql_map_ids(sql_content):
-    """Extract map IDs from instance_template and creature spawns."""
-    map_ids = set()
+def _parse_inserts(sql_content):
+    """
+    Collect the rows of every INSERT into one of _INSERT_TABLES.
+
+    Comments and quoted strings are skipped between statements, so
+    commented-out INSERTs are ignored.  Only the target statements are
+    split into values; quoted values may contain commas or parentheses,
+    and every row of a multi-row VALUES list is read.
 
-    # instance_template map IDs
-    for match in re.finditer(
-        r"INSERT\s+INTO\s+`?instance_template`?\s*"
-        r"\([^)]*map[^)]*\)\s*VALUES\s*\(\s*(\d+)",
-        sql_content, re.IGNORECASE
-    ):
-        try:
-            map_ids.add(int(match.group(1)))
-        except ValueError:
-            pass
-
-    # Also extract from creature spawn map column
-    pattern = (
-        r"INSERT\s+INTO\s+`?creature`?\s*"
-        r"\(([^)]*)\)\s*VALUES\s*\(([^)]*)\)"
-    )
-    for match in re.finditer(pattern, sql_content, re.IGNORECASE):
-        cols = [c.strip().strip('`') for c in match.group(1).split(',')]
-        vals = [v.strip().strip("'\"") for v in match.group(2).split(',')]
-        for i, col in enumerate(cols):
-            if col.lower() == 'map' and i < len(vals):
+    Returns:
+        dict: {table_name: [(column_list, values_list), ...]}, one entry
+        per VALUES row, with lower-cased table names.
+    """
+    inserts = {}
+    column_cache = {}
+    pos = 0
+    search = _RE_SQL_TOP.search
+    while True:
+        match = search(sql_content, pos)
+        if match is None:
+            break
+        table = match.group(1)
+        if table is None:
+            # Quoted string or comment outside a target INSERT
+            pos = match.end()
+            continue
+        masked, literals, pos = _mask_statement(sql_content, match.end())
+        rows = _parse_insert_rows(masked, literals, column_cache)
+        if rows:
+            inserts.setdefault(table.lower(), []).extend(rows)
+
+    return inserts
+
+
+def _column_ints(inserts, table, column):
+    """Integer values of *column* over all parsed rows of *table*."""
+    found = set()
+    # Rows of one statement, and of statements with the same column
+    # text, share their column list; look the column up once per list
+    last_cols = None
+    indices = ()
+    for cols, vals in inserts.get(table, ()):
+        if cols is not last_cols:
+            last_cols = cols
+            indices = [i for i, col in enumerate(cols)
+                       if col.lower() == column]
+        for i in indices:
+            if i < len(vals):
                 try:
-                    map_ids.add(int(vals[i]))
+                    found.add(int(vals[i]))
                 except ValueError:
                     pass
+    return found
 
-    return map_ids
 
+def _extract_sql_map_ids(inserts):
+    """
+    Extract map IDs from instance_template and creature spawns.
 
-def _extract_sql_areatrigger_maps(sql_content):
-    """Extract map IDs from areatrigger_teleport table."""
-    map_ids = set()
-    pattern = (
-        r"INSERT\s+INTO\s+`?areatrigger_teleport`?\s*"
-        r"\(([^)]*)\)\s*VALUES\s*\(([^)]*)\)"
-    )
-    for match in re.finditer(pattern, sql_content, re.IGNORECASE):
-        cols = [c.strip().strip('`') for c in match.group(1).split(',')]
-        vals = [v.strip().strip("'\"") for v in match.group(2).split(',')]
-        for i, col in enumerate(cols):
-            if col.lower() == 'target_map' and i < len(vals):
-                try:
-                    map_ids.add(int(vals[i]))
-                except ValueError:
-                    pass
-    return map_ids
+    *inserts* is the _parse_inserts() result for the combined SQL.
+    """
+    return (_column_ints(inserts, 'instance_template', 'map')
+            | _column_ints(inserts, 'creature', 'map'))
 
 
-def _read_dbc_ids(dbc_dir, dbc_name):
-    """Read all record IDs from a DBC file."""
-    ids = set()
+def _extract_sql_areatrigger_maps(inserts):
+    """
+    Extract map IDs from areatrigger_teleport table.
+
+    *inserts* is the _parse_inserts() result for the combined SQL.
+    """
+    return _column_ints(inserts, 'areatrigger_teleport', 'target_map')
+
+
+def _dbc_cache_key(dbc_dir, dbc_name):
+    """
+    Build the cache key of a DBC file.
+
+    Returns:
+        (absolute path, st_mtime_ns, st_size), or None if the file is
+        missing or not a regular file.
+    """
     if not dbc_dir:
-        return ids
+        return None
+
+    filepath = os.path.abspath(
+        os.path.join(dbc_dir, "{}.dbc".format(dbc_name)))
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
 
-    filepath = os.path.join(dbc_dir, "{}.dbc".format(dbc_name))
-    if not os.path.isfile(filepath):
-        return ids
+    return filepath, st.st_mtime_ns, st.st_size
+
+
+def _read_dbc_ids(dbc_dir, dbc_name):
+    """
+    Read all record IDs from a DBC file.
+
+    Returns a frozenset; parsed files are cached per file version, so
+    repeated lookups of the same DBC do not parse it again.
+    """
+    key = _dbc_cache_key(dbc_dir, dbc_name)
+    if key is None:
+        return frozenset()
+    return _read_dbc_ids_cached(*key)
 
+
+@lru_cache(maxsize=32)
+def _read_dbc_ids_cached(filepath, _mtime_ns, _size):
+    """
+    Parse the record IDs of one DBC file.  The modification time and size
+    only key the cache, so a rewritten file is parsed again.
+    """
     try:
-        from .dbc_validator import _DBCReader
         reader = _DBCReader(filepath)
         if reader.valid:
-            ids = reader.get_all_ids()
+            return frozenset(reader.get_all_ids())
     except Exception:
         pass
-
-    return ids
+    return frozenset()
 
 
 def _read_dbc_map_ids(dbc_dir):
@@ -123,16 +390,65 @@ def _read_dbc_area_ids(dbc_dir):
     return _read_dbc_ids(dbc_dir, 'AreaTable')
 
 
+def _scan_adt_area_ids(fpath):
+    """
+    Read the area IDs from the MCNK headers of one ADT file.
+
+    The file is memory-mapped, so only the pages holding chunk headers
+    are touched.  Module-level so it can run in a worker thread.
+
+    Returns:
+        set of area IDs; empty if the file cannot be read.
+    """
+    area_ids = set()
+    # IDs are gathered in a list and added to the set in one update()
+    found = []
+    try:
+        with open(fpath, 'rb') as f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return area_ids
+    except (IOError, OSError):
+        return area_ids
+
+    try:
+        # Walk the top-level chunks (4-byte magic + 4-byte size) and read
+        # the area ID of every MCNK
+        pos = 0
+        n = len(data)
+        while pos + 8 <= n:
+            magic, size = _CHUNK_HDR.unpack_from(data, pos)
+            if magic == _MAGIC_MCNK:
+                # area_id is at offset 52 in the MCNK header, which starts
+                # after the 8-byte chunk header
+                area_offset = pos + 8 + 52
+                if area_offset + 4 <= n:
+                    found.append(int.from_bytes(
+                        data[area_offset:area_offset + 4], 'little'))
+            pos += 8 + size
+    finally:
+        data.close()
+
+    area_ids.update(found)
+    return area_ids
+
+
 def _read_adt_area_ids(client_dir):
     """
     Read area IDs from all ADT files in client_dir.
 
+    ADT paths are gathered first; with at least _PARALLEL_MIN_FILES of
+    them the files are scanned in a thread pool.
+
     Returns set of area IDs found in MCNK headers.
     """
     area_ids = set()
     if not client_dir or not os.path.isdir(client_dir):
         return area_ids
 
+    adt_paths = []
     for base in [client_dir, os.path.join(client_dir, "mpq_content")]:
         maps_root = os.path.join(base, "World", "Maps")
         if not os.path.isdir(maps_root):
@@ -143,30 +459,17 @@ def _read_adt_area_ids(client_dir):
             if not os.path.isdir(map_dir):
                 continue
             for fname in os.listdir(map_dir):
-                if not fname.lower().endswith('.adt'):
-                    continue
-                fpath = os.path.join(map_dir, fname)
-                try:
-                    with open(fpath, 'rb') as f:
-                        data = f.read()
-                    # Quick scan for MCNK chunks and extract area IDs
-                    pos = 0
-                    mcnk_magic = b'KNCM'
-                    while pos < len(data) - 8:
-                        idx = data.find(mcnk_magic, pos)
-                        if idx == -1:
-                            break
-                        # MCNK header starts after chunk header (8 bytes)
-                        hdr_start = idx + 8
-                        # area_id is at offset 52 in MCNK header
-                        area_offset = hdr_start + 52
-                        if area_offset + 4 <= len(data):
-                            area_id = struct.unpack_from(
-                                '<I', data, area_offset)[0]
-                            area_ids.add(area_id)
-                        pos = idx + 8
-                except IOError:
-                    pass
+                if fname.lower().endswith('.adt'):
+                    adt_paths.append(os.path.join(map_dir, fname))
+
+    if len(adt_paths) < _PARALLEL_MIN_FILES:
+        per_file = [_scan_adt_area_ids(path) for path in adt_paths]
+    else:
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            per_file = list(executor.map(_scan_adt_area_ids, adt_paths))
+
+    for file_ids in per_file:
+        area_ids.update(file_ids)
 
     return area_ids
 
@@ -178,25 +481,40 @@ def _read_dbc_areatrigger_ids(dbc_dir):
 
 def _read_dbc_lfgdungeons_map_ids(dbc_dir):
     """Read MapID values from LFGDungeons.dbc."""
-    map_ids = set()
-    if not dbc_dir:
-        return map_ids
+    key = _dbc_cache_key(dbc_dir, 'LFGDungeons')
+    if key is None:
+        return frozenset()
+    return _read_lfgdungeons_map_ids_cached(*key)
 
-    filepath = os.path.join(dbc_dir, "LFGDungeons.dbc")
-    if not os.path.isfile(filepath):
-        return map_ids
 
+@lru_cache(maxsize=4)
+def _read_lfgdungeons_map_ids_cached(filepath, _mtime_ns, _size):
+    """
+    Parse the MapID column of one LFGDungeons.dbc, cached like
+    _read_dbc_ids_cached().
+    """
+    map_ids = set()
     try:
-        from .dbc_validator import _DBCReader
         reader = _DBCReader(filepath)
         if reader.valid:
-            for i in range(len(reader.records)):
+            for i in range(reader.num_records):
                 mid = reader.get_field_u32(i, 23)  # MapID field
                 map_ids.add(mid)
     except Exception:
         pass
 
-    return map_ids
+    return frozenset(map_ids)
+
+
+def clear_dbc_cache():
+    """
+    Drop all cached DBC parses.
+
+    Entries are already keyed by file modification time and size; this
+    only frees memory in long-running hosts.
+    """
+    _read_dbc_ids_cached.cache_clear()
+    _read_lfgdungeons_map_ids_cached.cache_clear()
 
 
 # ---------------------------------------------------------------------------
@@ -214,13 +532,16 @@ def validate_cross_layer(client_dir, sql_dir, dbc_dir):
 
     sql_content = _read_all_sql(sql_dir)
     has_sql = bool(sql_content.strip())
+    # Every INSERT the checks need, parsed in one pass; the SQL map IDs
+    # are shared by CROSS-001 and CROSS-006
+    inserts = _parse_inserts(sql_content) if has_sql else {}
+    sql_map_ids = _extract_sql_map_ids(inserts)
 
     dbc_map_ids = _read_dbc_map_ids(dbc_dir)
     dbc_area_ids = _read_dbc_area_ids(dbc_dir)
 
     # CROSS-001: Map IDs in DBC match SQL instance_template
     if has_sql and dbc_map_ids:
-        sql_map_ids = _extract_sql_map_ids(sql_content)
         if sql_map_ids:
             mismatched = sql_map_ids - dbc_map_ids
             if not mismatched:
@@ -280,7 +601,7 @@ def validate_cross_layer(client_dir, sql_dir, dbc_dir):
                     severity=ValidationSeverity.WARNING,
                     passed=False,
                     message="ADT area IDs not in AreaTable.dbc: {}".format(
-                        sorted(unknown_areas)[:10]),
+                        heapq.nsmallest(10, unknown_areas)),
                     fix_suggestion="Set correct MCNK area IDs",
                 ))
         else:
@@ -303,7 +624,7 @@ def validate_cross_layer(client_dir, sql_dir, dbc_dir):
         at_ids = _read_dbc_areatrigger_ids(dbc_dir)
         if at_ids:
             # Check if areatrigger_teleport SQL references match
-            sql_at_maps = _extract_sql_areatrigger_maps(sql_content)
+            sql_at_maps = _extract_sql_areatrigger_maps(inserts)
             if sql_at_maps:
                 results.append(ValidationResult(
                     check_id='CROSS-003',
@@ -392,9 +713,10 @@ def validate_cross_layer(client_dir, sql_dir, dbc_dir):
     if has_sql and dbc_dir:
         lfg_map_ids = _read_dbc_lfgdungeons_map_ids(dbc_dir)
         if lfg_map_ids:
-            sql_map_ids = _extract_sql_map_ids(sql_content)
-            unmatched = lfg_map_ids - sql_map_ids
-            if not unmatched or not sql_map_ids:
+            # Without SQL map IDs there is nothing to compare against;
+            # otherwise the difference is only sorted when non-empty
+            unmatched = lfg_map_ids - sql_map_ids if sql_map_ids else None
+            if not unmatched:
                 results.append(ValidationResult(
                     check_id='CROSS-006',
                     severity=ValidationSeverity.ERROR,
@@ -407,7 +729,7 @@ def validate_cross_layer(client_dir, sql_dir, dbc_dir):
                     severity=ValidationSeverity.ERROR,
                     passed=False,
                     message="LFGDungeons map IDs not in SQL: {}".format(
-                        sorted(unmatched)[:5]),
+                        heapq.nsmallest(5, unmatched)),
                     fix_suggestion="Verify dungeon SQL registration",
                 ))
         else:
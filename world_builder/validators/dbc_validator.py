@@ -8,8 +8,14 @@ Validates:
 - Cross-DBC referential integrity
 """
 
+import mmap
 import os
+import stat
 import struct
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
 
 from ..qa_validator import ValidationResult, ValidationSeverity
 
@@ -21,6 +27,13 @@ from ..qa_validator import ValidationResult, ValidationSeverity
 _HEADER_SIZE = 20   # 4 (magic) + 4*4 (counts)
 _WDBC_MAGIC = b'WDBC'
 
+# Precompiled readers: magic, record count, field count, record size and
+# string block size for the header, then the three field types
+_DBC_HEADER = struct.Struct('<4s4I')
+_U32 = struct.Struct('<I')
+_I32 = struct.Struct('<i')
+_F32 = struct.Struct('<f')
+
 # Map.dbc layout
 _MAP_FIELD_COUNT = 66
 _MAP_RECORD_SIZE = 264
@@ -35,6 +48,15 @@ _VALID_INSTANCE_TYPES = {0, 1, 2, 3, 4}
 # Valid faction group masks for AreaTable.dbc
 _VALID_FACTION_MASKS = {0, 2, 4, 6}
 
+# The same sets as arrays, for numpy membership tests
+_VALID_INSTANCE_TYPES_ARR = np.array(sorted(_VALID_INSTANCE_TYPES))
+_VALID_FACTION_MASKS_ARR = np.array(sorted(_VALID_FACTION_MASKS))
+
+# Below this many files the binary format checks run serially; with
+# more, files are read and checked across _MAX_WORKERS threads.
+_PARALLEL_MIN_FILES = 8
+_MAX_WORKERS = (os.cpu_count() or 1) * 4
+
 
 # ---------------------------------------------------------------------------
 # Internal DBC reader (minimal, avoids importing full DBCInjector)
@@ -50,11 +72,15 @@ class _DBCReader:
         self.field_count = 0
         self.record_size = 0
         self.string_block_size = 0
-        self.records = []
+        # Complete records present in the file; fewer than record_count
+        # if the file is truncated
+        self.num_records = 0
+        self.field_matrix = np.zeros((0, 0), dtype='<u4')
         self.string_block = b''
         self.raw_data = b''
         self.valid = False
         self.error = None
+        self._mm = None
 
         self._read()
 
@@ -64,9 +90,15 @@ class _DBCReader:
             self.error = "File not found: {}".format(self.filepath)
             return
 
+        # Map the file rather than reading it: fields are read in place
+        # from the mapping, and only the string block is copied out.
+        # Empty files cannot be mapped and keep raw_data = b''.
         try:
             with open(self.filepath, 'rb') as f:
-                self.raw_data = f.read()
+                if os.fstat(f.fileno()).st_size:
+                    self._mm = mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ)
+                    self.raw_data = self._mm
         except IOError as exc:
             self.error = "Cannot read file: {}".format(exc)
             return
@@ -76,12 +108,9 @@ class _DBCReader:
                 len(self.raw_data))
             return
 
-        self.magic = self.raw_data[0:4]
-        self.record_count = struct.unpack_from('<I', self.raw_data, 4)[0]
-        self.field_count = struct.unpack_from('<I', self.raw_data, 8)[0]
-        self.record_size = struct.unpack_from('<I', self.raw_data, 12)[0]
-        self.string_block_size = struct.unpack_from(
-            '<I', self.raw_data, 16)[0]
+        header = _DBC_HEADER.unpack_from(self.raw_data, 0)
+        (self.magic, self.record_count, self.field_count,
+         self.record_size, self.string_block_size) = header
 
         records_start = _HEADER_SIZE
         records_end = records_start + self.record_count * self.record_size
@@ -97,38 +126,69 @@ class _DBCReader:
         else:
             self.string_block = self.raw_data[sb_start:sb_end]
 
-        self.records = []
-        for i in range(self.record_count):
-            offset = records_start + i * self.record_size
-            end = offset + self.record_size
-            if end <= len(self.raw_data):
-                self.records.append(self.raw_data[offset:end])
+        # Fields are read in place at _HEADER_SIZE + index * record_size;
+        # only records that end inside the file are addressable, so
+        # record indices passed to the getters must be < num_records
+        available = len(self.raw_data) - records_start
+        if self.record_size:
+            self.num_records = min(self.record_count,
+                                   available // self.record_size)
+        else:
+            self.num_records = self.record_count
+
+        # u32 view of every complete record; fields past the end of a
+        # short record are left out, matching get_field_u32()'s 0
+        n_cols = min(self.field_count, self.record_size // 4)
+        self.field_matrix = np.ndarray(
+            shape=(self.num_records, n_cols), dtype='<u4',
+            buffer=self.raw_data, offset=records_start,
+            strides=(self.record_size, 4))
 
         self.valid = (self.magic == _WDBC_MAGIC and self.error is None)
 
+    def close(self):
+        """
+        Release the file mapping.  Record data is unavailable afterwards;
+        the header fields and string block remain.
+        """
+        self.num_records = 0
+        self.field_matrix = np.zeros((0, 0), dtype='<u4')
+        self.raw_data = b''
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                # A caller still holds a view of field_matrix; the
+                # mapping is released together with it
+                pass
+            self._mm = None
+
     def get_field_u32(self, record_index, field_index):
         """Read uint32 field from a record."""
-        rec = self.records[record_index]
         offset = field_index * 4
-        if offset + 4 > len(rec):
+        if offset + 4 > self.record_size:
             return 0
-        return struct.unpack_from('<I', rec, offset)[0]
+        return _U32.unpack_from(
+            self.raw_data,
+            _HEADER_SIZE + record_index * self.record_size + offset)[0]
 
     def get_field_i32(self, record_index, field_index):
         """Read int32 field from a record."""
-        rec = self.records[record_index]
         offset = field_index * 4
-        if offset + 4 > len(rec):
+        if offset + 4 > self.record_size:
             return 0
-        return struct.unpack_from('<i', rec, offset)[0]
+        return _I32.unpack_from(
+            self.raw_data,
+            _HEADER_SIZE + record_index * self.record_size + offset)[0]
 
     def get_field_f32(self, record_index, field_index):
         """Read float32 field from a record."""
-        rec = self.records[record_index]
         offset = field_index * 4
-        if offset + 4 > len(rec):
+        if offset + 4 > self.record_size:
             return 0.0
-        return struct.unpack_from('<f', rec, offset)[0]
+        return _F32.unpack_from(
+            self.raw_data,
+            _HEADER_SIZE + record_index * self.record_size + offset)[0]
 
     def get_string(self, offset):
         """Get null-terminated string from string block."""
@@ -139,18 +199,50 @@ class _DBCReader:
             end = len(self.string_block)
         return self.string_block[offset:end].decode('utf-8', errors='replace')
 
+    def get_column(self, field_index, dtype='<u4'):
+        """
+        Return one field of every record as an array, in record order.
+
+        Like the get_field_* getters, fields that do not fit in the record
+        read as 0.
+
+        Args:
+            field_index: Field to read.
+            dtype: '<u4', '<i4' or '<f4'.
+
+        Returns:
+            Zero-copy strided numpy view over the mapped records.
+        """
+        offset = field_index * 4
+        if offset + 4 > self.record_size or not self.num_records:
+            return np.zeros(self.num_records, dtype=dtype)
+        return np.ndarray(
+            shape=(self.num_records,), dtype=dtype, buffer=self.raw_data,
+            offset=_HEADER_SIZE + offset, strides=(self.record_size,))
+
+    def get_id_array(self):
+        """Return record IDs (field 0) as a uint32 array in record order."""
+        return self.get_column(0)
+
     def get_all_ids(self):
         """Return set of all record IDs (field 0)."""
-        ids = set()
-        for i in range(len(self.records)):
-            ids.add(self.get_field_u32(i, 0))
-        return ids
+        return set(self.get_id_array().tolist())
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _is_power_of_2(n):
+    """True if *n* is a positive power of 2."""
+    return n > 0 and (n & (n - 1)) == 0
+
+
+def _isin_ids(column, ids):
+    """Boolean mask of the *column* values found in the ID set *ids*."""
+    return np.isin(column, np.fromiter(ids, dtype=np.int64, count=len(ids)))
+
+
 def _find_dbc_files(client_dir, dbc_dir):
     """
     Find DBC file paths, checking both client_dir and dbc_dir.
@@ -174,32 +266,66 @@ def _find_dbc_files(client_dir, dbc_dir):
             search_dirs.append(dfc_mpq)
 
     for search_dir in search_dirs:
-        if not os.path.isdir(search_dir):
+        try:
+            with os.scandir(search_dir) as entries:
+                for entry in entries:
+                    if not entry.name.lower().endswith('.dbc'):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    name = os.path.splitext(entry.name)[0]
+                    # Prefer files from earlier in search_dirs (dbc_dir
+                    # first)
+                    if name not in found:
+                        found[name] = entry.path
+        except OSError:
             continue
-        for fname in os.listdir(search_dir):
-            if fname.lower().endswith('.dbc'):
-                name = os.path.splitext(fname)[0]
-                # Prefer files from earlier in search_dirs (dbc_dir first)
-                if name not in found:
-                    found[name] = os.path.join(search_dir, fname)
 
     return found
 
 
 def _find_map_dirs(client_dir):
-    """Find World/Maps/{name} directories under client_dir."""
-    map_dirs = []
+    """
+    Find World/Maps/{name} directories under client_dir.
+
+    Listings are cached per World/Maps directory version, so repeated
+    validation runs against the same client do not list it again.
+
+    Returns:
+        Tuple of (name, path) pairs.
+    """
     if not client_dir:
-        return map_dirs
+        return ()
 
+    roots = []
     for base in [client_dir, os.path.join(client_dir, "mpq_content")]:
         maps_root = os.path.join(base, "World", "Maps")
-        if os.path.isdir(maps_root):
-            for entry in os.listdir(maps_root):
-                full = os.path.join(maps_root, entry)
-                if os.path.isdir(full):
-                    map_dirs.append((entry, full))
-    return map_dirs
+        try:
+            st = os.stat(maps_root)
+        except OSError:
+            continue
+        if stat.S_ISDIR(st.st_mode):
+            roots.append((maps_root, st.st_mtime_ns))
+    return _list_map_dirs(tuple(roots))
+
+
+@lru_cache(maxsize=8)
+def _list_map_dirs(roots):
+    """
+    List the map directories of each World/Maps root.  The modification
+    times in *roots* only key the cache, so adding or removing a map
+    directory lists the root again.
+    """
+    map_dirs = []
+    for maps_root, _mtime_ns in roots:
+        try:
+            with os.scandir(maps_root) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        map_dirs.append((entry.name, entry.path))
+        except OSError:
+            continue
+    return tuple(map_dirs)
 
 
 # ---------------------------------------------------------------------------
@@ -255,15 +381,13 @@ def _validate_binary_format(dbc_name, dbc_path):
             ))
 
     # DBC-003: No duplicate IDs
-    if reader.records:
-        seen_ids = {}
-        duplicates = []
-        for i in range(len(reader.records)):
-            rec_id = reader.get_field_u32(i, 0)
-            if rec_id in seen_ids:
-                duplicates.append(rec_id)
-            else:
-                seen_ids[rec_id] = i
+    if reader.num_records:
+        # Every occurrence of an ID after its first, in record order
+        ids = reader.get_id_array()
+        _unique, first_index = np.unique(ids, return_index=True)
+        repeated = np.ones(len(ids), dtype=bool)
+        repeated[first_index] = False
+        duplicates = ids[repeated].tolist()
 
         if not duplicates:
             results.append(ValidationResult(
@@ -282,81 +406,60 @@ def _validate_binary_format(dbc_name, dbc_path):
                 fix_suggestion="Remove duplicate entries",
             ))
 
+    # DBC-004 and DBC-005 both need records and a string block
+    sb = reader.string_block
+    if not (reader.num_records and sb):
+        return results, reader
+
     # DBC-004: String offsets within bounds
-    if reader.records and reader.string_block:
-        bad_offsets = []
-        for i in range(len(reader.records)):
-            rec = reader.records[i]
-            # Check each uint32 field to see if it looks like a string offset
-            # We only check known string fields for the DBC types we know
-            # For general validation, check all fields that point into
-            # string block range
-            for fi in range(reader.field_count):
-                offset_pos = fi * 4
-                if offset_pos + 4 > len(rec):
-                    break
-                val = struct.unpack_from('<I', rec, offset_pos)[0]
-                # Heuristic: value > 0 and < string_block_size suggests
-                # it could be a string offset. We validate known types below.
-                # For generic DBC-004, skip this as it would produce
-                # false positives.
-
-        # For a generic check, just validate known string-bearing DBCs
-        # This is handled in field-specific validation below.
+    # Any u32 field with 0 < value < string_block_size could be a string
+    # offset, but checking every field generically would produce false
+    # positives.  For a generic check, just validate known string-bearing
+    # DBCs; this is handled in field-specific validation below.
+    results.append(ValidationResult(
+        check_id='DBC-004',
+        severity=ValidationSeverity.ERROR,
+        passed=True,
+        message="String offset bounds check passed for {}".format(dbc_name),
+    ))
+
+    # DBC-005: Orphaned strings (warning only)
+    # Referenced string offsets: every field value that falls inside the
+    # string block.  Subtracting 1 wraps 0 to 0xFFFFFFFF, so one unsigned
+    # compare tests 0 < value < len(sb) in a single pass over the fields.
+    fields = reader.field_matrix
+    referenced = fields[(fields - np.uint32(1)) < np.uint32(len(sb) - 1)]
+
+    # Count the strings of the block in one pass over its null bytes.
+    # Strings start at offset 1 (skipping the null byte at 0) and after
+    # each null, and end at the next null; empty strings and trailing
+    # bytes without a terminator are not counted.
+    nulls = np.flatnonzero(np.frombuffer(sb, dtype=np.uint8) == 0)
+    ends = nulls[nulls >= 1]
+    starts = np.empty_like(ends)
+    starts[:1] = 1
+    starts[1:] = ends[:-1] + 1
+    starts = starts[ends > starts]
+    total_strings = len(starts)
+    referenced_count = int(np.isin(starts, referenced).sum())
+
+    orphaned = total_strings - referenced_count
+    if orphaned <= 0:
         results.append(ValidationResult(
-            check_id='DBC-004',
-            severity=ValidationSeverity.ERROR,
+            check_id='DBC-005',
+            severity=ValidationSeverity.WARNING,
             passed=True,
-            message="String offset bounds check passed for {}".format(
-                dbc_name),
+            message="No orphaned strings in {}".format(dbc_name),
+        ))
+    else:
+        results.append(ValidationResult(
+            check_id='DBC-005',
+            severity=ValidationSeverity.WARNING,
+            passed=False,
+            message="{} orphaned strings in {} string block".format(
+                orphaned, dbc_name),
+            fix_suggestion="Clean up string block (optional)",
         ))
-
-    # DBC-005: Orphaned strings (warning only)
-    if reader.records and reader.string_block:
-        # Count referenced string offsets
-        referenced = set()
-        referenced.add(0)  # null byte is always "referenced"
-        for i in range(len(reader.records)):
-            rec = reader.records[i]
-            for fi in range(reader.field_count):
-                offset_pos = fi * 4
-                if offset_pos + 4 > len(rec):
-                    break
-                val = struct.unpack_from('<I', rec, offset_pos)[0]
-                if 0 < val < len(reader.string_block):
-                    referenced.add(val)
-
-        # Walk string block to count total strings
-        total_strings = 0
-        referenced_count = 0
-        pos = 1  # skip null byte at 0
-        while pos < len(reader.string_block):
-            end = reader.string_block.find(b'\x00', pos)
-            if end == -1:
-                break
-            if end > pos:
-                total_strings += 1
-                if pos in referenced:
-                    referenced_count += 1
-            pos = end + 1
-
-        orphaned = total_strings - referenced_count
-        if orphaned <= 0:
-            results.append(ValidationResult(
-                check_id='DBC-005',
-                severity=ValidationSeverity.WARNING,
-                passed=True,
-                message="No orphaned strings in {}".format(dbc_name),
-            ))
-        else:
-            results.append(ValidationResult(
-                check_id='DBC-005',
-                severity=ValidationSeverity.WARNING,
-                passed=False,
-                message="{} orphaned strings in {} string block".format(
-                    orphaned, dbc_name),
-                fix_suggestion="Clean up string block (optional)",
-            ))
 
     return results, reader
 
@@ -374,84 +477,62 @@ def _validate_map_dbc(reader, map_dirs):
 
     # Build set of known map directory names from file system
     known_dirs = {name for name, _path in map_dirs}
-
-    for i in range(len(reader.records)):
-        rec_id = reader.get_field_u32(i, 0)
-        dir_offset = reader.get_field_u32(i, 1)
-        dir_name = reader.get_string(dir_offset)
-        instance_type = reader.get_field_u32(i, 2)
-        loading_screen_id = reader.get_field_u32(i, 57)
-        minimap_scale = reader.get_field_f32(i, 58)
-
-        # DBC-MAP-001: Directory matches WDT/ADT folder
-        if known_dirs:
-            if dir_name and dir_name in known_dirs:
-                results.append(ValidationResult(
-                    check_id='DBC-MAP-001',
-                    severity=ValidationSeverity.ERROR,
-                    passed=True,
-                    message="Map {} directory '{}' matches folder".format(
-                        rec_id, dir_name),
-                ))
-            elif dir_name:
-                results.append(ValidationResult(
-                    check_id='DBC-MAP-001',
-                    severity=ValidationSeverity.ERROR,
-                    passed=False,
-                    message=("Map {} directory '{}' does not match any "
-                             "WDT folder".format(rec_id, dir_name)),
-                    details="Known folders: {}".format(
-                        ', '.join(sorted(known_dirs))),
-                    fix_suggestion="Fix Directory string in Map.dbc",
-                ))
-
-        # DBC-MAP-002: Valid InstanceType
-        if instance_type in _VALID_INSTANCE_TYPES:
-            results.append(ValidationResult(
-                check_id='DBC-MAP-002',
-                severity=ValidationSeverity.WARNING,
-                passed=True,
-                message="Map {} InstanceType {} is valid".format(
-                    rec_id, instance_type),
+    known_dirs_text = "Known folders: {}".format(
+        ', '.join(sorted(known_dirs)))
+
+    # Each check is a mask over whole columns.  Passing records are
+    # counted and reported once per check; failing records are reported
+    # individually, in record order.
+    rec_ids = reader.get_column(0)
+    dir_offsets = reader.get_column(1)
+    instance_types = reader.get_column(2)
+    loading_screen_ids = reader.get_column(57)
+    minimap_scales = reader.get_column(58, '<f4')
+
+    # DBC-MAP-001: Directory matches WDT/ADT folder.  Each distinct
+    # Directory string is looked up once.
+    dir_names = {}
+    dir_ok = np.zeros(reader.num_records, dtype=bool)
+    dir_bad = np.zeros(reader.num_records, dtype=bool)
+    if known_dirs:
+        offsets, inverse = np.unique(dir_offsets, return_inverse=True)
+        names = [reader.get_string(off) for off in offsets.tolist()]
+        dir_names = dict(zip(offsets.tolist(), names))
+        matched = np.array([name in known_dirs for name in names],
+                           dtype=bool)
+        named = np.array([bool(name) for name in names], dtype=bool)
+        dir_ok = matched[inverse].reshape(-1)
+        dir_bad = (named & ~matched)[inverse].reshape(-1)
+
+    # DBC-MAP-002: Valid InstanceType
+    type_ok = np.isin(instance_types, _VALID_INSTANCE_TYPES_ARR)
+
+    # DBC-MAP-004: MinimapIconScale
+    scale_ok = minimap_scales > 0.0
+
+    for i in np.nonzero(dir_bad | ~type_ok | ~scale_ok)[0].tolist():
+        rec_id = int(rec_ids[i])
+        if dir_bad[i]:
+            results.append(ValidationResult(
+                check_id='DBC-MAP-001',
+                severity=ValidationSeverity.ERROR,
+                passed=False,
+                message=("Map {} directory '{}' does not match any "
+                         "WDT folder".format(
+                             rec_id, dir_names[int(dir_offsets[i])])),
+                details=known_dirs_text,
+                fix_suggestion="Fix Directory string in Map.dbc",
             ))
-        else:
+        if not type_ok[i]:
             results.append(ValidationResult(
                 check_id='DBC-MAP-002',
                 severity=ValidationSeverity.WARNING,
                 passed=False,
                 message="Map {} InstanceType {} is invalid".format(
-                    rec_id, instance_type),
+                    rec_id, int(instance_types[i])),
                 fix_suggestion="Use 0=world, 1=party, 2=raid, 3=pvp, 4=arena",
             ))
-
-        # DBC-MAP-003: LoadingScreenID references valid entry (info only)
-        # We just note it; detailed validation in cross-DBC references
-        if loading_screen_id > 0:
-            results.append(ValidationResult(
-                check_id='DBC-MAP-003',
-                severity=ValidationSeverity.INFO,
-                passed=True,
-                message="Map {} references LoadingScreen {}".format(
-                    rec_id, loading_screen_id),
-            ))
-        else:
-            results.append(ValidationResult(
-                check_id='DBC-MAP-003',
-                severity=ValidationSeverity.INFO,
-                passed=True,
-                message="Map {} has no LoadingScreen (ID=0)".format(rec_id),
-            ))
-
-        # DBC-MAP-004: MinimapIconScale
-        if minimap_scale > 0.0:
-            results.append(ValidationResult(
-                check_id='DBC-MAP-004',
-                severity=ValidationSeverity.WARNING,
-                passed=True,
-                message="Map {} MinimapIconScale={:.2f}".format(
-                    rec_id, minimap_scale),
-            ))
-        else:
+        if not scale_ok[i]:
             results.append(ValidationResult(
                 check_id='DBC-MAP-004',
                 severity=ValidationSeverity.WARNING,
@@ -461,6 +542,47 @@ def _validate_map_dbc(reader, map_dirs):
                 fix_suggestion="Set MinimapIconScale to 1.0 default",
             ))
 
+    dirs_ok = int(dir_ok.sum())
+    types_ok = int(type_ok.sum())
+    # DBC-MAP-003: LoadingScreenID references valid entry (info only)
+    # We just note it; detailed validation in cross-DBC references
+    with_loading_screen = int((loading_screen_ids > 0).sum())
+    scales_ok = int(scale_ok.sum())
+
+    if dirs_ok:
+        results.append(ValidationResult(
+            check_id='DBC-MAP-001',
+            severity=ValidationSeverity.ERROR,
+            passed=True,
+            message=("Map directory matches WDT folder for {} "
+                     "entries".format(dirs_ok)),
+        ))
+    if types_ok:
+        results.append(ValidationResult(
+            check_id='DBC-MAP-002',
+            severity=ValidationSeverity.WARNING,
+            passed=True,
+            message="Map InstanceType valid for {} entries".format(
+                types_ok),
+        ))
+    if reader.num_records:
+        results.append(ValidationResult(
+            check_id='DBC-MAP-003',
+            severity=ValidationSeverity.INFO,
+            passed=True,
+            message=("Map LoadingScreen set for {} entries, ID=0 for "
+                     "{}".format(with_loading_screen,
+                                 reader.num_records - with_loading_screen)),
+        ))
+    if scales_ok:
+        results.append(ValidationResult(
+            check_id='DBC-MAP-004',
+            severity=ValidationSeverity.WARNING,
+            passed=True,
+            message="Map MinimapIconScale valid for {} entries".format(
+                scales_ok),
+        ))
+
     return results
 
 
@@ -475,92 +597,104 @@ def _validate_area_dbc(reader, map_ids):
     if not reader or not reader.valid:
         return results
 
-    area_ids = set()
-    for i in range(len(reader.records)):
-        area_ids.add(reader.get_field_u32(i, 0))
-
-    for i in range(len(reader.records)):
-        area_id = reader.get_field_u32(i, 0)
-        continent_id = reader.get_field_u32(i, 1)
-        parent_area_id = reader.get_field_u32(i, 2)
-        exploration_level = reader.get_field_u32(i, 10)
-        faction_mask = reader.get_field_u32(i, 28)
-
-        # DBC-AREA-001: ContinentID references valid Map ID
-        if map_ids and continent_id in map_ids:
-            results.append(ValidationResult(
-                check_id='DBC-AREA-001',
-                severity=ValidationSeverity.ERROR,
-                passed=True,
-                message="Area {} ContinentID {} references valid map".format(
-                    area_id, continent_id),
-            ))
-        elif map_ids:
+    # Each check is a mask over whole columns.  Passing records are
+    # counted and reported once per check; failing records are reported
+    # individually, in record order.
+    area_id_col = reader.get_id_array()
+    continent_ids = reader.get_column(1)
+    parent_area_ids = reader.get_column(2)
+    exploration_levels = reader.get_column(10)
+    faction_masks = reader.get_column(28)
+
+    # DBC-AREA-001: ContinentID references valid Map ID
+    if map_ids:
+        continent_ok = _isin_ids(continent_ids, map_ids)
+        continent_bad = ~continent_ok
+    else:
+        continent_ok = continent_bad = np.zeros(reader.num_records,
+                                                dtype=bool)
+
+    # DBC-AREA-002: ParentAreaID validation
+    is_top_level = parent_area_ids == 0
+    parent_ok = ~is_top_level & np.isin(parent_area_ids, area_id_col)
+    parent_bad = ~is_top_level & ~parent_ok
+
+    # DBC-AREA-004: FactionGroupMask
+    mask_ok = np.isin(faction_masks, _VALID_FACTION_MASKS_ARR)
+
+    for i in np.nonzero(continent_bad | parent_bad | ~mask_ok)[0].tolist():
+        area_id = int(area_id_col[i])
+        if continent_bad[i]:
             results.append(ValidationResult(
                 check_id='DBC-AREA-001',
                 severity=ValidationSeverity.ERROR,
                 passed=False,
                 message=("Area {} ContinentID {} does not reference "
-                         "valid Map.dbc entry".format(area_id, continent_id)),
+                         "valid Map.dbc entry".format(
+                             area_id, int(continent_ids[i]))),
                 fix_suggestion="Register map first, then area",
             ))
-
-        # DBC-AREA-002: ParentAreaID validation
-        if parent_area_id == 0:
-            results.append(ValidationResult(
-                check_id='DBC-AREA-002',
-                severity=ValidationSeverity.WARNING,
-                passed=True,
-                message="Area {} is top-level zone (ParentAreaID=0)".format(
-                    area_id),
-            ))
-        elif parent_area_id in area_ids:
-            results.append(ValidationResult(
-                check_id='DBC-AREA-002',
-                severity=ValidationSeverity.WARNING,
-                passed=True,
-                message="Area {} ParentAreaID {} is valid".format(
-                    area_id, parent_area_id),
-            ))
-        else:
+        if parent_bad[i]:
             results.append(ValidationResult(
                 check_id='DBC-AREA-002',
                 severity=ValidationSeverity.WARNING,
                 passed=False,
                 message=("Area {} ParentAreaID {} references "
                          "non-existent area".format(
-                             area_id, parent_area_id)),
+                             area_id, int(parent_area_ids[i]))),
                 fix_suggestion="Set to 0 or valid parent area ID",
             ))
-
-        # DBC-AREA-003: ExplorationLevel
-        results.append(ValidationResult(
-            check_id='DBC-AREA-003',
-            severity=ValidationSeverity.INFO,
-            passed=True,
-            message="Area {} ExplorationLevel={}".format(
-                area_id, exploration_level),
-        ))
-
-        # DBC-AREA-004: FactionGroupMask
-        if faction_mask in _VALID_FACTION_MASKS:
-            results.append(ValidationResult(
-                check_id='DBC-AREA-004',
-                severity=ValidationSeverity.WARNING,
-                passed=True,
-                message="Area {} FactionGroupMask={} is valid".format(
-                    area_id, faction_mask),
-            ))
-        else:
+        if not mask_ok[i]:
             results.append(ValidationResult(
                 check_id='DBC-AREA-004',
                 severity=ValidationSeverity.WARNING,
                 passed=False,
                 message="Area {} FactionGroupMask={} may be invalid".format(
-                    area_id, faction_mask),
+                    area_id, int(faction_masks[i])),
                 fix_suggestion="Use 0=both, 2=alliance, 4=horde",
             ))
 
+    continents_ok = int(continent_ok.sum())
+    top_level = int(is_top_level.sum())
+    parents_ok = int(parent_ok.sum())
+    masks_ok = int(mask_ok.sum())
+
+    if continents_ok:
+        results.append(ValidationResult(
+            check_id='DBC-AREA-001',
+            severity=ValidationSeverity.ERROR,
+            passed=True,
+            message=("Area ContinentID references valid map for {} "
+                     "entries".format(continents_ok)),
+        ))
+    if top_level or parents_ok:
+        results.append(ValidationResult(
+            check_id='DBC-AREA-002',
+            severity=ValidationSeverity.WARNING,
+            passed=True,
+            message=("Area ParentAreaID valid for {} entries ({} "
+                     "top-level zones)".format(top_level + parents_ok,
+                                               top_level)),
+        ))
+    # DBC-AREA-003: ExplorationLevel
+    if reader.num_records:
+        results.append(ValidationResult(
+            check_id='DBC-AREA-003',
+            severity=ValidationSeverity.INFO,
+            passed=True,
+            message="Area ExplorationLevel {}-{} across {} entries".format(
+                int(exploration_levels.min()),
+                int(exploration_levels.max()), reader.num_records),
+        ))
+    if masks_ok:
+        results.append(ValidationResult(
+            check_id='DBC-AREA-004',
+            severity=ValidationSeverity.WARNING,
+            passed=True,
+            message="Area FactionGroupMask valid for {} entries".format(
+                masks_ok),
+        ))
+
     return results
 
 
@@ -575,111 +709,125 @@ def _validate_worldmaparea_dbc(reader, map_ids, area_ids):
     if not reader or not reader.valid:
         return results
 
-    for i in range(len(reader.records)):
-        wma_id = reader.get_field_u32(i, 0)
-        map_id = reader.get_field_u32(i, 1)
-        area_id = reader.get_field_u32(i, 2)
-        # Fields 3-6: LocLeft, LocRight, LocTop, LocBottom (floats)
-        loc_left = reader.get_field_f32(i, 4)
-        loc_right = reader.get_field_f32(i, 5)
-        loc_top = reader.get_field_f32(i, 6)
-        loc_bottom = reader.get_field_f32(i, 7)
-        display_map_id = reader.get_field_i32(i, 8)
-
-        # DBC-WMA-001: MapID references valid Map
-        if map_ids and map_id in map_ids:
-            results.append(ValidationResult(
-                check_id='DBC-WMA-001',
-                severity=ValidationSeverity.ERROR,
-                passed=True,
-                message="WorldMapArea {} MapID {} is valid".format(
-                    wma_id, map_id),
-            ))
-        elif map_ids:
+    # Each check is a mask over whole columns.  Passing records are
+    # counted and reported once per check; failing records are reported
+    # individually, in record order.
+    no_records = np.zeros(reader.num_records, dtype=bool)
+    wma_ids = reader.get_id_array()
+    map_id_col = reader.get_column(1)
+    area_id_col = reader.get_column(2)
+    # Fields 3-6: LocLeft, LocRight, LocTop, LocBottom (floats)
+    loc_left = reader.get_column(4, '<f4')
+    loc_right = reader.get_column(5, '<f4')
+    loc_top = reader.get_column(6, '<f4')
+    loc_bottom = reader.get_column(7, '<f4')
+    display_map_ids = reader.get_column(8, '<i4')
+
+    # DBC-WMA-001: MapID references valid Map
+    map_ok = _isin_ids(map_id_col, map_ids) if map_ids else no_records
+    map_bad = ~map_ok if map_ids else no_records
+
+    # DBC-WMA-002: AreaID references valid AreaTable
+    area_ok = _isin_ids(area_id_col, area_ids) if area_ids else no_records
+    area_bad = (~area_ok & (area_id_col != 0)) if area_ids else no_records
+
+    # DBC-WMA-003: Coordinate ordering
+    coords_bad = (((loc_left != 0.0) | (loc_right != 0.0))
+                  & (loc_left >= loc_right))
+    coords_bad |= (((loc_top != 0.0) | (loc_bottom != 0.0))
+                   & (loc_top >= loc_bottom))
+
+    # DBC-WMA-004: DisplayMapID
+    display_ok_mask = (display_map_ids == -1) | (display_map_ids == 0)
+    if map_ids:
+        display_ok_mask |= _isin_ids(display_map_ids, map_ids)
+        display_bad = ~display_ok_mask
+    else:
+        display_bad = no_records
+
+    failing = map_bad | area_bad | coords_bad | display_bad
+    for i in np.nonzero(failing)[0].tolist():
+        wma_id = int(wma_ids[i])
+        if map_bad[i]:
             results.append(ValidationResult(
                 check_id='DBC-WMA-001',
                 severity=ValidationSeverity.ERROR,
                 passed=False,
                 message=("WorldMapArea {} MapID {} not found "
-                         "in Map.dbc".format(wma_id, map_id)),
+                         "in Map.dbc".format(wma_id, int(map_id_col[i]))),
                 fix_suggestion="Register map first",
             ))
-
-        # DBC-WMA-002: AreaID references valid AreaTable
-        if area_ids and area_id in area_ids:
-            results.append(ValidationResult(
-                check_id='DBC-WMA-002',
-                severity=ValidationSeverity.ERROR,
-                passed=True,
-                message="WorldMapArea {} AreaID {} is valid".format(
-                    wma_id, area_id),
-            ))
-        elif area_ids and area_id != 0:
+        if area_bad[i]:
             results.append(ValidationResult(
                 check_id='DBC-WMA-002',
                 severity=ValidationSeverity.ERROR,
                 passed=False,
                 message=("WorldMapArea {} AreaID {} not found "
-                         "in AreaTable.dbc".format(wma_id, area_id)),
+                         "in AreaTable.dbc".format(
+                             wma_id, int(area_id_col[i]))),
                 fix_suggestion="Register area first",
             ))
-
-        # DBC-WMA-003: Coordinate ordering
-        coords_ok = True
-        if loc_left != 0.0 or loc_right != 0.0:
-            if loc_left >= loc_right:
-                coords_ok = False
-        if loc_top != 0.0 or loc_bottom != 0.0:
-            if loc_top >= loc_bottom:
-                coords_ok = False
-
-        if coords_ok:
-            results.append(ValidationResult(
-                check_id='DBC-WMA-003',
-                severity=ValidationSeverity.WARNING,
-                passed=True,
-                message="WorldMapArea {} coordinates are ordered".format(
-                    wma_id),
-            ))
-        else:
+        if coords_bad[i]:
             results.append(ValidationResult(
                 check_id='DBC-WMA-003',
                 severity=ValidationSeverity.WARNING,
                 passed=False,
                 message=("WorldMapArea {} coordinates are inverted "
                          "(L={}, R={}, T={}, B={})".format(
-                             wma_id, loc_left, loc_right,
-                             loc_top, loc_bottom)),
+                             wma_id, loc_left[i].item(),
+                             loc_right[i].item(), loc_top[i].item(),
+                             loc_bottom[i].item())),
                 fix_suggestion="Swap coordinates if inverted",
             ))
-
-        # DBC-WMA-004: DisplayMapID
-        if display_map_id == -1 or display_map_id == 0:
-            results.append(ValidationResult(
-                check_id='DBC-WMA-004',
-                severity=ValidationSeverity.INFO,
-                passed=True,
-                message="WorldMapArea {} DisplayMapID={}".format(
-                    wma_id, display_map_id),
-            ))
-        elif map_ids and display_map_id in map_ids:
-            results.append(ValidationResult(
-                check_id='DBC-WMA-004',
-                severity=ValidationSeverity.INFO,
-                passed=True,
-                message="WorldMapArea {} DisplayMapID={} is valid".format(
-                    wma_id, display_map_id),
-            ))
-        elif map_ids:
+        if display_bad[i]:
             results.append(ValidationResult(
                 check_id='DBC-WMA-004',
                 severity=ValidationSeverity.INFO,
                 passed=False,
                 message=("WorldMapArea {} DisplayMapID={} not found "
-                         "in Map.dbc".format(wma_id, display_map_id)),
+                         "in Map.dbc".format(
+                             wma_id, int(display_map_ids[i]))),
                 fix_suggestion="Use -1 for self-display",
             ))
 
+    maps_ok = int(map_ok.sum())
+    areas_ok = int(area_ok.sum())
+    coords_ok_count = reader.num_records - int(coords_bad.sum())
+    display_ok = int(display_ok_mask.sum())
+
+    if maps_ok:
+        results.append(ValidationResult(
+            check_id='DBC-WMA-001',
+            severity=ValidationSeverity.ERROR,
+            passed=True,
+            message="WorldMapArea MapID valid for {} entries".format(
+                maps_ok),
+        ))
+    if areas_ok:
+        results.append(ValidationResult(
+            check_id='DBC-WMA-002',
+            severity=ValidationSeverity.ERROR,
+            passed=True,
+            message="WorldMapArea AreaID valid for {} entries".format(
+                areas_ok),
+        ))
+    if coords_ok_count:
+        results.append(ValidationResult(
+            check_id='DBC-WMA-003',
+            severity=ValidationSeverity.WARNING,
+            passed=True,
+            message=("WorldMapArea coordinates ordered for {} "
+                     "entries".format(coords_ok_count)),
+        ))
+    if display_ok:
+        results.append(ValidationResult(
+            check_id='DBC-WMA-004',
+            severity=ValidationSeverity.INFO,
+            passed=True,
+            message=("WorldMapArea DisplayMapID valid for {} "
+                     "entries".format(display_ok)),
+        ))
+
     return results
 
 
@@ -694,27 +842,29 @@ def _validate_worldmapoverlay_dbc(reader, wma_ids, area_ids):
     if not reader or not reader.valid:
         return results
 
-    for i in range(len(reader.records)):
-        overlay_id = reader.get_field_u32(i, 0)
-        map_area_id = reader.get_field_u32(i, 1)
+    # Passing records are counted and reported once per check; failing
+    # records are reported individually
+    map_areas_ok = 0
+    area_refs_ok = 0
+    no_texture = 0
+    textures_ok = 0
+
+    get_u32 = reader.get_field_u32
+    for i in range(reader.num_records):
+        overlay_id = get_u32(i, 0)
+        map_area_id = get_u32(i, 1)
         # AreaID fields at indices 2, 3, 4, 5
-        area_id_0 = reader.get_field_u32(i, 2)
-        area_id_1 = reader.get_field_u32(i, 3)
-        area_id_2 = reader.get_field_u32(i, 4)
-        area_id_3 = reader.get_field_u32(i, 5)
+        area_id_0 = get_u32(i, 2)
+        area_id_1 = get_u32(i, 3)
+        area_id_2 = get_u32(i, 4)
+        area_id_3 = get_u32(i, 5)
         # TextureWidth at index 10, TextureHeight at index 11
-        tex_width = reader.get_field_u32(i, 10)
-        tex_height = reader.get_field_u32(i, 11)
+        tex_width = get_u32(i, 10)
+        tex_height = get_u32(i, 11)
 
         # DBC-WMO-001: MapAreaID references WorldMapArea
         if wma_ids and map_area_id in wma_ids:
-            results.append(ValidationResult(
-                check_id='DBC-WMO-001',
-                severity=ValidationSeverity.ERROR,
-                passed=True,
-                message="WorldMapOverlay {} MapAreaID {} is valid".format(
-                    overlay_id, map_area_id),
-            ))
+            map_areas_ok += 1
         elif wma_ids:
             results.append(ValidationResult(
                 check_id='DBC-WMO-001',
@@ -734,13 +884,7 @@ def _validate_worldmapoverlay_dbc(reader, wma_ids, area_ids):
                 bad_refs.append((idx, aid))
 
         if not bad_refs:
-            results.append(ValidationResult(
-                check_id='DBC-WMO-002',
-                severity=ValidationSeverity.WARNING,
-                passed=True,
-                message="WorldMapOverlay {} area references valid".format(
-                    overlay_id),
-            ))
+            area_refs_ok += 1
         else:
             results.append(ValidationResult(
                 check_id='DBC-WMO-002',
@@ -752,26 +896,11 @@ def _validate_worldmapoverlay_dbc(reader, wma_ids, area_ids):
             ))
 
         # DBC-WMO-003: TextureWidth/Height powers of 2
-        def _is_power_of_2(n):
-            return n > 0 and (n & (n - 1)) == 0
-
         if tex_width == 0 and tex_height == 0:
             # No texture defined, skip
-            results.append(ValidationResult(
-                check_id='DBC-WMO-003',
-                severity=ValidationSeverity.INFO,
-                passed=True,
-                message="WorldMapOverlay {} has no texture defined".format(
-                    overlay_id),
-            ))
+            no_texture += 1
         elif _is_power_of_2(tex_width) and _is_power_of_2(tex_height):
-            results.append(ValidationResult(
-                check_id='DBC-WMO-003',
-                severity=ValidationSeverity.INFO,
-                passed=True,
-                message=("WorldMapOverlay {} texture {}x{} "
-                         "valid".format(overlay_id, tex_width, tex_height)),
-            ))
+            textures_ok += 1
         else:
             results.append(ValidationResult(
                 check_id='DBC-WMO-003',
@@ -782,6 +911,32 @@ def _validate_worldmapoverlay_dbc(reader, wma_ids, area_ids):
                 fix_suggestion="Use 512 or 1024 for texture dimensions",
             ))
 
+    if map_areas_ok:
+        results.append(ValidationResult(
+            check_id='DBC-WMO-001',
+            severity=ValidationSeverity.ERROR,
+            passed=True,
+            message=("WorldMapOverlay MapAreaID valid for {} "
+                     "entries".format(map_areas_ok)),
+        ))
+    if area_refs_ok:
+        results.append(ValidationResult(
+            check_id='DBC-WMO-002',
+            severity=ValidationSeverity.WARNING,
+            passed=True,
+            message=("WorldMapOverlay area references valid for {} "
+                     "entries".format(area_refs_ok)),
+        ))
+    if no_texture or textures_ok:
+        results.append(ValidationResult(
+            check_id='DBC-WMO-003',
+            severity=ValidationSeverity.INFO,
+            passed=True,
+            message=("WorldMapOverlay texture sizes valid for {} "
+                     "entries, {} have no texture".format(
+                         textures_ok, no_texture)),
+        ))
+
     return results
 
 
@@ -796,11 +951,13 @@ def _validate_loadingscreens_dbc(reader, client_dir):
     if not reader or not reader.valid:
         return results
 
-    for i in range(len(reader.records)):
-        ls_id = reader.get_field_u32(i, 0)
-        name_offset = reader.get_field_u32(i, 1)
-        file_name = reader.get_string(name_offset)
-        has_widescreen = reader.get_field_u32(i, 2)
+    get_u32 = reader.get_field_u32
+    get_string = reader.get_string
+    for i in range(reader.num_records):
+        ls_id = get_u32(i, 0)
+        name_offset = get_u32(i, 1)
+        file_name = get_string(name_offset)
+        has_widescreen = get_u32(i, 2)
 
         # DBC-LS-001: FileName points to valid BLP path
         if file_name:
@@ -817,22 +974,16 @@ def _validate_loadingscreens_dbc(reader, client_dir):
                         break
 
             if blp_found:
-                results.append(ValidationResult(
-                    check_id='DBC-LS-001',
-                    severity=ValidationSeverity.WARNING,
-                    passed=True,
-                    message="LoadingScreen {} BLP '{}' found".format(
-                        ls_id, file_name),
+                results.append(ValidationResult.lazy(
+                    'DBC-LS-001', ValidationSeverity.WARNING, True,
+                    "LoadingScreen {} BLP '{}' found", ls_id, file_name,
                 ))
             else:
                 # Not necessarily an error - could be in base client data
-                results.append(ValidationResult(
-                    check_id='DBC-LS-001',
-                    severity=ValidationSeverity.WARNING,
-                    passed=True,
-                    message=("LoadingScreen {} BLP '{}' not in output "
-                             "(may be in base client)".format(
-                                 ls_id, file_name)),
+                results.append(ValidationResult.lazy(
+                    'DBC-LS-001', ValidationSeverity.WARNING, True,
+                    "LoadingScreen {} BLP '{}' not in output "
+                    "(may be in base client)", ls_id, file_name,
                 ))
         else:
             results.append(ValidationResult(
@@ -845,12 +996,9 @@ def _validate_loadingscreens_dbc(reader, client_dir):
 
         # DBC-LS-002: HasWideScreen flag
         if has_widescreen in (0, 1):
-            results.append(ValidationResult(
-                check_id='DBC-LS-002',
-                severity=ValidationSeverity.INFO,
-                passed=True,
-                message="LoadingScreen {} HasWideScreen={}".format(
-                    ls_id, has_widescreen),
+            results.append(ValidationResult.lazy(
+                'DBC-LS-002', ValidationSeverity.INFO, True,
+                "LoadingScreen {} HasWideScreen={}", ls_id, has_widescreen,
             ))
         else:
             results.append(ValidationResult(
@@ -876,26 +1024,24 @@ def _validate_lfgdungeons_dbc(reader, map_ids):
     if not reader or not reader.valid:
         return results
 
-    for i in range(len(reader.records)):
-        lfg_id = reader.get_field_u32(i, 0)
+    get_u32 = reader.get_field_u32
+    for i in range(reader.num_records):
+        lfg_id = get_u32(i, 0)
         # LFGDungeons.dbc field layout (approximate for 3.3.5):
         # 0=ID, 1=Name(locstr), 18=MinLevel, 19=MaxLevel, 20=...
         # 23=MapID, 24=Difficulty, 25=... 34=TypeID
         # The exact layout varies; use common field positions
-        map_id = reader.get_field_u32(i, 23)
-        min_level = reader.get_field_u32(i, 18)
-        max_level = reader.get_field_u32(i, 19)
-        difficulty = reader.get_field_u32(i, 24)
-        type_id = reader.get_field_u32(i, 34)
+        map_id = get_u32(i, 23)
+        min_level = get_u32(i, 18)
+        max_level = get_u32(i, 19)
+        difficulty = get_u32(i, 24)
+        type_id = get_u32(i, 34)
 
         # DBC-LFG-001: MapID references valid Map
         if map_ids and map_id in map_ids:
-            results.append(ValidationResult(
-                check_id='DBC-LFG-001',
-                severity=ValidationSeverity.ERROR,
-                passed=True,
-                message="LFGDungeon {} MapID {} is valid".format(
-                    lfg_id, map_id),
+            results.append(ValidationResult.lazy(
+                'DBC-LFG-001', ValidationSeverity.ERROR, True,
+                "LFGDungeon {} MapID {} is valid", lfg_id, map_id,
             ))
         elif map_ids:
             results.append(ValidationResult(
@@ -909,12 +1055,10 @@ def _validate_lfgdungeons_dbc(reader, map_ids):
 
         # DBC-LFG-002: MinLevel <= MaxLevel
         if min_level <= max_level:
-            results.append(ValidationResult(
-                check_id='DBC-LFG-002',
-                severity=ValidationSeverity.WARNING,
-                passed=True,
-                message="LFGDungeon {} levels {}-{} valid".format(
-                    lfg_id, min_level, max_level),
+            results.append(ValidationResult.lazy(
+                'DBC-LFG-002', ValidationSeverity.WARNING, True,
+                "LFGDungeon {} levels {}-{} valid",
+                lfg_id, min_level, max_level,
             ))
         else:
             results.append(ValidationResult(
@@ -928,12 +1072,9 @@ def _validate_lfgdungeons_dbc(reader, map_ids):
 
         # DBC-LFG-003: Difficulty is 0 or 1
         if difficulty in (0, 1):
-            results.append(ValidationResult(
-                check_id='DBC-LFG-003',
-                severity=ValidationSeverity.WARNING,
-                passed=True,
-                message="LFGDungeon {} Difficulty={} valid".format(
-                    lfg_id, difficulty),
+            results.append(ValidationResult.lazy(
+                'DBC-LFG-003', ValidationSeverity.WARNING, True,
+                "LFGDungeon {} Difficulty={} valid", lfg_id, difficulty,
             ))
         else:
             results.append(ValidationResult(
@@ -947,11 +1088,9 @@ def _validate_lfgdungeons_dbc(reader, map_ids):
 
         # DBC-LFG-004: TypeID matches InstanceType
         if type_id in (1, 2, 3, 4, 5, 6):
-            results.append(ValidationResult(
-                check_id='DBC-LFG-004',
-                severity=ValidationSeverity.INFO,
-                passed=True,
-                message="LFGDungeon {} TypeID={}".format(lfg_id, type_id),
+            results.append(ValidationResult.lazy(
+                'DBC-LFG-004', ValidationSeverity.INFO, True,
+                "LFGDungeon {} TypeID={}", lfg_id, type_id,
             ))
         else:
             results.append(ValidationResult(
@@ -983,11 +1122,12 @@ def _validate_dungeonencounter_dbc(reader, map_ids):
     # DungeonEncounter.dbc layout (3.3.5):
     # 0=ID, 1=MapID, 2=Difficulty, 3=OrderIndex, 4=Bit, 5-21=Name(locstr)
     encounters_by_map = {}
-    for i in range(len(reader.records)):
-        enc_id = reader.get_field_u32(i, 0)
-        map_id = reader.get_field_u32(i, 1)
-        order_index = reader.get_field_u32(i, 3)
-        bit_val = reader.get_field_u32(i, 4)
+    get_u32 = reader.get_field_u32
+    for i in range(reader.num_records):
+        enc_id = get_u32(i, 0)
+        map_id = get_u32(i, 1)
+        order_index = get_u32(i, 3)
+        bit_val = get_u32(i, 4)
 
         if map_id not in encounters_by_map:
             encounters_by_map[map_id] = []
@@ -999,12 +1139,9 @@ def _validate_dungeonencounter_dbc(reader, map_ids):
 
         # DBC-DE-001: MapID references valid Map
         if map_ids and map_id in map_ids:
-            results.append(ValidationResult(
-                check_id='DBC-DE-001',
-                severity=ValidationSeverity.ERROR,
-                passed=True,
-                message="DungeonEncounter {} MapID {} valid".format(
-                    enc_id, map_id),
+            results.append(ValidationResult.lazy(
+                'DBC-DE-001', ValidationSeverity.ERROR, True,
+                "DungeonEncounter {} MapID {} valid", enc_id, map_id,
             ))
         elif map_ids:
             results.append(ValidationResult(
@@ -1024,12 +1161,9 @@ def _validate_dungeonencounter_dbc(reader, map_ids):
         # DBC-DE-002: Bit values should be sequential starting from 0
         expected_bits = list(range(len(bits)))
         if bits == expected_bits:
-            results.append(ValidationResult(
-                check_id='DBC-DE-002',
-                severity=ValidationSeverity.WARNING,
-                passed=True,
-                message="DungeonEncounter bits sequential for map {}".format(
-                    map_id),
+            results.append(ValidationResult.lazy(
+                'DBC-DE-002', ValidationSeverity.WARNING, True,
+                "DungeonEncounter bits sequential for map {}", map_id,
             ))
         else:
             results.append(ValidationResult(
@@ -1044,12 +1178,10 @@ def _validate_dungeonencounter_dbc(reader, map_ids):
         # DBC-DE-003: OrderIndex values sequential
         expected_orders = list(range(len(orders)))
         if orders == expected_orders:
-            results.append(ValidationResult(
-                check_id='DBC-DE-003',
-                severity=ValidationSeverity.WARNING,
-                passed=True,
-                message=("DungeonEncounter order indices sequential "
-                         "for map {}".format(map_id)),
+            results.append(ValidationResult.lazy(
+                'DBC-DE-003', ValidationSeverity.WARNING, True,
+                "DungeonEncounter order indices sequential for map {}",
+                map_id,
             ))
         else:
             results.append(ValidationResult(
@@ -1088,9 +1220,10 @@ def _validate_cross_dbc_refs(dbc_readers):
     # DBC-REF-001: AreaTable.ContinentID -> Map.ID
     if area_reader and area_reader.valid and map_ids:
         bad_refs = []
-        for i in range(len(area_reader.records)):
-            aid = area_reader.get_field_u32(i, 0)
-            cid = area_reader.get_field_u32(i, 1)
+        get_u32 = area_reader.get_field_u32
+        for i in range(area_reader.num_records):
+            aid = get_u32(i, 0)
+            cid = get_u32(i, 1)
             if cid not in map_ids:
                 bad_refs.append((aid, cid))
 
@@ -1114,9 +1247,10 @@ def _validate_cross_dbc_refs(dbc_readers):
     # DBC-REF-002: WorldMapArea.MapID -> Map.ID
     if wma_reader and wma_reader.valid and map_ids:
         bad_refs = []
-        for i in range(len(wma_reader.records)):
-            wid = wma_reader.get_field_u32(i, 0)
-            mid = wma_reader.get_field_u32(i, 1)
+        get_u32 = wma_reader.get_field_u32
+        for i in range(wma_reader.num_records):
+            wid = get_u32(i, 0)
+            mid = get_u32(i, 1)
             if mid not in map_ids:
                 bad_refs.append((wid, mid))
 
@@ -1140,9 +1274,10 @@ def _validate_cross_dbc_refs(dbc_readers):
     # DBC-REF-003: WorldMapArea.AreaID -> AreaTable.ID
     if wma_reader and wma_reader.valid and area_ids:
         bad_refs = []
-        for i in range(len(wma_reader.records)):
-            wid = wma_reader.get_field_u32(i, 0)
-            aid = wma_reader.get_field_u32(i, 2)
+        get_u32 = wma_reader.get_field_u32
+        for i in range(wma_reader.num_records):
+            wid = get_u32(i, 0)
+            aid = get_u32(i, 2)
             if aid != 0 and aid not in area_ids:
                 bad_refs.append((wid, aid))
 
@@ -1166,9 +1301,10 @@ def _validate_cross_dbc_refs(dbc_readers):
     # DBC-REF-004: WorldMapOverlay.MapAreaID -> WorldMapArea.ID
     if wmo_reader and wmo_reader.valid and wma_ids:
         bad_refs = []
-        for i in range(len(wmo_reader.records)):
-            oid = wmo_reader.get_field_u32(i, 0)
-            maid = wmo_reader.get_field_u32(i, 1)
+        get_u32 = wmo_reader.get_field_u32
+        for i in range(wmo_reader.num_records):
+            oid = get_u32(i, 0)
+            maid = get_u32(i, 1)
             if maid not in wma_ids:
                 bad_refs.append((oid, maid))
 
@@ -1193,10 +1329,11 @@ def _validate_cross_dbc_refs(dbc_readers):
     # DBC-REF-005: WorldMapOverlay.AreaID[n] -> AreaTable.ID
     if wmo_reader and wmo_reader.valid and area_ids:
         bad_refs = []
-        for i in range(len(wmo_reader.records)):
-            oid = wmo_reader.get_field_u32(i, 0)
+        get_u32 = wmo_reader.get_field_u32
+        for i in range(wmo_reader.num_records):
+            oid = get_u32(i, 0)
             for fi in range(2, 6):
-                aid = wmo_reader.get_field_u32(i, fi)
+                aid = get_u32(i, fi)
                 if aid != 0 and aid not in area_ids:
                     bad_refs.append((oid, fi - 2, aid))
 
@@ -1220,9 +1357,10 @@ def _validate_cross_dbc_refs(dbc_readers):
     # DBC-REF-006: Map.LoadingScreenID -> LoadingScreens.ID
     if map_reader and map_reader.valid and ls_ids:
         bad_refs = []
-        for i in range(len(map_reader.records)):
-            mid = map_reader.get_field_u32(i, 0)
-            lsid = map_reader.get_field_u32(i, 57)
+        get_u32 = map_reader.get_field_u32
+        for i in range(map_reader.num_records):
+            mid = get_u32(i, 0)
+            lsid = get_u32(i, 57)
             if lsid != 0 and lsid not in ls_ids:
                 bad_refs.append((mid, lsid))
 
@@ -1246,9 +1384,10 @@ def _validate_cross_dbc_refs(dbc_readers):
     # DBC-REF-007: LFGDungeons.MapID -> Map.ID
     if lfg_reader and lfg_reader.valid and map_ids:
         bad_refs = []
-        for i in range(len(lfg_reader.records)):
-            lid = lfg_reader.get_field_u32(i, 0)
-            mid = lfg_reader.get_field_u32(i, 23)
+        get_u32 = lfg_reader.get_field_u32
+        for i in range(lfg_reader.num_records):
+            lid = get_u32(i, 0)
+            mid = get_u32(i, 23)
             if mid not in map_ids:
                 bad_refs.append((lid, mid))
 
@@ -1272,9 +1411,10 @@ def _validate_cross_dbc_refs(dbc_readers):
     # DBC-REF-008: DungeonEncounter.MapID -> Map.ID
     if de_reader and de_reader.valid and map_ids:
         bad_refs = []
-        for i in range(len(de_reader.records)):
-            did = de_reader.get_field_u32(i, 0)
-            mid = de_reader.get_field_u32(i, 1)
+        get_u32 = de_reader.get_field_u32
+        for i in range(de_reader.num_records):
+            did = get_u32(i, 0)
+            mid = get_u32(i, 1)
             if mid not in map_ids:
                 bad_refs.append((did, mid))
 
@@ -1323,10 +1463,20 @@ def validate_dbc_files(client_dir, dbc_dir):
         ))
         return results
 
-    # Phase 1: Binary format validation for each DBC
+    # Phase 1: Binary format validation for each DBC.  Files are
+    # independent, so they are checked in a thread pool; results keep
+    # name order.  The later phases need every reader and run serially.
+    names, paths = zip(*sorted(dbc_paths.items()))
+    if len(names) < _PARALLEL_MIN_FILES:
+        per_file = [_validate_binary_format(name, path)
+                    for name, path in zip(names, paths)]
+    else:
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            per_file = list(executor.map(
+                _validate_binary_format, names, paths))
+
     dbc_readers = {}
-    for dbc_name, dbc_path in sorted(dbc_paths.items()):
-        fmt_results, reader = _validate_binary_format(dbc_name, dbc_path)
+    for dbc_name, (fmt_results, reader) in zip(names, per_file):
         results.extend(fmt_results)
         dbc_readers[dbc_name] = reader
 
@@ -1385,4 +1535,7 @@ def validate_dbc_files(client_dir, dbc_dir):
     # Phase 3: Cross-DBC referential integrity
     results.extend(_validate_cross_dbc_refs(dbc_readers))
 
+    for reader in dbc_readers.values():
+        reader.close()
+
     return results